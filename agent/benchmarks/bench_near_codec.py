@@ -0,0 +1,102 @@
+"""
+Microbenchmark of `near_codec` against the parsers it replaced.
+
+Run from the agent directory:
+    python benchmarks/bench_near_codec.py
+"""
+import ast
+import base64
+import json
+import os
+import sys
+import timeit
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import near_codec  # noqa: E402
+
+NUMBER = 2_000
+
+
+# ---------------------------
+# Previous implementations
+# ---------------------------
+def legacy_signed_payload(response):
+    raw = bytes(response.result).decode("utf-8")
+    if raw == "null":
+        return None
+    return bytes(ast.literal_eval(raw))
+
+
+def legacy_success_value(success_value_b64):
+    raw = base64.b64decode(success_value_b64)
+    return bytes(ast.literal_eval(raw.decode("utf-8")))
+
+
+def legacy_activity_log(response):
+    parsed = json.loads(bytes(response.result).decode("utf-8"))
+    return {
+        "activity_type": parsed["activity_type"],
+        "source_chain": int(parsed["source_chain"]),
+        "destination_chain": int(parsed["destination_chain"]),
+        "timestamp": int(parsed["timestamp"]),
+        "nonce": int(parsed["nonce"]),
+        "usdc_agent_balance_before_in_source_chain": int(parsed["usdc_agent_balance_before_in_source_chain"]),
+        "usdc_agent_balance_before_in_dest_chain": int(parsed["usdc_agent_balance_before_in_dest_chain"]),
+        "a_usdc_agent_balance_before_in_source_chain": int(parsed["a_usdc_agent_balance_before_in_source_chain"]),
+        "a_usdc_agent_balance_before_in_dest_chain": int(parsed["a_usdc_agent_balance_before_in_dest_chain"]),
+        "amount": int(parsed["amount"]),
+        "transactions": [bytes(tx) for tx in parsed.get("transactions", [])],
+    }
+
+
+# ---------------------------
+# Fixtures
+# ---------------------------
+def view_response(value) -> SimpleNamespace:
+    # near-sdk serializes Vec<u8> as a list of numbers without spaces
+    return SimpleNamespace(result=list(json.dumps(value, separators=(",", ":")).encode()))
+
+
+def fixtures() -> dict:
+    signed_tx = list(os.urandom(180))  # typical signed EIP-1559 tx
+    mint_calldata = list(os.urandom(1_100))  # receiveMessage(message, attestation)
+    activity_log = {
+        "activity_type": "rebalance",
+        "source_chain": 84532,
+        "destination_chain": 421614,
+        "timestamp": 1_750_000_000_000_000_000,
+        "nonce": 42,
+        "amount": 1_000_000_000,
+        "usdc_agent_balance_before_in_source_chain": 0,
+        "usdc_agent_balance_before_in_dest_chain": 0,
+        "a_usdc_agent_balance_before_in_source_chain": 5_000_000_000,
+        "a_usdc_agent_balance_before_in_dest_chain": 0,
+        "transactions": [list(os.urandom(180)) for _ in range(8)],
+    }
+    return {
+        "signed_tx": view_response(signed_tx),
+        "mint_calldata": view_response(mint_calldata),
+        "success_value": base64.b64encode(json.dumps(signed_tx, separators=(",", ":")).encode()).decode(),
+        "activity_log": view_response(activity_log),
+    }
+
+
+def bench(label: str, legacy, current) -> None:
+    assert legacy() == current(), f"{label}: results differ"
+    legacy_us = timeit.timeit(legacy, number=NUMBER) / NUMBER * 1e6
+    current_us = timeit.timeit(current, number=NUMBER) / NUMBER * 1e6
+    print(f"{label:<28} legacy {legacy_us:9.1f} µs   codec {current_us:9.1f} µs   x{legacy_us / current_us:5.1f}")
+
+
+def main() -> None:
+    f = fixtures()
+    bench("signed payload (180 B)", lambda: legacy_signed_payload(f["signed_tx"]), lambda: near_codec.decode_result(f["signed_tx"], near_codec.SIGNED_PAYLOAD))
+    bench("calldata (1.1 KB)", lambda: legacy_signed_payload(f["mint_calldata"]), lambda: near_codec.decode_result(f["mint_calldata"], near_codec.ByteVec))
+    bench("SuccessValue (base64)", lambda: legacy_success_value(f["success_value"]), lambda: near_codec.decode_success_value(f["success_value"]))
+    bench("activity log (8 txs)", lambda: legacy_activity_log(f["activity_log"]), lambda: near_codec.decode_result(f["activity_log"], near_codec.ACTIVITY_LOG))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Monte Carlo scenario engine: time to sample the market paths and score the candidate
+allocations, for growing scenario grids, in one process and across the process pool.
+
+Run from the agent directory:
+    python benchmarks/bench_scenario_engine.py
+"""
+import os
+import statistics
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, os.path.dirname(__file__))
+
+import helpers  # noqa: E402,F401  (helpers before the modules that import adapters)
+import optimizer.scenario_engine as scenario_engine  # noqa: E402
+from optimizer import optimize_chain_allocation_with_direction  # noqa: E402
+from bench_optimizer_solver import make_market  # noqa: E402
+
+# (chains, scenarios)
+GRIDS = [(5, 1_000), (5, 10_000), (20, 10_000), (20, 50_000)]
+RUNS = 5
+
+
+def measure(engine: scenario_engine.ScenarioEngine, data: dict, allocations: dict) -> float:
+    samples = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        engine.select(data, allocations)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000
+
+
+def main() -> None:
+    rng = np.random.default_rng(7)
+    workers = os.cpu_count() or 1
+    print(f"{'chains':>6} {'scenarios':>9} | {'1 process ms':>12} | {f'{workers} workers ms':>14}")
+    for n, n_scenarios in GRIDS:
+        data = make_market(n, rng)
+        allocations = optimize_chain_allocation_with_direction(data)["allocations"]
+
+        scenario_engine.PARALLEL_MIN_ELEMENTS = float("inf")
+        single = measure(scenario_engine.ScenarioEngine(n_scenarios=n_scenarios, seed=0), data, allocations)
+
+        scenario_engine.PARALLEL_MIN_ELEMENTS = 0
+        engine = scenario_engine.ScenarioEngine(n_scenarios=n_scenarios, max_workers=workers, seed=0)
+        engine.select(data, allocations)  # spawn the workers outside the measurement
+        pooled = measure(engine, data, allocations) if workers > 1 else float("nan")
+
+        print(f"{n:>6} {n_scenarios:>9} | {single:12.1f} | {pooled:14.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Startup cost of the agent: import time of `main` and of the numeric stack, and the time
+from process start to the first NEAR RPC response.
+
+Every measurement runs in a fresh interpreter so nothing is cached between them.
+
+Run from the agent directory:
+    python benchmarks/bench_startup.py          # imports only
+    python benchmarks/bench_startup.py --rpc    # also time-to-first-RPC (needs the .env of the agent and network)
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+
+RUNS = 5
+
+# prints "<seconds> <numeric stack loaded>" for `import main`
+IMPORT_MAIN = """
+import sys, time
+start = time.perf_counter()
+import main
+elapsed = time.perf_counter() - start
+print(elapsed, "scipy" in sys.modules or "numpy" in sys.modules)
+"""
+
+# prints the seconds to load the solver (numpy + scipy) once `main` is imported
+IMPORT_SOLVER = """
+import time
+import main, optimizer
+start = time.perf_counter()
+optimizer.optimize_chain_allocation_with_direction
+print(time.perf_counter() - start)
+"""
+
+# prints the seconds from interpreter start to the first NEAR view response on the resume path
+FIRST_RPC = """
+import time
+start = time.perf_counter()
+import asyncio
+import main  # noqa: F401  (everything the agent loads before its first call)
+from config import Config
+from near_omni_client.providers.near import NearFactoryProvider
+from adapters.rebalancer_contract.parsers import parse_active_session_info
+
+async def first_rpc():
+    config = Config.from_env()
+    near_client = NearFactoryProvider().get_provider(config.near_network)
+    response = await near_client.call_contract(contract_id=config.contract_id, method="get_active_session_info", args={})
+    parse_active_session_info(response)
+
+asyncio.run(first_rpc())
+print(time.perf_counter() - start)
+"""
+
+
+def run(code: str) -> list[str]:
+    result = subprocess.run([sys.executable, "-c", code], cwd=SRC, capture_output=True, text=True, check=True)
+    return result.stdout.strip().splitlines()[-1].split()
+
+
+def measure(label: str, code: str) -> None:
+    samples = [float(run(code)[0]) for _ in range(RUNS)]
+    print(f"{label:<34} median {statistics.median(samples) * 1000:8.1f} ms   min {min(samples) * 1000:8.1f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rpc", action="store_true", help="also measure time-to-first-RPC against the configured NEAR network")
+    args = parser.parse_args()
+
+    numeric_loaded = run(IMPORT_MAIN)[1] == "True"
+    print(f"numeric stack loaded by `import main`: {'yes' if numeric_loaded else 'no'}")
+
+    measure("import main", IMPORT_MAIN)
+    measure("solver (numpy + scipy) on demand", IMPORT_SOLVER)
+    if args.rpc:
+        measure("time to first NEAR RPC", FIRST_RPC)
+
+
+if __name__ == "__main__":
+    main()
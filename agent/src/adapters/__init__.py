@@ -2,10 +2,12 @@ from .rebalancer_contract import RebalancerContract
 from .vault_contract import Vault
 from .lending_pool_contract import LendingPool
 from .usdc_contract import USDC
+from .multicall_contract import Multicall
 
 __all__ = [
     "RebalancerContract",
     "Vault",
     "LendingPool",
-    "USDC"
-]
\ No newline at end of file
+    "USDC",
+    "Multicall"
+]
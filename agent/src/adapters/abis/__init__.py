@@ -1,9 +1,18 @@
 from .lending_pool_abi import LENDING_POOL_ABI
 from .vault_abi import VAULT_ABI
 from .usdc_abi import USDC_ABI
+from .multicall3_abi import MULTICALL3_ABI
+from .cctp_messenger_abi import CCTP_MESSENGER_ABI
+from .cctp_transmitter_abi import CCTP_TRANSMITTER_ABI
+from .interest_rate_strategy_abi import INTEREST_RATE_STRATEGY_ABI, INTEREST_RATE_STRATEGY_V1_ABI
 
 __all__ = [
     "LENDING_POOL_ABI",
     "VAULT_ABI",
-    "USDC_ABI"
-]
\ No newline at end of file
+    "USDC_ABI",
+    "MULTICALL3_ABI",
+    "CCTP_MESSENGER_ABI",
+    "CCTP_TRANSMITTER_ABI",
+    "INTEREST_RATE_STRATEGY_ABI",
+    "INTEREST_RATE_STRATEGY_V1_ABI",
+]
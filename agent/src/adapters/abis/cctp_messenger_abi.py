@@ -0,0 +1,18 @@
+# CCTP v2 TokenMessenger, only the functions the agent encodes
+CCTP_MESSENGER_ABI = [
+  {
+    "inputs": [
+      { "internalType": "uint256", "name": "amount", "type": "uint256" },
+      { "internalType": "uint32", "name": "destinationDomain", "type": "uint32" },
+      { "internalType": "bytes32", "name": "mintRecipient", "type": "bytes32" },
+      { "internalType": "address", "name": "burnToken", "type": "address" },
+      { "internalType": "bytes32", "name": "destinationCaller", "type": "bytes32" },
+      { "internalType": "uint256", "name": "maxFee", "type": "uint256" },
+      { "internalType": "uint32", "name": "minFinalityThreshold", "type": "uint32" }
+    ],
+    "name": "depositForBurn",
+    "outputs": [],
+    "stateMutability": "nonpayable",
+    "type": "function"
+  }
+]
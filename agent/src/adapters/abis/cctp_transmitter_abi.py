@@ -0,0 +1,15 @@
+# CCTP v2 MessageTransmitter, only the functions the agent encodes
+CCTP_TRANSMITTER_ABI = [
+  {
+    "inputs": [
+      { "internalType": "bytes", "name": "message", "type": "bytes" },
+      { "internalType": "bytes", "name": "attestation", "type": "bytes" }
+    ],
+    "name": "receiveMessage",
+    "outputs": [
+      { "internalType": "bool", "name": "success", "type": "bool" }
+    ],
+    "stateMutability": "nonpayable",
+    "type": "function"
+  }
+]
@@ -0,0 +1,87 @@
+# DefaultReserveInterestRateStrategyV2 (Aave v3.1+): one contract for every reserve, parameters in ray
+INTEREST_RATE_STRATEGY_ABI = [
+  {
+    "inputs": [
+      { "internalType": "address", "name": "reserve", "type": "address" }
+    ],
+    "name": "getOptimalUsageRatio",
+    "outputs": [
+      { "internalType": "uint256", "name": "", "type": "uint256" }
+    ],
+    "stateMutability": "view",
+    "type": "function"
+  },
+  {
+    "inputs": [
+      { "internalType": "address", "name": "reserve", "type": "address" }
+    ],
+    "name": "getBaseVariableBorrowRate",
+    "outputs": [
+      { "internalType": "uint256", "name": "", "type": "uint256" }
+    ],
+    "stateMutability": "view",
+    "type": "function"
+  },
+  {
+    "inputs": [
+      { "internalType": "address", "name": "reserve", "type": "address" }
+    ],
+    "name": "getVariableRateSlope1",
+    "outputs": [
+      { "internalType": "uint256", "name": "", "type": "uint256" }
+    ],
+    "stateMutability": "view",
+    "type": "function"
+  },
+  {
+    "inputs": [
+      { "internalType": "address", "name": "reserve", "type": "address" }
+    ],
+    "name": "getVariableRateSlope2",
+    "outputs": [
+      { "internalType": "uint256", "name": "", "type": "uint256" }
+    ],
+    "stateMutability": "view",
+    "type": "function"
+  }
+]
+
+# DefaultReserveInterestRateStrategy (Aave v3.0, still used on some testnets): one contract per reserve, no arguments
+INTEREST_RATE_STRATEGY_V1_ABI = [
+  {
+    "inputs": [],
+    "name": "OPTIMAL_USAGE_RATIO",
+    "outputs": [
+      { "internalType": "uint256", "name": "", "type": "uint256" }
+    ],
+    "stateMutability": "view",
+    "type": "function"
+  },
+  {
+    "inputs": [],
+    "name": "getBaseVariableBorrowRate",
+    "outputs": [
+      { "internalType": "uint256", "name": "", "type": "uint256" }
+    ],
+    "stateMutability": "view",
+    "type": "function"
+  },
+  {
+    "inputs": [],
+    "name": "getVariableRateSlope1",
+    "outputs": [
+      { "internalType": "uint256", "name": "", "type": "uint256" }
+    ],
+    "stateMutability": "view",
+    "type": "function"
+  },
+  {
+    "inputs": [],
+    "name": "getVariableRateSlope2",
+    "outputs": [
+      { "internalType": "uint256", "name": "", "type": "uint256" }
+    ],
+    "stateMutability": "view",
+    "type": "function"
+  }
+]
@@ -25,6 +25,48 @@ VAULT_ABI =[
     ],
     "stateMutability": "nonpayable"
   },
+  {
+    "type": "function",
+    "name": "withdrawForCrossChainAllocation",
+    "inputs": [
+      {
+        "name": "_amountToWithdraw",
+        "type": "uint256",
+        "internalType": "uint256"
+      },
+      {
+        "name": "_crossChainATokenBalance",
+        "type": "uint256",
+        "internalType": "uint256"
+      }
+    ],
+    "outputs": [
+      {
+        "name": "",
+        "type": "uint256",
+        "internalType": "uint256"
+      }
+    ],
+    "stateMutability": "nonpayable"
+  },
+  {
+    "type": "function",
+    "name": "returnFunds",
+    "inputs": [
+      {
+        "name": "amountReturned",
+        "type": "uint256",
+        "internalType": "uint256"
+      },
+      {
+        "name": "newCrossChainATokenBalance",
+        "type": "uint256",
+        "internalType": "uint256"
+      }
+    ],
+    "outputs": [],
+    "stateMutability": "nonpayable"
+  },
   {
     "type": "function",
     "name": "AI_AGENT",
@@ -0,0 +1,90 @@
+from typing import Any, Sequence
+
+from eth_abi import encode
+from eth_utils.abi import function_abi_to_4byte_selector, get_abi_input_types
+from hexbytes import HexBytes
+from web3 import Web3
+
+from .abis import CCTP_MESSENGER_ABI, CCTP_TRANSMITTER_ABI, LENDING_POOL_ABI, USDC_ABI, VAULT_ABI
+
+U256_MAX = 2**256 - 1
+
+
+def _find_function(abi: Sequence[dict], name: str) -> dict:
+    for entry in abi:
+        if entry.get("type") == "function" and entry.get("name") == name:
+            return entry
+    raise ValueError(f"Function '{name}' not found in ABI.")
+
+
+class _Function:
+    """Selector and argument types of one ABI function, resolved once."""
+
+    def __init__(self, abi: Sequence[dict], name: str):
+        function_abi = _find_function(abi, name)
+        self.selector = function_abi_to_4byte_selector(function_abi)
+        self.input_types = get_abi_input_types(function_abi)
+
+    def encode(self, *args: Any) -> bytes:
+        return self.selector + encode(self.input_types, args)
+
+
+_APPROVE = _Function(USDC_ABI, "approve")
+_DEPOSIT_FOR_BURN = _Function(CCTP_MESSENGER_ABI, "depositForBurn")
+_RECEIVE_MESSAGE = _Function(CCTP_TRANSMITTER_ABI, "receiveMessage")
+_AAVE_SUPPLY = _Function(LENDING_POOL_ABI, "supply")
+_AAVE_WITHDRAW = _Function(LENDING_POOL_ABI, "withdraw")
+_WITHDRAW_FOR_CROSS_CHAIN_ALLOCATION = _Function(VAULT_ABI, "withdrawForCrossChainAllocation")
+_RETURN_FUNDS = _Function(VAULT_ABI, "returnFunds")
+
+
+class Calldata:
+    """
+    Local ABI encoding of the calldata of every step, mirroring the `build_*` views of the
+    NEAR contract (`contract/src/encoders`), so the agent does not need a NEAR round trip to
+    know what it is about to sign.
+    """
+
+    @staticmethod
+    def approve(spender: str, amount: int) -> bytes:
+        return _APPROVE.encode(Web3.to_checksum_address(spender), amount)
+
+    @staticmethod
+    def deposit_for_burn(
+        amount: int,
+        destination_domain: int,
+        mint_recipient: str | bytes,
+        burn_token: str,
+        destination_caller: str | bytes,
+        max_fee: int,
+        min_finality_threshold: int,
+    ) -> bytes:
+        return _DEPOSIT_FOR_BURN.encode(
+            amount,
+            destination_domain,
+            HexBytes(mint_recipient),
+            Web3.to_checksum_address(burn_token),
+            HexBytes(destination_caller),
+            max_fee,
+            min_finality_threshold,
+        )
+
+    @staticmethod
+    def receive_message(message: str | bytes, attestation: str | bytes) -> bytes:
+        return _RECEIVE_MESSAGE.encode(HexBytes(message), HexBytes(attestation))
+
+    @staticmethod
+    def aave_supply(asset: str, amount: int, on_behalf_of: str, referral_code: int) -> bytes:
+        return _AAVE_SUPPLY.encode(Web3.to_checksum_address(asset), amount, Web3.to_checksum_address(on_behalf_of), referral_code)
+
+    @staticmethod
+    def aave_withdraw(asset: str, amount: int, to: str) -> bytes:
+        return _AAVE_WITHDRAW.encode(Web3.to_checksum_address(asset), amount, Web3.to_checksum_address(to))
+
+    @staticmethod
+    def withdraw_for_cross_chain_allocation(amount: int, cross_chain_a_token_balance: int | None) -> bytes:
+        return _WITHDRAW_FOR_CROSS_CHAIN_ALLOCATION.encode(amount, cross_chain_a_token_balance or 0)
+
+    @staticmethod
+    def return_funds(amount: int, cross_chain_a_token_balance: int | None) -> bytes:
+        return _RETURN_FUNDS.encode(amount, cross_chain_a_token_balance or 0)
@@ -0,0 +1,59 @@
+from typing import Any, List, Optional
+
+from eth_abi import decode
+from eth_utils.abi import get_abi_output_types
+from web3 import AsyncWeb3, Web3
+from web3.contract.async_contract import AsyncContractFunction
+
+from .abis import MULTICALL3_ABI
+
+# Multicall3 is deployed at the same address on every chain we support.
+# https://github.com/mds1/multicall3#deployments
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+
+class Multicall:
+    @staticmethod
+    async def aggregate3(web3_instance: AsyncWeb3, calls: List[AsyncContractFunction], allow_failure: bool = False) -> List[Optional[Any]]:
+        """
+        Executes several view calls in a single `eth_call` through Multicall3 `aggregate3`.
+
+        Args:
+            web3_instance (AsyncWeb3): Initialized Web3 instance connected to the target network.
+            calls (List[AsyncContractFunction]): Contract functions already bound to their arguments,
+                e.g. `contract.functions.balanceOf(owner)`.
+            allow_failure (bool): When True a reverted sub-call yields `None` instead of
+                reverting the whole batch.
+
+        Returns:
+            List[Optional[Any]]: The decoded result of each call, in order. Functions with a
+            single output are unwrapped.
+        """
+        if not calls:
+            return []
+
+        multicall = web3_instance.eth.contract(address=Web3.to_checksum_address(MULTICALL3_ADDRESS), abi=MULTICALL3_ABI)
+
+        encoded_calls = [
+            (call.address, allow_failure, Web3.to_bytes(hexstr=_encode_call(call)))
+            for call in calls
+        ]
+
+        results = await multicall.functions.aggregate3(encoded_calls).call()
+
+        return [Multicall._decode(call, success, return_data) for call, (success, return_data) in zip(calls, results)]
+
+    @staticmethod
+    def _decode(call: AsyncContractFunction, success: bool, return_data: bytes) -> Optional[Any]:
+        if not success or not return_data:
+            return None
+
+        output_types = get_abi_output_types(call.abi)
+        decoded = decode(output_types, return_data)
+
+        return decoded[0] if len(decoded) == 1 else decoded
+
+
+def _encode_call(call: AsyncContractFunction) -> str:
+    # encoding is purely local, no provider round trip involved
+    return call.w3.eth.contract(abi=call.contract_abi).encode_abi(call.abi_element_identifier, args=call.args, kwargs=call.kwargs)
@@ -1,6 +1,5 @@
-import ast
-
-from helpers.evm_transaction import create_partial_tx
+from adapters.calldata import Calldata, U256_MAX
+from helpers.evm_transaction import assemble_partial_tx
 
 from utils import  extract_signed_rlp_without_prefix, from_chain_id_to_network
 from ..common import _RebalancerBase, TGAS
@@ -8,12 +7,11 @@ from ..common import _RebalancerBase, TGAS
 class ApproveVault(_RebalancerBase):
     async def build_and_sign_approve_vault_to_manage_agents_usdc_tx(self, to_chain_id: int, spender: str, to: str):
         chain_as_network = from_chain_id_to_network(to_chain_id)
-        input_payload = await self.build_approve_vault_to_manage_agents_usdc_tx(spender=spender)
-        gas_limit = self.gas_estimator.estimate_gas_limit(chain_as_network, self.agent_address, to, input_payload)
-        print(f"Estimated gas limit: {gas_limit}")
+        partial_tx = await assemble_partial_tx(chain_as_network, self.agent_address, self.evm_provider, self.gas_estimator, to, self.build_approve_vault_to_manage_agents_usdc_tx(spender=spender), urgency="low")
+        print(f"Estimated gas limit: {partial_tx.gas_limit}")
         
         args = {
-            "partial_transaction": create_partial_tx(chain_as_network, self.agent_address, self.evm_provider, self.gas_estimator, gas_limit).to_dict(),
+            "partial_transaction": partial_tx.to_dict(),
             "callback_gas_tgas": self.config.callback_gas_tgas
         }
         
@@ -41,15 +39,7 @@ class ApproveVault(_RebalancerBase):
             "spender": spender,
         }
         
-        response = await self.near_client.call_contract(
-            contract_id=self.near_contract_id,
-            method="build_approve_vault_to_manage_agents_usdc",
-            args=args
-        )
-        raw = response.result
-        as_str = bytes(raw).decode("utf-8")
-        int_list = ast.literal_eval(as_str)
-        payload_bytes = bytes(int_list)
-        return payload_bytes
+        payload_bytes = Calldata.approve(spender, U256_MAX)
+        return await self._verify_calldata(method="build_approve_vault_to_manage_agents_usdc", args=args, local_payload=payload_bytes)
     
  
\ No newline at end of file
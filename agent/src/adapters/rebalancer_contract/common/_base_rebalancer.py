@@ -5,6 +5,7 @@ from near_omni_client.wallets.near_wallet import NearWallet
 from near_omni_client.providers.interfaces import IProviderFactory
 from config import Config
 from helpers import GasEstimator
+from helpers.evm_transaction import EVMTransaction
 
 # @dev Note: This is a base class for rebalancer actions only used for static typing purposes.
 class _RebalancerBase:
@@ -16,5 +17,11 @@ class _RebalancerBase:
     evm_provider: IProviderFactory
     config: Config
 
-    async def _sign_and_submit_transaction(self, *, method: str, args: Dict[str, Any], gas: int, deposit: int, max_retries: int = 3, delay: float = 2.0):
-        ...
\ No newline at end of file
+    async def _sign_and_submit_transaction(self, *, method: str, args: Dict[str, Any], gas: int, deposit: int):
+        ...
+
+    async def _sign_partial_transaction(self, *, method: str, args: Dict[str, Any], partial_tx: EVMTransaction) -> bytes:
+        ...
+
+    async def _verify_calldata(self, *, method: str, args: Dict[str, Any], local_payload: bytes) -> bytes:
+        ...
@@ -1,6 +1,6 @@
-import json
 from typing import Any, Dict, Optional
-from engine_types import Flow, TxType
+
+import near_codec
 
 def parse_active_session_info(response: Any) -> Optional[Dict]:
     """
@@ -13,29 +13,17 @@ def parse_active_session_info(response: Any) -> Optional[Dict]:
       null
       [nonce, flow, previous_step, pending_step]
     """
-    if not hasattr(response, "result"):
-        raise ValueError("Invalid response: missing .result")
-
-    try:
-        raw = bytes(response.result).decode("utf-8")
-        print("Raw active session info:", raw)
-        parsed = json.loads(raw)
-    except Exception as e:
-        raise ValueError(f"Failed to decode active session info: {e}")
+    parsed = near_codec.decode_result(response, near_codec.ACTIVE_SESSION_INFO, "active session info")
+    print("Parsed active session info:", parsed)
 
     if parsed is None:
         return None
 
-    if not isinstance(parsed, list) or len(parsed) != 4:
-        raise ValueError("Invalid active session info format")
+    nonce, flow, previous_step, pending_step = parsed
 
-    nonce, flow_raw, previous_raw, pending_raw = parsed
-
-    print("Parsed active session info:", parsed)
-    
     return {
-        "nonce": int(nonce),
-        "flow": Flow(flow_raw),
-        "previous_step": TxType(previous_raw) if previous_raw is not None else None,
-        "pending_step": TxType(pending_raw) if pending_raw is not None else None,
-    }
\ No newline at end of file
+        "nonce": nonce,
+        "flow": flow,
+        "previous_step": previous_step,
+        "pending_step": pending_step,
+    }
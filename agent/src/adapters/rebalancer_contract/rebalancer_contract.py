@@ -1,6 +1,3 @@
-import asyncio
-import base64
-
 from typing import Any, Dict
 
 from near_omni_client.json_rpc.client import NearClient
@@ -10,14 +7,18 @@ from near_omni_client.transactions.utils import decode_key
 from near_omni_client.json_rpc.exceptions import JsonRpcError
 from near_omni_client.providers.interfaces import IProviderFactory
 
+import near_codec
 from config import Config
-from helpers import GasEstimator
-from utils import address_to_bytes32
+from helpers import GasEstimator, NearAccessKeyTracker, NearTxSubmitter, NonceManager
+from helpers.evm_transaction import EVMTransaction
+from helpers.near_tx_submitter import is_stale_access_key_error
+from utils import address_to_bytes32, extract_signed_rlp
 
 from .views import RebalancerContractViews
 from .allowances import RebalancerApprovals
 from .state_machine_actions import RebalancerStepMachineActions
 from .agent import RegisterWorker
+from .common import TGAS
 
 class RebalancerContract(RebalancerContractViews, RebalancerApprovals,RebalancerStepMachineActions, RegisterWorker):
    def __init__(self, near_client: NearClient, near_wallet: NearWallet, near_contract_id: str, agent_address: str, gas_estimator: GasEstimator, evm_provider: IProviderFactory, config: Config) -> None:
@@ -30,64 +31,86 @@ class RebalancerContract(RebalancerContractViews, RebalancerApprovals,Rebalancer
         self.config = config
         self.agent_address_as_bytes32 = address_to_bytes32(self.agent_address)
    
-   async def _sign_and_submit_transaction(self, *, method: str, args: Dict[str, Any], gas: int, deposit: int, max_retries: int = 3, delay: float = 2.0):
+   async def _verify_calldata(self, *, method: str, args: Dict[str, Any], local_payload: bytes) -> bytes:
+      """
+      Returns the locally encoded calldata of a step. When `verify_local_calldata` is enabled it
+      is compared byte-for-byte against the contract `build_*` view, and the contract's payload
+      wins on a mismatch.
+      """
+      if not self.config.verify_local_calldata:
+         return local_payload
+
+      response = await self.near_client.call_contract(
+         contract_id=self.near_contract_id,
+         method=method,
+         args=args
+      )
+      contract_payload = near_codec.decode_result(response, near_codec.ByteVec, method)
+
+      if contract_payload != local_payload:
+         print(f"⚠️ Local calldata for {method} differs from the contract view:\n  local:    0x{local_payload.hex()}\n  contract: 0x{contract_payload.hex()}")
+         return contract_payload
+
+      print(f"✅ Local calldata for {method} matches the contract view.")
+      return local_payload
+
+   async def _sign_partial_transaction(self, *, method: str, args: Dict[str, Any], partial_tx: EVMTransaction) -> bytes:
+      """
+      Has the contract sign `partial_tx` through the `build_and_sign_*` `method` and returns the
+      signed RLP. If that fails the EVM transaction is never broadcast, so its reserved nonce is
+      released and the retry of the step signs with the same nonce instead of leaving a gap.
+      """
+      try:
+         result = await self._sign_and_submit_transaction(method=method, args=args, gas=self.config.tx_tgas * TGAS, deposit=0)
+
+         success_value_b64 = result.status.get("SuccessValue")
+         if not success_value_b64:
+            raise Exception(f"{method} didn't return SuccessValue")
+
+         return extract_signed_rlp(success_value_b64)
+      except BaseException:
+         NonceManager.release(partial_tx.chain_id, partial_tx.nonce)
+         raise
+
+   async def _sign_and_submit_transaction(self, *, method: str, args: Dict[str, Any], gas: int, deposit: int):
       public_key_str = await self.near_wallet.get_public_key()
       signer_account_id = self.near_wallet.get_address()
-      private_key_str = self.near_wallet.keypair.to_string()
-      nonce_and_block_hash = await self.near_client.get_nonce_and_block_hash(signer_account_id, public_key_str)
-      
-      tx = (
-            TransactionBuilder()
-            .with_signer_id(signer_account_id)
-            .with_public_key(public_key_str)
-            .with_nonce(nonce_and_block_hash["nonce"])
-            .with_receiver(self.near_contract_id)
-            .with_block_hash(nonce_and_block_hash["block_hash"])
-            .add_action(
-               ActionFactory.function_call(
-                  method_name=method,
-                  args=args,
-                  gas=gas,
-                  deposit=deposit,
+      private_key_bytes = decode_key(self.near_wallet.keypair.to_string())
+
+      for attempt in (1, 2):
+         # @dev nonce and block hash are tracked locally, no RPC before signing
+         nonce, block_hash = await NearAccessKeyTracker.next(self.near_client, signer_account_id, public_key_str)
+
+         tx = (
+               TransactionBuilder()
+               .with_signer_id(signer_account_id)
+               .with_public_key(public_key_str)
+               .with_nonce(nonce)
+               .with_receiver(self.near_contract_id)
+               .with_block_hash(block_hash)
+               .add_action(
+                  ActionFactory.function_call(
+                     method_name=method,
+                     args=args,
+                     gas=gas,
+                     deposit=deposit,
+                  )
                )
-            )
-            .build()
-      )
+               .build()
+         )
+
+         signed_tx = tx.to_vec(private_key_bytes)
+         signed_tx_bytes = bytes(bytearray(signed_tx))
 
-      private_key_bytes = decode_key(private_key_str)
-      signed_tx = tx.to_vec(private_key_bytes)
-      signed_tx_bytes = bytes(bytearray(signed_tx))
-      signed_tx_base64 = base64.b64encode(signed_tx_bytes).decode("utf-8")
-      
-      # --- Retry section starts here ---
-      for attempt in range(1, max_retries + 1):
-            try:
-               print(f"Sending transaction to NEAR network... (attempt {attempt})")
-               result = await self.near_client.send_raw_transaction(signed_tx_base64)
-               print("✅ Transaction successfully sent.")
-               print("🚨 Transaction Result:", result)
-               return result
-            except JsonRpcError as e:
-               print(f"❌ JsonRpcError on attempt {attempt}: {e}")
-               if "TIMEOUT_ERROR" in str(e):
-                  if attempt < max_retries:
-                        print(f"⚠️  Timeout error on attempt {attempt}. Retrying in {delay:.1f}s...")
-                        await asyncio.sleep(delay)
-                        delay *= 2  # exponential backoff
-                        continue
-                  else:
-                        print("❌ Transaction failed after maximum retries due to TIMEOUT_ERROR.")
+         try:
+            # @dev sent once and tracked by hash: a timeout never resubmits an already included tx
+            result = await NearTxSubmitter.submit(self.near_client, signed_tx_bytes, tx.get_hash(), signer_account_id)
+         except JsonRpcError as e:
+            if attempt == 2 or not is_stale_access_key_error(e):
                raise
-            except Exception as e:
-               print(f"❌ Exception on attempt {attempt}: {e}")
-               # Catch unexpected errors (network, aiohttp, etc.)
-               if attempt < max_retries:
-                  print(f"⚠️  Unexpected error on attempt {attempt}: {e}. Retrying in {delay:.1f}s...")
-                  await asyncio.sleep(delay)
-                  delay *= 2
-                  continue
-               else:
-                  print("❌ Transaction failed after maximum retries due to unexpected error.")
-                  raise
-      # --- Retry section ends here ---
-      
+            print(f"⚠️ {method} rejected with a stale nonce or block hash ({e}); resyncing the access key and signing again.")
+            NearAccessKeyTracker.invalidate(signer_account_id, public_key_str)
+            continue
+
+         print("🚨 Transaction Result:", result)
+         return result
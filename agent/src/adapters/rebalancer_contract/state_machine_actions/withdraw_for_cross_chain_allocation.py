@@ -1,10 +1,9 @@
-import ast
-
 from typing import Any
 
-from utils import from_chain_id_to_network, extract_signed_rlp
-from helpers.evm_transaction import create_partial_tx
-from ..common import _RebalancerBase, TGAS
+from utils import from_chain_id_to_network
+from adapters.calldata import Calldata
+from helpers.evm_transaction import assemble_partial_tx
+from ..common import _RebalancerBase
 
 
 class WithdrawForCrossChainAllocation(_RebalancerBase):
@@ -15,42 +14,20 @@ class WithdrawForCrossChainAllocation(_RebalancerBase):
             "cross_chain_a_token_balance": cross_chain_a_token_balance
         }
 
-        response = await self.near_client.call_contract(
-            contract_id=self.near_contract_id,
-            method="build_withdraw_for_crosschain_allocation_tx",
-            args=args
-        )
-        raw = response.result
-        as_str = bytes(raw).decode("utf-8")
-        int_list = ast.literal_eval(as_str)
-        payload_bytes = bytes(int_list)
-        return payload_bytes
+        payload_bytes = Calldata.withdraw_for_cross_chain_allocation(amount, cross_chain_a_token_balance)
+        return await self._verify_calldata(method="build_withdraw_for_crosschain_allocation_tx", args=args, local_payload=payload_bytes)
 
     async def build_and_sign_withdraw_for_crosschain_allocation_tx(self, source_chain: int, amount: int, to: str):
         source_chain_as_network = from_chain_id_to_network(source_chain)
-        input_payload = await self.build_withdraw_for_crosschain_allocation_tx(amount=amount)
-        gas_limit = self.gas_estimator.estimate_gas_limit(source_chain_as_network, self.agent_address, to, input_payload)
+        partial_tx = await assemble_partial_tx(source_chain_as_network, self.agent_address, self.evm_provider, self.gas_estimator, to, self.build_withdraw_for_crosschain_allocation_tx(amount=amount))
         
         args = {
             "rebalancer_args": {
                 "amount": amount,
-                "partial_transaction": create_partial_tx(source_chain_as_network, self.agent_address, self.evm_provider, self.gas_estimator, gas_limit).to_dict(),
+                "partial_transaction": partial_tx.to_dict(),
                 "cross_chain_a_token_balance": None
             },
             "callback_gas_tgas": self.config.callback_gas_tgas
         }
 
-        result = await self._sign_and_submit_transaction(
-            method="build_and_sign_withdraw_for_crosschain_allocation_tx",
-            args=args,
-            gas=self.config.tx_tgas * TGAS,
-            deposit=0
-        )
-
-        success_value_b64 = result.status.get("SuccessValue")
-        if not success_value_b64:
-            raise Exception("withdraw_for_crosschain_allocation didn't return SuccessValue")
-
-        signed_rlp = extract_signed_rlp(success_value_b64)
-                
-        return signed_rlp
\ No newline at end of file
+        return await self._sign_partial_transaction(method="build_and_sign_withdraw_for_crosschain_allocation_tx", args=args, partial_tx=partial_tx)
\ No newline at end of file
@@ -1,6 +1,6 @@
-import ast
+import near_codec
 from engine_types import TxType
-from utils import parse_activity_log, parse_chain_configs, parse_u32_result, parse_supported_chains, parse_worker_info, parse_bool
+from utils import parse_activity_log, parse_activity_logs, parse_chain_configs, parse_u32_result, parse_supported_chains, parse_worker_info, parse_bool
 from ..parsers import parse_active_session_info
 from ..common import _RebalancerBase
 
@@ -45,6 +45,14 @@ class RebalancerContractViews(_RebalancerBase):
         )
         return parse_activity_log(activity_log_raw)
     
+    async def get_latest_logs(self, count: int):
+        activity_logs_raw = await self.near_client.call_contract(
+            contract_id=self.near_contract_id,
+            method="get_latest_logs",
+            args={"count": count}
+        )
+        return parse_activity_logs(activity_logs_raw)
+    
     async def get_worker_info(self, account_id: str):
         worker_info_raw = await self.near_client.call_contract(
             contract_id=self.near_contract_id,
@@ -70,14 +78,10 @@ class RebalancerContractViews(_RebalancerBase):
         
         if not hasattr(response, "result") or response.result is None:
             return None
-        
-        raw = bytes(response.result).decode("utf-8")
 
-        if raw == "null":
+        payload = near_codec.decode_result(response, near_codec.SIGNED_PAYLOAD, "signed payload")
+        if payload is None:
             return None
-    
-        int_list = ast.literal_eval(raw)
-        payload = bytes(int_list)
 
         signed_rlp = payload[1:]
         
@@ -5,6 +5,19 @@ import json
 
 from near_omni_client.networks import Network
 
+# @dev the route cost model prices every EVM transaction in ETH, so every supported EVM network must pay gas in ETH
+ETH_GAS_NETWORKS = (
+    Network.ETHEREUM_MAINNET, Network.ETHEREUM_SEPOLIA,
+    Network.BASE_MAINNET, Network.BASE_SEPOLIA,
+    Network.OPTIMISM_MAINNET, Network.OPTIMISM_SEPOLIA,
+    Network.ARBITRUM_MAINNET, Network.ARBITRUM_SEPOLIA,
+)
+# native tokens the gas of a rebalance is paid in, all priced by NATIVE_TOKEN_PRICES_USD
+GAS_TOKENS = ("ETH", "NEAR")
+DEFAULT_NATIVE_TOKEN_PRICES_USD = '{"ETH": 3000, "NEAR": 3}'
+# @dev same as optimizer.optimizer.SOLVERS and RATE_MODELS, repeated here so validating the config does not load numpy
+OPTIMIZER_SOLVERS = ("kkt", "slsqp")
+OPTIMIZER_RATE_MODELS = ("linear", "aave")
 
 class Config:
     """
@@ -37,6 +50,26 @@ class Config:
         master_funder_drip_size: float = None,
         master_funder_signer_account_id: str = None,
         interval_seconds: int = 3600,
+        chain_read_timeout_seconds: float = 30,
+        evm_confirmations: dict[int, int] = None,
+        evm_receipt_timeout_seconds: float = 300,
+        attestation_timeout_seconds: float = 1800,
+        evm_read_cache_block_ttl_seconds: float = 2.0,
+        data_dir: str = ".rebalancer",
+        runtime_state_ttl_seconds: int = 21600,
+        fee_tiers: dict[str, dict] = None,
+        fee_oracle_poll_interval_seconds: float = 2.0,
+        verify_local_calldata: bool = False,
+        near_tx_wait_until: str = "EXECUTED",
+        near_tx_timeout_seconds: int = 180,
+        optimizer_solver: str = "kkt",
+        optimizer_rate_model: str = "linear",
+        optimizer_sensitivity: float = 0.001,
+        scenario_count: int = 0,
+        scenario_objective: str = "mean",
+        scenario_quantile: float = 0.05,
+        holding_horizon_days: float = 30,
+        native_token_prices_usd: dict[str, float] = None,
     ):
         self.contract_id = contract_id
         self.near_network = near_network
@@ -57,6 +90,26 @@ class Config:
         self.master_funder_drip_size = master_funder_drip_size
         self.master_funder_signer_account_id = master_funder_signer_account_id
         self.interval_seconds = interval_seconds
+        self.chain_read_timeout_seconds = chain_read_timeout_seconds
+        self.evm_confirmations = evm_confirmations or {}
+        self.evm_receipt_timeout_seconds = evm_receipt_timeout_seconds
+        self.attestation_timeout_seconds = attestation_timeout_seconds
+        self.evm_read_cache_block_ttl_seconds = evm_read_cache_block_ttl_seconds
+        self.data_dir = data_dir
+        self.runtime_state_ttl_seconds = runtime_state_ttl_seconds
+        self.fee_tiers = fee_tiers or {}
+        self.fee_oracle_poll_interval_seconds = fee_oracle_poll_interval_seconds
+        self.verify_local_calldata = verify_local_calldata
+        self.near_tx_wait_until = near_tx_wait_until
+        self.near_tx_timeout_seconds = near_tx_timeout_seconds
+        self.optimizer_solver = optimizer_solver
+        self.optimizer_rate_model = optimizer_rate_model
+        self.optimizer_sensitivity = optimizer_sensitivity
+        self.scenario_count = scenario_count
+        self.scenario_objective = scenario_objective
+        self.scenario_quantile = scenario_quantile
+        self.holding_horizon_days = holding_horizon_days
+        self.native_token_prices_usd = native_token_prices_usd or {}
         self._validate()
 
     @classmethod
@@ -69,7 +122,7 @@ class Config:
         near_network = Network.parse(near_network_raw)
         network_short_name = "testnet" if near_network == Network.NEAR_TESTNET else "mainnet"
         supported_near_networks = [Network.NEAR_TESTNET, Network.NEAR_MAINNET] # Default supported NEAR networks
-        supported_evm_networks = [Network.OPTIMISM_SEPOLIA, Network.ARBITRUM_SEPOLIA] # Default supported EVM networks
+        supported_evm_networks = [Network.OPTIMISM_SEPOLIA, Network.ARBITRUM_SEPOLIA] # Default supported EVM networks, all paying gas in ETH (see ETH_GAS_NETWORKS)
         alchemy_api_key = os.getenv("ALCHEMY_API_KEY", "your_alchemy_api_key_here")
         max_bridge_fee = int(os.getenv("MAX_BRIDGE_FEE", "990000"))  # 0.99 USDC (6 decimals)
         min_bridge_finality_threshold = int(os.getenv("MIN_BRIDGE_FINALITY_THRESHOLD", "1000"))
@@ -83,6 +136,23 @@ class Config:
         master_funder_signer_account_id = os.getenv("MASTER_FUNDER_ACCOUNT_ID")
         master_funder_drip_size = float(os.getenv("MASTER_FUNDER_DRIP_SIZE", "0.5"))  # amount of NEAR to top up the one-time signer with
         interval_seconds = int(os.getenv("RUN_INTERVAL_SECONDS", "3600"))  # Default to 1 hour
+        chain_read_timeout_seconds = float(os.getenv("CHAIN_READ_TIMEOUT_SECONDS", "30"))  # per-chain timeout for concurrent reads
+        evm_receipt_timeout_seconds = float(os.getenv("EVM_RECEIPT_TIMEOUT_SECONDS", "300"))  # max time to wait for a tx to be confirmed
+        attestation_timeout_seconds = float(os.getenv("ATTESTATION_TIMEOUT_SECONDS", "1800"))  # max time to wait for a CCTP attestation
+        evm_read_cache_block_ttl_seconds = float(os.getenv("EVM_READ_CACHE_BLOCK_TTL_SECONDS", "2"))  # 0 disables the eth_call cache
+        data_dir = os.getenv("AGENT_DATA_DIR", ".rebalancer")  # where the agent persists its local state
+        runtime_state_ttl_seconds = int(os.getenv("RUNTIME_STATE_TTL_SECONDS", "21600"))  # Default to 6 hours
+        fee_oracle_poll_interval_seconds = float(os.getenv("FEE_ORACLE_POLL_INTERVAL_SECONDS", "2"))  # how often the fee oracle checks for a new block
+        verify_local_calldata = os.getenv("VERIFY_LOCAL_CALLDATA", "false").lower() == "true"  # compare local calldata with the contract build_* views
+        near_tx_wait_until = os.getenv("NEAR_TX_WAIT_UNTIL", "EXECUTED").upper()  # NEAR tx status awaited: EXECUTED_OPTIMISTIC, EXECUTED or FINAL
+        near_tx_timeout_seconds = int(os.getenv("NEAR_TX_TIMEOUT_SECONDS", "180"))  # how long a NEAR tx is tracked before giving up
+        optimizer_solver = os.getenv("OPTIMIZER_SOLVER", "kkt").lower()  # allocation solver: kkt (exact water-filling) or slsqp
+        optimizer_rate_model = os.getenv("OPTIMIZER_RATE_MODEL", "linear").lower()  # rate impact model: linear (KKT solver, warm-started) or aave (kinked v3 curve, anchored to the current rate)
+        optimizer_sensitivity = float(os.getenv("OPTIMIZER_SENSITIVITY", "0.001"))  # relative input change below which the last optimum is reused (0 solves on any change)
+        scenario_count = int(os.getenv("SCENARIO_COUNT", "0"))  # Monte Carlo market paths scoring the allocations (0 disables)
+        scenario_objective = os.getenv("SCENARIO_OBJECTIVE", "mean").lower()  # mean (expected yield) or quantile (downside yield)
+        scenario_quantile = float(os.getenv("SCENARIO_QUANTILE", "0.05"))  # scenario share defining the downside for the quantile objective
+        holding_horizon_days = float(os.getenv("HOLDING_HORIZON_DAYS", "30"))  # a rebalance must pay for its costs within this many days
 
         if use_static_signer and one_time_signer_private_key is None:
             sys.exit("❌ USE_STATIC_SIGNER is true but ONE_TIME_SIGNER_PRIVATE_KEY is not set.")
@@ -101,6 +171,30 @@ class Config:
         except json.JSONDecodeError:
             raise ValueError("OVERRIDE_INTEREST_RATES must be a valid JSON dictionary.")
 
+        # Parse EVM_CONFIRMATIONS as JSON dict (chain_id -> confirmation depth)
+        evm_confirmations_raw = os.getenv("EVM_CONFIRMATIONS", "{}")
+        try:
+            evm_confirmations = {int(k): int(v) for k, v in json.loads(evm_confirmations_raw).items()}
+        except json.JSONDecodeError:
+            raise ValueError("EVM_CONFIRMATIONS must be a valid JSON dictionary.")
+
+        # Parse FEE_TIERS as JSON dict (tier name -> FeeTier fields), merged over the default tiers
+        fee_tiers_raw = os.getenv("FEE_TIERS", "{}")
+        try:
+            fee_tiers = json.loads(fee_tiers_raw)
+        except json.JSONDecodeError:
+            raise ValueError("FEE_TIERS must be a valid JSON dictionary.")
+
+        # Parse NATIVE_TOKEN_PRICES_USD as JSON dict (symbol -> USD price), used to price gas in USDC
+        native_token_prices_raw = os.getenv("NATIVE_TOKEN_PRICES_USD")
+        if native_token_prices_raw is None:
+            print(f"⚠️  Warning: NATIVE_TOKEN_PRICES_USD is not set; pricing gas with the defaults {DEFAULT_NATIVE_TOKEN_PRICES_USD} (not production-ready)")
+            native_token_prices_raw = DEFAULT_NATIVE_TOKEN_PRICES_USD
+        try:
+            native_token_prices_usd = {symbol.upper(): float(price) for symbol, price in json.loads(native_token_prices_raw).items()}
+        except json.JSONDecodeError:
+            raise ValueError("NATIVE_TOKEN_PRICES_USD must be a valid JSON dictionary.")
+
         return cls(
             contract_id=contract_id,
             near_network=near_network,
@@ -121,8 +215,40 @@ class Config:
             master_funder_signer_account_id=master_funder_signer_account_id,
             master_funder_drip_size=master_funder_drip_size,
             interval_seconds=interval_seconds,
+            chain_read_timeout_seconds=chain_read_timeout_seconds,
+            evm_confirmations=evm_confirmations,
+            evm_receipt_timeout_seconds=evm_receipt_timeout_seconds,
+            attestation_timeout_seconds=attestation_timeout_seconds,
+            evm_read_cache_block_ttl_seconds=evm_read_cache_block_ttl_seconds,
+            data_dir=data_dir,
+            runtime_state_ttl_seconds=runtime_state_ttl_seconds,
+            fee_tiers=fee_tiers,
+            fee_oracle_poll_interval_seconds=fee_oracle_poll_interval_seconds,
+            verify_local_calldata=verify_local_calldata,
+            near_tx_wait_until=near_tx_wait_until,
+            near_tx_timeout_seconds=near_tx_timeout_seconds,
+            optimizer_solver=optimizer_solver,
+            optimizer_rate_model=optimizer_rate_model,
+            optimizer_sensitivity=optimizer_sensitivity,
+            scenario_count=scenario_count,
+            scenario_objective=scenario_objective,
+            scenario_quantile=scenario_quantile,
+            holding_horizon_days=holding_horizon_days,
+            native_token_prices_usd=native_token_prices_usd,
         )
 
+    @property
+    def metadata_store_path(self) -> str:
+        return os.path.join(self.data_dir, "metadata.json")
+
+    @property
+    def gas_limit_model_path(self) -> str:
+        return os.path.join(self.data_dir, "gas_limits.json")
+
+    @property
+    def activity_log_db_path(self) -> str:
+        return os.path.join(self.data_dir, "activity_logs.sqlite3")
+
     def _validate(self):
         """
         Validate critical configuration fields.
@@ -134,6 +260,16 @@ class Config:
             print("⚠️  Warning: using default ALCHEMY_API_KEY (not production-ready)")
         if not self.one_time_signer_private_key or self.one_time_signer_private_key == "your_private_key_here":
             print("⚠️  Warning: ONE_TIME_SIGNER_PRIVATE_KEY is not set")
+        if self.optimizer_solver not in OPTIMIZER_SOLVERS:
+            sys.exit(f"❌ Unknown OPTIMIZER_SOLVER {self.optimizer_solver!r}, expected one of {OPTIMIZER_SOLVERS}")
+        if self.optimizer_rate_model not in OPTIMIZER_RATE_MODELS:
+            sys.exit(f"❌ Unknown OPTIMIZER_RATE_MODEL {self.optimizer_rate_model!r}, expected one of {OPTIMIZER_RATE_MODELS}")
+        non_eth_networks = [network for network in self.supported_evm_networks if network not in ETH_GAS_NETWORKS]
+        if non_eth_networks:
+            sys.exit(f"❌ Supported EVM networks {non_eth_networks} do not pay gas in ETH; the route cost model cannot price them.")
+        missing_prices = [symbol for symbol in GAS_TOKENS if not self.native_token_prices_usd.get(symbol)]
+        if missing_prices:
+            sys.exit(f"❌ NATIVE_TOKEN_PRICES_USD has no price for {missing_prices}.")
 
     def summary(self):
         """
@@ -155,4 +291,22 @@ class Config:
         print(f"Use Static Signer: {'Yes' if os.getenv('USE_STATIC_SIGNER', 'false').lower() == 'true' else 'No'}")
         print(f"Master Funder Signer Account ID: {self.master_funder_signer_account_id}")
         print(f"Master Funder Drip Size: {self.master_funder_drip_size}")
+        print(f"Chain Read Timeout (s): {self.chain_read_timeout_seconds}")
+        print(f"EVM Confirmations: {self.evm_confirmations}")
+        print(f"EVM Receipt Timeout (s): {self.evm_receipt_timeout_seconds}")
+        print(f"Attestation Timeout (s): {self.attestation_timeout_seconds}")
+        print(f"EVM Read Cache Block TTL (s): {self.evm_read_cache_block_ttl_seconds}")
+        print(f"Agent Data Dir: {self.data_dir}")
+        print(f"Runtime State TTL (s): {self.runtime_state_ttl_seconds}")
+        print(f"Fee Tiers: {self.fee_tiers}")
+        print(f"Fee Oracle Poll Interval (s): {self.fee_oracle_poll_interval_seconds}")
+        print(f"Verify Local Calldata: {'Yes' if self.verify_local_calldata else 'No'}")
+        print(f"NEAR Tx Wait Until: {self.near_tx_wait_until}")
+        print(f"NEAR Tx Timeout (s): {self.near_tx_timeout_seconds}")
+        print(f"Optimizer Solver: {self.optimizer_solver}")
+        print(f"Optimizer Rate Model: {self.optimizer_rate_model}")
+        print(f"Optimizer Sensitivity: {self.optimizer_sensitivity}")
+        print(f"Scenarios: {self.scenario_count or 'Disabled'} (objective: {self.scenario_objective}, quantile: {self.scenario_quantile})")
+        print(f"Holding Horizon (days): {self.holding_horizon_days}")
+        print(f"Native Token Prices (USD): {self.native_token_prices_usd}")
         print("-----------------------------------------------------")
\ No newline at end of file
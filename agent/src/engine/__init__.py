@@ -3,5 +3,8 @@ from .rebalance_operations_planner import compute_rebalance_operations
 from .rebalancer_executor import execute_all_rebalance_operations
 from .strategy_manager import StrategyManager
 from .allocations_fetcher import get_allocations
+from .runtime_state import RuntimeState
+from .session_recovery import load_session, RecoveredSession
+from .activity_log_indexer import ActivityLogIndexer
 
-__all__ = ["build_context", "compute_rebalance_operations", "execute_all_rebalance_operations", "StrategyManager", "EngineContext", "get_allocations"]
\ No newline at end of file
+__all__ = ["build_context", "compute_rebalance_operations", "execute_all_rebalance_operations", "StrategyManager", "EngineContext", "get_allocations", "RuntimeState", "load_session", "RecoveredSession", "ActivityLogIndexer"]
\ No newline at end of file
@@ -0,0 +1,200 @@
+import asyncio
+import json
+import os
+import sqlite3
+import time
+from typing import Optional
+
+from adapters import RebalancerContract
+from engine_types import Flow, TxType
+
+# signed steps of every flow (`CompleteRebalance` is a plain NEAR call and never shows up in the log)
+FLOW_SIGNED_STEPS: dict[Flow, list[TxType]] = {
+    Flow.RebalancerToAave: [TxType.RebalancerWithdrawToAllocate, TxType.CCTPBurn, TxType.CCTPMint, TxType.AaveSupply],
+    Flow.AaveToRebalancer: [TxType.AaveWithdraw, TxType.CCTPBurn, TxType.CCTPMint, TxType.RebalancerDeposit],
+    Flow.AaveToAave: [TxType.AaveWithdraw, TxType.CCTPBurn, TxType.CCTPMint, TxType.AaveSupply],
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS activity_logs (
+    nonce              INTEGER PRIMARY KEY,
+    activity_type      TEXT    NOT NULL,
+    flow               TEXT,
+    source_chain       INTEGER NOT NULL,
+    destination_chain  INTEGER NOT NULL,
+    amount             TEXT    NOT NULL,  -- u128, kept as text
+    started_at_ms      INTEGER NOT NULL,
+    closed             INTEGER NOT NULL,
+    closed_seen_at_ms  INTEGER,
+    complete           INTEGER NOT NULL,
+    steps              TEXT    NOT NULL,  -- JSON list of the signed TxType values, in order
+    log                TEXT    NOT NULL   -- JSON of the full log, transactions as hex
+)
+"""
+
+
+def _infer_flow(steps: list[TxType]) -> Optional[Flow]:
+    if TxType.RebalancerWithdrawToAllocate in steps:
+        return Flow.RebalancerToAave
+    if TxType.RebalancerDeposit in steps:
+        return Flow.AaveToRebalancer
+    if TxType.AaveWithdraw in steps and TxType.AaveSupply in steps:
+        return Flow.AaveToAave
+    return None  # AaveWithdraw alone does not tell AaveToAave from AaveToRebalancer yet
+
+
+class ActivityLogIndexer:
+    """
+    Local SQLite index of the contract activity logs, keyed by nonce.
+
+    `sync` only fetches logs newer than the ones already indexed as closed, through
+    `get_latest_logs`, so analytics (durations, amounts and failure rates per route) are
+    served from disk instead of NEAR RPC.
+
+    A log is closed once its session is no longer active. The logs only carry their start
+    timestamp, so the end of a session is the time the first sync saw it closed: with a sync
+    after every run this is close to the `complete_rebalance` call. Logs that were already
+    closed when the index was created have no duration.
+
+    `get_latest_logs` can only page from the newest log, so a sync reads at most
+    `max_page_size` logs: on a first sync over a longer history the older logs are not indexed.
+    """
+
+    def __init__(self, rebalancer_contract: RebalancerContract, path: str, page_size: int = 10, max_page_size: int = 200):
+        self.rebalancer_contract = rebalancer_contract
+        self.path = path
+        self.page_size = page_size
+        self.max_page_size = max(max_page_size, page_size)
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._db = sqlite3.connect(path)
+        self._db.execute(_SCHEMA)
+        self._db.commit()
+
+    def close(self) -> None:
+        self._db.close()
+
+    # ---------------------------
+    # Sync
+    # ---------------------------
+    def _resume_nonce(self) -> int:
+        """Oldest nonce that may still change: the first open log, or the one after the last indexed."""
+        open_nonce, = self._db.execute("SELECT MIN(nonce) FROM activity_logs WHERE closed = 0").fetchone()
+        if open_nonce is not None:
+            return open_nonce
+        last_nonce, = self._db.execute("SELECT MAX(nonce) FROM activity_logs").fetchone()
+        return 0 if last_nonce is None else last_nonce + 1
+
+    async def _fetch_since(self, from_nonce: int) -> list[dict]:
+        # @dev nonces are dense, so a short page means every log was returned
+        count = self.page_size
+        while True:
+            logs = await self.rebalancer_contract.get_latest_logs(count)
+            if len(logs) < count or logs[-1]["nonce"] <= from_nonce:
+                return [log for log in logs if log["nonce"] >= from_nonce]
+            if count >= self.max_page_size:
+                print(f"⚠️ {logs[-1]['nonce'] - from_nonce} activity log(s) before nonce {logs[-1]['nonce']} are older than the last {count} and won't be indexed.")
+                return logs
+            count = min(count * 2, self.max_page_size)
+
+    async def sync(self) -> int:
+        """
+        Indexes the logs created or updated since the last sync.
+
+        Returns:
+            int: number of logs written.
+        """
+        from_nonce = self._resume_nonce()
+        is_first_sync = self._db.execute("SELECT 1 FROM activity_logs LIMIT 1").fetchone() is None
+
+        logs, session_info = await asyncio.gather(
+            self._fetch_since(from_nonce),
+            self.rebalancer_contract.get_active_session_info(),
+        )
+        if not logs:
+            return 0
+
+        now_ms = int(time.time() * 1000)
+        active_nonce = session_info["nonce"] if session_info else None
+        was_open = {nonce for nonce, in self._db.execute("SELECT nonce FROM activity_logs WHERE closed = 0")}
+        was_closed = {nonce for nonce, in self._db.execute("SELECT nonce FROM activity_logs WHERE closed = 1 AND nonce >= ?", (from_nonce,))}
+
+        rows = []
+        for log in logs:
+            nonce = log["nonce"]
+            if nonce in was_closed:
+                continue  # closed logs never change
+            steps = [TxType.from_u8(tx[0]) for tx in log["transactions"] if tx]
+            flow = _infer_flow(steps)
+            closed = nonce != active_nonce
+
+            # seen open before, or created since the last sync: it closed between then and now
+            closed_seen_at_ms = now_ms if closed and (nonce in was_open or not is_first_sync) else None
+
+            rows.append((
+                nonce,
+                log["activity_type"],
+                flow.value if flow else None,
+                log["source_chain"],
+                log["destination_chain"],
+                str(log["amount"]),
+                log["timestamp"],
+                int(closed),
+                closed_seen_at_ms,
+                int(flow is not None and steps == FLOW_SIGNED_STEPS[flow]),
+                json.dumps([step.value for step in steps]),
+                json.dumps({**log, "transactions": [tx.hex() for tx in log["transactions"]]}, default=str),
+            ))
+
+        # @dev only the active session is open, so an open log that fell out of the page closed since the last sync
+        fetched = {log["nonce"] for log in logs}
+        stale_open = [(now_ms, nonce) for nonce in was_open if nonce not in fetched and nonce != active_nonce]
+
+        if not rows and not stale_open:
+            return 0
+
+        with self._db:
+            self._db.executemany("INSERT OR REPLACE INTO activity_logs VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+            self._db.executemany("UPDATE activity_logs SET closed = 1, closed_seen_at_ms = ? WHERE nonce = ?", stale_open)
+
+        written = len(rows) + len(stale_open)
+        print(f"📚 Indexed {written} activity log(s) from nonce {from_nonce} into {self.path}.")
+        return written
+
+    # ---------------------------
+    # Queries
+    # ---------------------------
+    def session_durations(self, source_chain: Optional[int] = None, destination_chain: Optional[int] = None) -> dict[int, float]:
+        """Seconds from start to close of every closed session with a known close time, by nonce."""
+        query = "SELECT nonce, closed_seen_at_ms - started_at_ms FROM activity_logs WHERE closed = 1 AND closed_seen_at_ms IS NOT NULL"
+        params: list[int] = []
+        if source_chain is not None:
+            query += " AND source_chain = ?"
+            params.append(source_chain)
+        if destination_chain is not None:
+            query += " AND destination_chain = ?"
+            params.append(destination_chain)
+        return {nonce: duration_ms / 1000 for nonce, duration_ms in self._db.execute(query + " ORDER BY nonce", params)}
+
+    def amounts_per_route(self) -> dict[tuple[int, int], dict[str, int]]:
+        """Number of sessions and total amount moved per (source chain, destination chain)."""
+        routes: dict[tuple[int, int], dict[str, int]] = {}
+        # @dev amounts are u128, so they are added up here rather than by SQLite
+        for source_chain, destination_chain, amount in self._db.execute("SELECT source_chain, destination_chain, amount FROM activity_logs"):
+            route = routes.setdefault((source_chain, destination_chain), {"sessions": 0, "amount": 0})
+            route["sessions"] += 1
+            route["amount"] += int(amount)
+        return routes
+
+    def failure_rates(self) -> dict[tuple[int, int], float]:
+        """Share of closed sessions per route that were closed without signing every step of their flow."""
+        return {
+            (source_chain, destination_chain): failed / total
+            for source_chain, destination_chain, failed, total in self._db.execute(
+                "SELECT source_chain, destination_chain, SUM(complete = 0), COUNT(*) FROM activity_logs "
+                "WHERE closed = 1 GROUP BY source_chain, destination_chain"
+            )
+        }
@@ -1,26 +1,23 @@
 from engine import EngineContext
-from adapters import LendingPool
-from helpers import BalanceHelper
+from helpers import ChainStateReader, gather_per_chain
 from utils import from_chain_id_to_network
 
-async def get_allocations(context: EngineContext) -> tuple[dict[str, int], int]:
+async def get_allocations(context: EngineContext, timeout_seconds: float = 30) -> tuple[dict[str, int], int]:
     supported_chains = await context.rebalancer_contract.get_supported_chains()
     
-    current_allocations = {}
-    for chain_id in supported_chains:
+    async def fetch_allocation(chain_id: int) -> int:
         network_id = from_chain_id_to_network(chain_id)
         web3_instance = context.evm_factory_provider.get_provider(network_id)
-        aave_lending_pool_address = context.remote_configs[chain_id]["aave"]["lending_pool_address"]
-        usdc_token_address: str = context.remote_configs[chain_id]["aave"]["asset"]
-        a_token_address = LendingPool.get_atoken_address(web3_instance=web3_instance, lending_pool_address=aave_lending_pool_address, asset_address=usdc_token_address)
 
-        if not a_token_address:
-            raise ValueError("Failed to get AToken address on destination chain.")
+        # @dev reserve data, aToken and USDC balances are all read in a single multicall
+        snapshot = await ChainStateReader.read(web3_instance=web3_instance, chain_id=chain_id, chain_config=context.remote_configs[chain_id])
         
         if chain_id == context.source_chain_id: # we get the aToken Balance of the vault as holder
-            current_allocations[chain_id] = BalanceHelper.get_atoken_vault_balance(web3_instance=web3_instance, atoken_address=a_token_address)
+            return snapshot.a_token_vault_balance
         else: # we get the aToken Balance of the agent as holder
-            current_allocations[chain_id] = BalanceHelper.get_atoken_agent_balance(web3_instance=web3_instance, atoken_address=a_token_address)
+            return snapshot.a_token_agent_balance
+
+    current_allocations = await gather_per_chain(supported_chains, fetch_allocation, timeout_seconds=timeout_seconds, label="get_allocations")
     
     total_assets_under_management = sum(current_allocations.values())
     print(f"Total Assets Under Management (from existing allocations): {total_assets_under_management}")
@@ -1,4 +1,7 @@
+import asyncio
+import time
 from dataclasses import dataclass
+from typing import Awaitable, Optional, TypeVar
 
 from near_omni_client.providers.near import NearFactoryProvider
 from near_omni_client.providers.evm import AlchemyFactoryProvider
@@ -9,18 +12,20 @@ from near_omni_client.chain_signatures.kdf import Kdf
 from near_omni_client.chain_signatures.utils import get_evm_address
 from near_omni_client.json_rpc.client import NearClient
 from near_omni_client.networks import Network
-from tee import KeyPairGenerator
+from tee import KeyPairGenerator, get_tee_info
 from utils import from_chain_id_to_network
-from helpers import GasEstimator
+from helpers import GasEstimator, AsyncAlchemyFactoryProvider, MetadataStore, FeeOracle, FeeTier, GasLimitModel
 from adapters import RebalancerContract
 from config import Config
 
 from .fund_manager import FundManager
 
+T = TypeVar("T")
+
 @dataclass
 class EngineContext:
     near_client: NearClient
-    evm_factory_provider: AlchemyFactoryProvider
+    evm_factory_provider: AsyncAlchemyFactoryProvider
     near_wallet: NearWallet
     mpc_wallet: MPCWallet
     rebalancer_contract: RebalancerContract
@@ -31,23 +36,30 @@ class EngineContext:
     remote_configs: dict
     vault_address: str
     supported_chains: list[int]
+    # attestation of a fresh one-time signer, fetched while the rest of the context is built
+    tee_info_prefetch: Optional[asyncio.Task] = None
 
 
-async def build_context(config: Config) -> EngineContext:
-    # ---------------------------
-    # NEAR provider & client
-    # ---------------------------
-    near_factory = NearFactoryProvider()
-    near_client = near_factory.get_provider(config.near_network)
+class _StartupTimer:
+    """Records how long each startup stage took, including the ones running concurrently."""
 
-    # ---------------------------
-    # EVM provider factory
-    # ---------------------------
-    alchemy_factory_provider = AlchemyFactoryProvider(api_key=config.alchemy_api_key)
+    def __init__(self):
+        self.started_at = time.monotonic()
+        self.stages: dict[str, float] = {}
 
-    # ---------------------------
-    # Agent KDF → EVM address
-    # ---------------------------
+    async def run(self, name: str, awaitable: Awaitable[T]) -> T:
+        start = time.monotonic()
+        try:
+            return await awaitable
+        finally:
+            self.stages[name] = time.monotonic() - start
+
+    def report(self) -> None:
+        stages = ", ".join(f"{name} {seconds:.2f}s" for name, seconds in self.stages.items())
+        print(f"⏱ Startup took {time.monotonic() - self.started_at:.2f}s ({stages})")
+
+
+def _derive_agent_address(config: Config) -> str:
     print(f"showing config.network_short_name: {config.network_short_name}")
     
     root_pubkey = Kdf.get_root_public_key(config.network_short_name)
@@ -65,130 +77,182 @@ async def build_context(config: Config) -> EngineContext:
 
     agent_address = get_evm_address(agent_public_key)
     print(f"Derived agent EVM address: {agent_address}")
-    
-    # ---------------------------
-    # Gas estimator
-    # ---------------------------
-    gas_estimator = GasEstimator(evm_factory_provider=alchemy_factory_provider)
+    return agent_address
 
-    # ---------------------------
-    # One-time NEAR signer
-    # ---------------------------
+
+def _one_time_signer_keys(config: Config) -> tuple[str, str]:
     print(f"is config use_static_signer? {config.use_static_signer}")
     
     if config.use_static_signer:
         print("Using static one-time NEAR signer.")
         print(f"One-time signer account ID: {config.one_time_signer_account_id}")
         print(f"One-time signer private key: {config.one_time_signer_private_key}")
+        return config.one_time_signer_account_id, config.one_time_signer_private_key
 
-        near_local_signer = KeyPair.from_string(config.one_time_signer_private_key)
-        near_wallet = NearWallet(
-            keypair=near_local_signer,
-            account_id=config.one_time_signer_account_id,
-            provider_factory=near_factory,
-            supported_networks=config.supported_near_networks,
-        )
-    else:
-        account_id, secret_key = KeyPairGenerator().derive_ephemeral_account()
+    account_id, secret_key = KeyPairGenerator().derive_ephemeral_account()
 
-        print("Using dynamic one-time NEAR signer.")
-        print(f"One-time signer generated account ID: {account_id}")
-        print(f"One-time signer generated private key: {secret_key}")
+    print("Using dynamic one-time NEAR signer.")
+    print(f"One-time signer generated account ID: {account_id}")
+    print(f"One-time signer generated private key: {secret_key}")
+    return account_id, secret_key
 
-        near_local_signer = KeyPair.from_string(secret_key)
-        near_wallet = NearWallet(
-            keypair=near_local_signer,
-            account_id=account_id,
-            provider_factory=near_factory,
-            supported_networks=config.supported_near_networks,
-        )
 
-        # since we're using a dynamic one-time signer, ensure it has enough funds
-        master_funder_signer = KeyPair.from_string(config.master_funder_signer_private_key)
-        master_funder_wallet = NearWallet(
-            keypair=master_funder_signer,
-            account_id=config.master_funder_signer_account_id,
-            provider_factory=near_factory,
-            supported_networks=config.supported_near_networks,
-        )
-        await FundManager(near_wallet=master_funder_wallet, near_client=near_client).fund_one_time_signer(
-            required_balance_in_near=config.master_funder_drip_size,
-            destination_account_id=account_id,
-        )
-
-        print(f"Using one-time NEAR signer account: {account_id} and funded with at least {config.master_funder_drip_size} NEAR.")
-   
-    # ---------------------------
-    # MPC Wallet for EVM signing
-    # ---------------------------
-    mpc_wallet = MPCWallet(
-        path=config.kdf_path,
-        account_id=config.contract_id,
-        near_network=config.near_network,
-        provider_factory=alchemy_factory_provider,
-        supported_networks=config.supported_evm_networks,
+async def _fund_one_time_signer(config: Config, near_factory: NearFactoryProvider, near_client: NearClient, account_id: str) -> None:
+    # since we're using a dynamic one-time signer, ensure it has enough funds
+    master_funder_signer = KeyPair.from_string(config.master_funder_signer_private_key)
+    master_funder_wallet = NearWallet(
+        keypair=master_funder_signer,
+        account_id=config.master_funder_signer_account_id,
+        provider_factory=near_factory,
+        supported_networks=config.supported_near_networks,
     )
+    await FundManager(near_wallet=master_funder_wallet, near_client=near_client).fund_one_time_signer(
+        required_balance_in_near=config.master_funder_drip_size,
+        destination_account_id=account_id,
+    )
+
+    print(f"Using one-time NEAR signer account: {account_id} and funded with at least {config.master_funder_drip_size} NEAR.")
+
+
+async def build_context(config: Config) -> EngineContext:
+    """
+    Builds the engine context, running the independent startup stages concurrently:
+
+        agent address (KDF) ─────────────┐
+        one-time signer keys ─┬──────────┴─ contract ── remote views ─┐
+                              ├─ signer funding ──────────────────────┴─ context
+                              └─ TEE info prefetch (awaited by the worker registration)
+    """
+    timer = _StartupTimer()
 
     # ---------------------------
-    # Contract wrapper
+    # NEAR provider & client
     # ---------------------------
-    rebalancer_contract = RebalancerContract(
-        near_client=near_client,
-        near_wallet=near_wallet,
-        near_contract_id=config.contract_id,
-        agent_address=agent_address,
-        gas_estimator=gas_estimator,
-        evm_provider=alchemy_factory_provider,
-        config=config,
-    )
+    near_factory = NearFactoryProvider()
+    near_client = near_factory.get_provider(config.near_network)
 
     # ---------------------------
-    # Pull remote configs once
+    # EVM provider factory
     # ---------------------------
-    remote_configs = await rebalancer_contract.get_all_configs()
+    # @dev the sync factory is only kept for the MPC wallet, every EVM call of the agent goes through the async one
+    alchemy_factory_provider = AlchemyFactoryProvider(api_key=config.alchemy_api_key)
+    async_alchemy_factory_provider = AsyncAlchemyFactoryProvider(api_key=config.alchemy_api_key, read_cache_block_ttl_seconds=config.evm_read_cache_block_ttl_seconds)
 
     # ---------------------------
-    # Pull supported chains
+    # Gas estimator
     # ---------------------------
-    supported_chains = await rebalancer_contract.get_supported_chains()
-    print("Supported chains:", supported_chains)
-    
+    fee_oracle = FeeOracle(
+        evm_factory_provider=async_alchemy_factory_provider,
+        tiers={name: FeeTier(**fields) for name, fields in config.fee_tiers.items()},
+        poll_interval_seconds=config.fee_oracle_poll_interval_seconds,
+    )
+    gas_estimator = GasEstimator(evm_factory_provider=async_alchemy_factory_provider, fee_oracle=fee_oracle)
+
     # ---------------------------
-    # Pull source chain ID
+    # Agent KDF → EVM address and one-time NEAR signer keys (CPU / TEE bound, off the event loop)
     # ---------------------------
-    source_chain_id = await rebalancer_contract.get_source_chain()
-    source_network = from_chain_id_to_network(source_chain_id)
+    agent_address_task = asyncio.create_task(timer.run("agent address", asyncio.to_thread(_derive_agent_address, config)))
+    signer_keys_task = asyncio.create_task(timer.run("signer keys", asyncio.to_thread(_one_time_signer_keys, config)))
+    background: list[asyncio.Task] = [agent_address_task, signer_keys_task]
+    tee_info_prefetch: Optional[asyncio.Task] = None
+
+    try:
+        account_id, secret_key = await signer_keys_task
+        near_wallet = NearWallet(
+            keypair=KeyPair.from_string(secret_key),
+            account_id=account_id,
+            provider_factory=near_factory,
+            supported_networks=config.supported_near_networks,
+        )
+
+        if not config.use_static_signer:
+            # a fresh ephemeral account is never registered: fund it and prepare its attestation meanwhile
+            background.append(asyncio.create_task(timer.run("signer funding", _fund_one_time_signer(config, near_factory, near_client, account_id))))
+            tee_info_prefetch = asyncio.create_task(get_tee_info(account_id))
+
+        agent_address = await agent_address_task
+
+        # ---------------------------
+        # MPC Wallet for EVM signing
+        # ---------------------------
+        mpc_wallet = MPCWallet(
+            path=config.kdf_path,
+            account_id=config.contract_id,
+            near_network=config.near_network,
+            provider_factory=alchemy_factory_provider,
+            supported_networks=config.supported_evm_networks,
+        )
+
+        # ---------------------------
+        # Contract wrapper
+        # ---------------------------
+        rebalancer_contract = RebalancerContract(
+            near_client=near_client,
+            near_wallet=near_wallet,
+            near_contract_id=config.contract_id,
+            agent_address=agent_address,
+            gas_estimator=gas_estimator,
+            evm_provider=async_alchemy_factory_provider,
+            config=config,
+        )
+
+        # ---------------------------
+        # Remote configs, supported chains and source chain ID, in one round trip
+        # ---------------------------
+        remote_configs, supported_chains, source_chain_id = await timer.run("remote views", asyncio.gather(
+            rebalancer_contract.get_all_configs(),
+            rebalancer_contract.get_supported_chains(),
+            rebalancer_contract.get_source_chain(),
+        ))
+        print("Supported chains:", supported_chains)
+        source_network = from_chain_id_to_network(source_chain_id)
+
+        # ---------------------------
+        # Persisted chain metadata (invalidated when the remote configs change) and learned gas limits
+        # ---------------------------
+        MetadataStore.load(path=config.metadata_store_path, remote_configs=remote_configs)
+        GasLimitModel.load(path=config.gas_limit_model_path)
     
-    # ---------------------------
-    # Source Chain Config 
-    # ---------------------------
-    source_chain_config = remote_configs.get(source_chain_id, None)
-    if not source_chain_config:
-        raise ValueError(f"Source chain config for chain ID {source_chain_id} not found in remote configs.")
+        # ---------------------------
+        # Source Chain Config 
+        # ---------------------------
+        source_chain_config = remote_configs.get(source_chain_id, None)
+        if not source_chain_config:
+            raise ValueError(f"Source chain config for chain ID {source_chain_id} not found in remote configs.")
     
-    # ---------------------------
-    # Vault Address
-    # ---------------------------
-    vault_address = source_chain_config["rebalancer"]["vault_address"]
-    if not vault_address:
-        raise ValueError(f"Vault address for source chain {source_chain_id} not found in remote configs.")
+        # ---------------------------
+        # Vault Address
+        # ---------------------------
+        vault_address = source_chain_config["rebalancer"]["vault_address"]
+        if not vault_address:
+            raise ValueError(f"Vault address for source chain {source_chain_id} not found in remote configs.")
 
-    print(f"agent address in context builder: {agent_address}")
+        print(f"agent address in context builder: {agent_address}")
+
+        # the signer must be funded before its first transaction (the worker registration)
+        await asyncio.gather(*background)
+        timer.report()
     
-    # ---------------------------
-    # Build context object
-    # ---------------------------
-    return EngineContext(
-        near_client=near_client,
-        evm_factory_provider=alchemy_factory_provider,
-        near_wallet=near_wallet,
-        mpc_wallet=mpc_wallet,
-        rebalancer_contract=rebalancer_contract,
-        gas_estimator=gas_estimator,
-        agent_address=agent_address,
-        remote_configs=remote_configs,
-        source_chain_id=source_chain_id,
-        source_network=source_network,
-        vault_address=vault_address,
-        supported_chains=supported_chains,
-    )
\ No newline at end of file
+        # ---------------------------
+        # Build context object
+        # ---------------------------
+        return EngineContext(
+            near_client=near_client,
+            evm_factory_provider=async_alchemy_factory_provider,
+            near_wallet=near_wallet,
+            mpc_wallet=mpc_wallet,
+            rebalancer_contract=rebalancer_contract,
+            gas_estimator=gas_estimator,
+            agent_address=agent_address,
+            remote_configs=remote_configs,
+            source_chain_id=source_chain_id,
+            source_network=source_network,
+            vault_address=vault_address,
+            supported_chains=supported_chains,
+            tee_info_prefetch=tee_info_prefetch,
+        )
+    except BaseException:
+        for task in [*background, tee_info_prefetch]:
+            if task is not None:
+                task.cancel()
+        raise
@@ -7,6 +7,9 @@ from near_omni_client.transactions import TransactionBuilder, ActionFactory
 from near_omni_client.transactions.utils import decode_key
 from near_omni_client.json_rpc.exceptions import JsonRpcError
 
+from helpers import NearAccessKeyTracker
+from helpers.near_tx_submitter import is_stale_access_key_error
+
 FUNDING_DELAY = 60 # seconds
 
 class FundManager:
@@ -43,15 +46,15 @@ class FundManager:
       public_key_str = await self.near_wallet.get_public_key()
       signer_account_id = self.near_wallet.get_address()
       private_key_str = self.near_wallet.keypair.to_string()
-      nonce_and_block_hash = await self.near_client.get_nonce_and_block_hash(signer_account_id, public_key_str)
+      nonce, block_hash = await NearAccessKeyTracker.next(self.near_client, signer_account_id, public_key_str)
       
       tx = (
             TransactionBuilder()
             .with_signer_id(signer_account_id)
             .with_public_key(public_key_str)
-            .with_nonce(nonce_and_block_hash["nonce"])
+            .with_nonce(nonce)
             .with_receiver(receiver_id)
-            .with_block_hash(nonce_and_block_hash["block_hash"])
+            .with_block_hash(block_hash)
             .add_action(
                ActionFactory.transfer(deposit=amount)
             )
@@ -72,6 +75,11 @@ class FundManager:
                return result
             except JsonRpcError as e:
                 msg = str(e)
+                if is_stale_access_key_error(e):
+                    # the next transfer re-reads the key; this one cannot be sent again as is
+                    NearAccessKeyTracker.invalidate(signer_account_id, public_key_str)
+                    raise
+
                 if "TIMEOUT_ERROR" in msg:
                   if attempt < max_retries:
                         print(f"⚠️  Timeout error on attempt {attempt}. Retrying in {delay:.1f}s...")
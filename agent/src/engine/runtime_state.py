@@ -0,0 +1,170 @@
+import asyncio
+import time
+from typing import Optional
+
+from config import Config
+from adapters import Vault
+from helpers import Assert, AttestationPoller, BalanceHelper, ChainStateReader, CrossChainATokenBalanceHelper, MetadataStore, NearTxSubmitter, ReceiptWaiter
+from tee import get_tee_info
+from utils import from_chain_id_to_network
+
+from .context_builder import EngineContext
+from .strategy_manager import StrategyManager
+
+
+class RuntimeState:
+    """
+    State that outlives a single `run_once`: worker registration, the vault max allowance and
+    the configuration of every helper and strategy.
+
+    Everything is set up on the first `refresh`. Afterwards only the remote configs are read on
+    every run; the rest is refreshed when they change (until a refresh completes) or when
+    `ttl_seconds` expires.
+    """
+
+    def __init__(self, context: EngineContext, config: Config):
+        self.context = context
+        self.config = config
+        self.ttl_seconds = config.runtime_state_ttl_seconds
+
+        self.max_allowance: Optional[int] = None
+        self._initialized = False
+        # remote configs changed but the state derived from them is not refreshed yet
+        self._pending_reconfigure = False
+        self._worker_checked_at: float = 0.0
+        self._max_allowance_refreshed_at: float = 0.0
+
+    async def refresh(self) -> None:
+        now = time.monotonic()
+
+        if self._initialized and await self._refresh_remote_configs():
+            self._pending_reconfigure = True
+        # @dev only cleared once the refresh below succeeds, so a failure is retried on the next run
+        config_changed = self._pending_reconfigure
+
+        if not self._initialized or config_changed or self._expired(self._worker_checked_at, now):
+            await self._ensure_worker_registered()
+            self._worker_checked_at = now
+
+        max_allowance_changed = False
+        if not self._initialized or config_changed or self._expired(self._max_allowance_refreshed_at, now):
+            max_allowance = await Vault(self.context.vault_address, self.context.source_network, self.context.evm_factory_provider).get_max_total_deposits()
+            print(f"Max allowance for vault {self.context.vault_address} on source chain: {max_allowance}")
+            max_allowance_changed = max_allowance != self.max_allowance
+            self.max_allowance = max_allowance
+            self._max_allowance_refreshed_at = now
+
+        if not self._initialized or config_changed:
+            await self._configure_helpers()
+
+        if not self._initialized or config_changed or max_allowance_changed:
+            self._configure_strategies()
+
+        self._initialized = True
+        self._pending_reconfigure = False
+
+    def _expired(self, refreshed_at: float, now: float) -> bool:
+        return now - refreshed_at >= self.ttl_seconds
+
+    async def _refresh_remote_configs(self) -> bool:
+        rebalancer_contract = self.context.rebalancer_contract
+        remote_configs, supported_chains = await asyncio.gather(
+            rebalancer_contract.get_all_configs(),
+            rebalancer_contract.get_supported_chains(),
+        )
+
+        if remote_configs == self.context.remote_configs and supported_chains == self.context.supported_chains:
+            return False
+
+        print("🔄 Remote configs changed; refreshing runtime state.")
+
+        source_chain_id = await rebalancer_contract.get_source_chain()
+        source_chain_config = remote_configs.get(source_chain_id, None)
+        if not source_chain_config:
+            raise ValueError(f"Source chain config for chain ID {source_chain_id} not found in remote configs.")
+
+        self.context.remote_configs = remote_configs
+        self.context.supported_chains = supported_chains
+        self.context.source_chain_id = source_chain_id
+        self.context.source_network = from_chain_id_to_network(source_chain_id)
+        self.context.vault_address = source_chain_config["rebalancer"]["vault_address"]
+
+        MetadataStore.load(path=self.config.metadata_store_path, remote_configs=remote_configs)
+
+        return True
+
+    async def _ensure_worker_registered(self) -> None:
+        context = self.context
+
+        is_worker_registered = await context.rebalancer_contract.is_worker_registered(context.near_wallet.account_id)
+        print(f"Worker registered: {is_worker_registered}")
+
+        if is_worker_registered:
+            return
+
+        print("Worker not registered. Registering now...")
+
+        if context.tee_info_prefetch is not None:
+            # @dev one-shot: cleared before awaiting, so a failed prefetch is not reused on the next attempt
+            prefetch, context.tee_info_prefetch = context.tee_info_prefetch, None
+            tee_info = await prefetch
+        else:
+            tee_info = await get_tee_info(context.near_wallet.account_id)
+
+        if tee_info.get("success") is False:
+            raise RuntimeError(f"get_tee_info failed: {tee_info.get('error')}")
+
+        quote_hex = tee_info["quote_hex"]
+        collateral = tee_info["collateral"]
+        checksum = tee_info["checksum"]
+        tcb_info = tee_info["tcb_info"]
+
+        print(f"Registering worker with TEE info - Quote Hex: {quote_hex}")
+        print(f"Collateral: {collateral}")
+        print(f"Checksum: {checksum}")
+        print(f"TCB Info: {tcb_info}")
+
+        await context.rebalancer_contract.register_worker(
+            quote_hex=quote_hex,
+            collateral=collateral,
+            checksum=checksum,
+            tcb_info=tcb_info
+        )
+        print("Worker registration completed.")
+
+    async def _configure_helpers(self) -> None:
+        context, config = self.context, self.config
+        agent_evm_address = context.agent_address
+        vault_address = context.vault_address
+
+        # Configure Crosschain BalanceHelper
+        await CrossChainATokenBalanceHelper.configure(
+            agent_address=agent_evm_address,
+            source_chain_id=context.source_chain_id,
+            supported_chains=context.supported_chains,
+            remote_configs=context.remote_configs,
+            evm_factory_provider=context.evm_factory_provider,
+            read_timeout_seconds=config.chain_read_timeout_seconds,
+        )
+
+        # Configure Balance Helper
+        BalanceHelper.configure(rebalancer_vault_address=vault_address, agent_address=agent_evm_address)
+
+        # Configure Chain State Reader (batched per-chain reads)
+        ChainStateReader.configure(rebalancer_vault_address=vault_address, agent_address=agent_evm_address)
+
+        # Configure Receipt Waiter
+        ReceiptWaiter.configure(confirmations_by_chain=config.evm_confirmations, timeout_seconds=config.evm_receipt_timeout_seconds)
+
+        # Configure Attestation Poller
+        AttestationPoller.configure(timeout_seconds=config.attestation_timeout_seconds)
+
+        # Configure NEAR Transaction Submitter
+        NearTxSubmitter.configure(wait_until=config.near_tx_wait_until, timeout_seconds=config.near_tx_timeout_seconds)
+
+        # Configure Assert
+        Assert.configure(rebalancer_vault_address=vault_address, agent_address=agent_evm_address)
+
+    def _configure_strategies(self) -> None:
+        context = self.context
+        StrategyManager.configure(rebalancer_contract=context.rebalancer_contract, evm_factory_provider=context.evm_factory_provider, vault_address=context.vault_address, config=self.config, remote_config=context.remote_configs, agent_address=context.agent_address, max_allowance=self.max_allowance)
@@ -0,0 +1,59 @@
+import asyncio
+from dataclasses import dataclass, field
+from typing import Optional
+
+from adapters import RebalancerContract
+from engine_types import Flow, TxType
+
+
+@dataclass
+class RecoveredSession:
+    nonce: int
+    flow: Flow
+    restart_from: Optional[TxType]
+    activity_log: dict
+    # every payload signed so far in the session, without the tx_type prefix byte
+    signed_payloads: dict[TxType, bytes] = field(default_factory=dict)
+
+
+def _split_signed_payloads(transactions: list[bytes]) -> dict[TxType, bytes]:
+    # @dev each entry is `tx_type || signed_rlp`, as stored by the contract sign callback
+    return {TxType.from_u8(tx[0]): tx[1:] for tx in transactions if tx}
+
+
+async def load_session(rebalancer_contract: RebalancerContract) -> Optional[RecoveredSession]:
+    """
+    Loads everything needed to resume an active session in a single round trip.
+
+    The session info and the latest activity log are read concurrently. The active session
+    always owns the latest log, whose `transactions` hold every payload signed so far, so
+    steps do not need a `get_signed_payload` call each. If the latest log does not belong
+    to the session (which should not happen), its log is read with `get_activity_log`.
+
+    Returns:
+        Optional[RecoveredSession]: None when there is no active session.
+    """
+    session_info, latest_logs = await asyncio.gather(
+        rebalancer_contract.get_active_session_info(),
+        rebalancer_contract.get_latest_logs(1),
+    )
+
+    if session_info is None:
+        return None
+
+    if latest_logs and latest_logs[0]["nonce"] == session_info["nonce"]:
+        activity_log = latest_logs[0]
+    else:
+        print(f"⚠️ Latest activity log does not belong to session {session_info['nonce']}; reading it directly.")
+        activity_log = await rebalancer_contract.get_activity_log()
+
+    # if there is an existing session but the previous step is None, we restart from the pending step
+    restart_from = session_info["previous_step"] or session_info["pending_step"]
+
+    return RecoveredSession(
+        nonce=session_info["nonce"],
+        flow=session_info["flow"],
+        restart_from=restart_from,
+        activity_log=activity_log,
+        signed_payloads=_split_signed_payloads(activity_log["transactions"]),
+    )
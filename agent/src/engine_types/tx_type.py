@@ -23,4 +23,11 @@ class TxType(Enum):
             TxType.RebalancerDeposit: 6,
             TxType.RebalancerSignCrossChainBalance: 7,
             TxType.CompleteRebalance: 8,
-        }[self]
\ No newline at end of file
+        }[self]
+
+    @classmethod
+    def from_u8(cls, value: int) -> "TxType":
+        for tx_type in cls:
+            if tx_type.as_u8 == value:
+                return tx_type
+        raise ValueError(f"Unknown tx_type byte: {value}")
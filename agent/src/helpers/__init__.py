@@ -1,15 +1,48 @@
 from .balance_helper import BalanceHelper
 from .broadcaster import broadcast
 from .state_assertions import Assert
+from .read_cache import BlockScopedCachingProvider
+from .async_evm_provider import AsyncAlchemyFactoryProvider
+from .metadata_store import MetadataStore
+from .nonce_manager import NonceManager
+from .fee_oracle import FeeOracle, FeeTier
+from .cctp_fees import compute_cctp_fee
+from .gas_limit_model import GasLimitModel
 from .gas_estimator import GasEstimator
+from .near_tx_submitter import NearTxSubmitter
+from .near_access_key_tracker import NearAccessKeyTracker
 from .evm_transaction import EVMTransaction
 from .crosschain_balance_helper import CrossChainATokenBalanceHelper
+from .chain_state_reader import ChainStateReader, ChainSnapshot
+from .reserve_rate_reader import ReserveRateReader, ReserveRateState
+from .chain_fanout import gather_per_chain, ChainFetchError
+from .receipt_waiter import ReceiptWaiter, TransactionRevertedError
+from .attestation_poller import AttestationPoller
 
 __all__ = [
     "BalanceHelper",
     "Assert",
     "broadcast",
+    "FeeOracle",
+    "compute_cctp_fee",
+    "FeeTier",
     "GasEstimator",
+    "GasLimitModel",
+    "AsyncAlchemyFactoryProvider",
+    "BlockScopedCachingProvider",
+    "MetadataStore",
+    "NonceManager",
     "EVMTransaction",
     "CrossChainATokenBalanceHelper",
-]
\ No newline at end of file
+    "ChainStateReader",
+    "ChainSnapshot",
+    "ReserveRateReader",
+    "ReserveRateState",
+    "gather_per_chain",
+    "ChainFetchError",
+    "ReceiptWaiter",
+    "TransactionRevertedError",
+    "AttestationPoller",
+    "NearTxSubmitter",
+    "NearAccessKeyTracker",
+]
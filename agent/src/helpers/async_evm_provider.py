@@ -0,0 +1,58 @@
+from web3 import AsyncWeb3, AsyncHTTPProvider
+
+from near_omni_client.providers.evm import AlchemyFactoryProvider
+from near_omni_client.providers.interfaces.iprovider_factory import IProviderFactory
+from near_omni_client.networks.network import Network
+
+from .read_cache import BlockScopedCachingProvider
+
+
+class AsyncAlchemyFactoryProvider(IProviderFactory):
+    """
+    Async counterpart of `AlchemyFactoryProvider`.
+
+    Returns one `AsyncWeb3` instance per network and keeps it for the lifetime of the
+    process, so every RPC issued for a chain shares the same HTTP session.
+
+    Unless `read_cache_block_ttl_seconds` is 0, providers cache `eth_call`s per block
+    (see `BlockScopedCachingProvider`).
+    """
+
+    def __init__(self, api_key: str, read_cache_block_ttl_seconds: float = 2.0):
+        self.api_key = api_key
+        self.read_cache_block_ttl_seconds = read_cache_block_ttl_seconds
+        self.supported_networks = AlchemyFactoryProvider(api_key=api_key).supported_networks
+        self._providers: dict[Network, AsyncWeb3] = {}
+
+    def get_provider(self, network: Network) -> AsyncWeb3:
+        """Get the AsyncWeb3 instance for the specified Alchemy network."""
+        if not isinstance(network, Network):
+            raise TypeError(f"Expected Network enum, got {type(network)}")
+
+        if network not in self._providers:
+            url = AlchemyFactoryProvider.BASE_URL_TEMPLATE.format(network=network.value, api_key=self.api_key)
+            if self.read_cache_block_ttl_seconds > 0:
+                provider = BlockScopedCachingProvider(url, block_ttl_seconds=self.read_cache_block_ttl_seconds)
+            else:
+                provider = AsyncHTTPProvider(url)
+            self._providers[network] = AsyncWeb3(provider)
+
+        return self._providers[network]
+
+    def is_network_supported(self, network: Network) -> bool:
+        """Check if the network is supported by the Alchemy provider."""
+        return network in self.supported_networks
+
+    def read_cache_stats(self) -> dict[str, dict]:
+        """Hit/miss counters of the read cache, per network."""
+        return {
+            network.value: web3.provider.stats()
+            for network, web3 in self._providers.items()
+            if isinstance(web3.provider, BlockScopedCachingProvider)
+        }
+
+    async def disconnect(self) -> None:
+        """Close the HTTP sessions of every provider created so far."""
+        for web3 in self._providers.values():
+            await web3.provider.disconnect()
+        self._providers.clear()
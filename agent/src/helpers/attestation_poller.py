@@ -0,0 +1,214 @@
+import asyncio
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Optional
+
+import httpx
+from pydantic import ValidationError
+
+from near_omni_client.adapters.cctp.attestation_service import AttestationService
+from near_omni_client.adapters.cctp.attestation_service_types import GetMessagesResponse, Message
+from near_omni_client.networks import Network
+
+# Circle allows 35 requests per second and blocks the caller for 5 minutes when exceeded.
+# https://developers.circle.com/cctp/cctp-apis#rate-limiting
+CIRCLE_MAX_REQUESTS_PER_SECOND = 35
+CIRCLE_RATE_LIMIT_PENALTY_SECONDS = 300
+
+
+@dataclass
+class TrackedBurn:
+    network: Network
+    tx_hash: str
+    started_at: float = field(default_factory=time.monotonic)
+    attempts: int = 0
+    last_status: Optional[str] = None
+    completed_at: Optional[float] = None
+
+    @property
+    def elapsed_seconds(self) -> float:
+        return (self.completed_at or time.monotonic()) - self.started_at
+
+
+class AttestationPoller:
+    """
+    Polls Circle's attestation API asynchronously.
+
+    Several burns can be awaited at the same time: requests share one HTTP client and one
+    rate limiter, each burn backs off with jittered exponential delays, and the observed
+    attestation durations feed an ETA estimate per source network.
+    """
+    timeout_seconds: float = 1800
+    min_backoff_seconds: float = 2
+    max_backoff_seconds: float = 60
+    max_requests_per_second: float = CIRCLE_MAX_REQUESTS_PER_SECOND / 2  # stay well under Circle's limit
+
+    _client: Optional[httpx.AsyncClient] = None
+    _tracked: dict[str, TrackedBurn] = {}
+    _tasks: dict[str, asyncio.Task] = {}
+    # network -> moving average of the attestation duration in seconds
+    _average_duration_by_network: dict[Network, float] = {}
+    _next_request_at: float = 0.0
+    _rate_lock: Optional[asyncio.Lock] = None
+
+    @classmethod
+    def configure(
+        cls,
+        *,
+        timeout_seconds: float = 1800,
+        min_backoff_seconds: float = 2,
+        max_backoff_seconds: float = 60,
+        max_requests_per_second: float = CIRCLE_MAX_REQUESTS_PER_SECOND / 2,
+    ):
+        cls.timeout_seconds = timeout_seconds
+        cls.min_backoff_seconds = min_backoff_seconds
+        cls.max_backoff_seconds = max_backoff_seconds
+        cls.max_requests_per_second = max_requests_per_second
+
+    @classmethod
+    async def wait_for_attestation(cls, network: Network, tx_hash: str) -> Message:
+        """
+        Waits until Circle reports the message of a burn as `complete`.
+
+        Calling it again for a burn that is already being polled joins the existing poll
+        instead of issuing duplicate requests.
+
+        Args:
+            network (Network): The source network of the burn.
+            tx_hash (str): The burn transaction hash (`0x` + 64 hex chars).
+
+        Returns:
+            Message: The attested CCTP message.
+
+        Raises:
+            ValueError: If the network or the hash are not valid.
+            TimeoutError: If the attestation is not complete within `timeout_seconds`.
+        """
+        if network not in AttestationService.network_urls:
+            raise ValueError(f"Unsupported network: {network}")
+        if not isinstance(tx_hash, str) or len(tx_hash) != 66 or not tx_hash.startswith("0x"):
+            raise ValueError(f"Invalid burn transaction hash: {tx_hash}")
+
+        key = tx_hash.lower()
+        if key not in cls._tasks:
+            cls._tracked[key] = TrackedBurn(network=network, tx_hash=tx_hash)
+            cls._tasks[key] = asyncio.create_task(cls._poll(cls._tracked[key]))
+
+        try:
+            return await asyncio.shield(cls._tasks[key])
+        finally:
+            if cls._tasks.get(key) is not None and cls._tasks[key].done():
+                cls._tasks.pop(key, None)
+                cls._tracked.pop(key, None)
+
+    @classmethod
+    def metrics(cls) -> list[dict]:
+        """
+        Returns the state of every burn currently awaited: attempts, last status reported
+        by Circle, elapsed time and the estimated seconds left.
+        """
+        return [
+            {
+                "network": burn.network.value,
+                "tx_hash": burn.tx_hash,
+                "attempts": burn.attempts,
+                "status": burn.last_status,
+                "elapsed_seconds": round(burn.elapsed_seconds, 1),
+                "eta_seconds": cls.eta_seconds(burn),
+            }
+            for burn in cls._tracked.values()
+        ]
+
+    @classmethod
+    def eta_seconds(cls, burn: TrackedBurn) -> Optional[float]:
+        average = cls._average_duration_by_network.get(burn.network)
+        if average is None:
+            return None
+        return round(max(0.0, average - burn.elapsed_seconds), 1)
+
+    @classmethod
+    async def _poll(cls, burn: TrackedBurn) -> Message:
+        url = AttestationService.network_urls[burn.network].format(burn.tx_hash)
+        deadline = burn.started_at + cls.timeout_seconds
+        print(f"Polling attestation for burn {burn.tx_hash} on {burn.network.value}")
+
+        while True:
+            delay = cls._backoff(burn.attempts)
+            burn.attempts += 1
+
+            try:
+                await cls._acquire_rate_slot()
+                response = await cls._get_client().get(url)
+
+                if response.status_code == 200:
+                    message = GetMessagesResponse(**response.json()).messages[0]
+                    burn.last_status = message.status
+
+                    if message.status == "complete":
+                        burn.completed_at = time.monotonic()
+                        cls._record_duration(burn)
+                        print(f"✅ Attestation for {burn.tx_hash} complete after {burn.elapsed_seconds:.1f}s ({burn.attempts} requests)")
+                        return message
+
+                elif response.status_code == 429:
+                    delay = cls._retry_after(response)
+                    burn.last_status = "rate_limited"
+                    print(f"⚠️ Circle rate limit hit, pausing all attestation requests for {delay:.0f}s")
+                    cls._next_request_at = max(cls._next_request_at, time.monotonic() + delay)
+
+                elif response.status_code == 404:
+                    # the burn is not indexed by Circle yet
+                    burn.last_status = "not_found"
+
+                else:
+                    burn.last_status = f"http_{response.status_code}"
+                    print(f"Unhandled attestation response ({response.status_code}): {response.text}")
+
+            except (httpx.HTTPError, ValidationError, ValueError, IndexError) as e:
+                burn.last_status = "error"
+                print(f"Attestation request for {burn.tx_hash} failed: {e!r}")
+
+            if time.monotonic() + delay > deadline:
+                raise TimeoutError(f"Attestation for {burn.tx_hash} not complete after {cls.timeout_seconds}s (last status: {burn.last_status})")
+
+            eta = cls.eta_seconds(burn)
+            print(f"Waiting for attestation of {burn.tx_hash}: status={burn.last_status}, next poll in {delay:.1f}s" + (f", ETA ~{eta:.0f}s" if eta is not None else ""))
+            await asyncio.sleep(delay)
+
+    @classmethod
+    def _backoff(cls, attempt: int) -> float:
+        # exponential growth with "equal jitter": half deterministic, half random
+        ceiling = min(cls.max_backoff_seconds, cls.min_backoff_seconds * (2 ** attempt))
+        return ceiling / 2 + random.uniform(0, ceiling / 2)
+
+    @staticmethod
+    def _retry_after(response: httpx.Response) -> float:
+        try:
+            return float(response.headers["Retry-After"])
+        except (KeyError, ValueError):
+            return CIRCLE_RATE_LIMIT_PENALTY_SECONDS
+
+    @classmethod
+    async def _acquire_rate_slot(cls) -> None:
+        if cls._rate_lock is None:
+            cls._rate_lock = asyncio.Lock()
+
+        async with cls._rate_lock:
+            now = time.monotonic()
+            wait = cls._next_request_at - now
+            if wait > 0:
+                await asyncio.sleep(wait)
+            cls._next_request_at = max(now, cls._next_request_at) + 1 / cls.max_requests_per_second
+
+    @classmethod
+    def _record_duration(cls, burn: TrackedBurn, alpha: float = 0.3) -> None:
+        previous = cls._average_duration_by_network.get(burn.network)
+        duration = burn.elapsed_seconds
+        cls._average_duration_by_network[burn.network] = duration if previous is None else alpha * duration + (1 - alpha) * previous
+
+    @classmethod
+    def _get_client(cls) -> httpx.AsyncClient:
+        if cls._client is None:
+            cls._client = httpx.AsyncClient(timeout=httpx.Timeout(10.0))
+        return cls._client
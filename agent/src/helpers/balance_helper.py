@@ -1,5 +1,5 @@
 from eth_typing import ChecksumAddress
-from web3 import Web3
+from web3 import AsyncWeb3, Web3
 
 USDC_ABI = [
     {
@@ -33,10 +33,10 @@ class BalanceHelper:
     #
 
     @classmethod
-    def get_usdc_vault_balance(cls, web3_instance: Web3, usdc_address: str):
+    async def get_usdc_vault_balance(cls, web3_instance: AsyncWeb3, usdc_address: str):
         cls._ensure_config()
 
-        vault_balance = (
+        vault_balance = await (
             web3_instance.eth.contract(address=Web3.to_checksum_address(usdc_address), abi=USDC_ABI)
             .functions.balanceOf(cls.rebalancer_vault_address)
             .call()
@@ -45,10 +45,10 @@ class BalanceHelper:
         return vault_balance
 
     @classmethod
-    def get_atoken_vault_balance(cls, web3_instance: Web3, atoken_address: str):
+    async def get_atoken_vault_balance(cls, web3_instance: AsyncWeb3, atoken_address: str):
         cls._ensure_config()
 
-        vault_balance = (
+        vault_balance = await (
             web3_instance.eth.contract(address=Web3.to_checksum_address(atoken_address), abi=ATOKEN_ABI)
             .functions.balanceOf(cls.rebalancer_vault_address)
             .call()
@@ -61,10 +61,10 @@ class BalanceHelper:
     #
 
     @classmethod
-    def get_usdc_agent_balance(cls, web3_instance: Web3, usdc_address: str):
+    async def get_usdc_agent_balance(cls, web3_instance: AsyncWeb3, usdc_address: str):
         cls._ensure_config()
 
-        agent_balance = (
+        agent_balance = await (
             web3_instance.eth.contract(address=Web3.to_checksum_address(usdc_address), abi=USDC_ABI)
             .functions.balanceOf(cls.agent_address)
             .call()
@@ -73,10 +73,10 @@ class BalanceHelper:
         return agent_balance
 
     @classmethod
-    def get_atoken_agent_balance(cls, web3_instance: Web3, atoken_address: str):
+    async def get_atoken_agent_balance(cls, web3_instance: AsyncWeb3, atoken_address: str):
         cls._ensure_config()
 
-        agent_balance = (
+        agent_balance = await (
             web3_instance.eth.contract(address=Web3.to_checksum_address(atoken_address), abi=ATOKEN_ABI)
             .functions.balanceOf(cls.agent_address)
             .call()
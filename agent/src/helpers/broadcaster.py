@@ -1,3 +1,9 @@
+from .evm_transaction import decode_signed_tx
+from .gas_limit_model import GasLimitModel
+from .nonce_manager import NonceManager
+
+# node errors meaning the local nonce is out of sync with the chain
+NONCE_ERROR_MARKERS = ("nonce too low", "nonce too high", "replacement transaction underpriced", "already known")
 
 # Mapping of known explorers for direct transaction links
 EXPLORERS = {
@@ -12,15 +18,17 @@ EXPLORERS = {
     11155420: "https://sepolia-optimism.etherscan.io/tx/",
 }
 
-def broadcast(web3, payload: bytes) -> str:
+async def broadcast(web3, payload: bytes) -> str:
     """
-    Broadcasts a raw transaction through the given Web3 provider.
+    Broadcasts a raw transaction through the given AsyncWeb3 provider.
 
     This function:
       - Verifies the provider is initialized
       - Sends the raw transaction
-      - Detects the chain_id automatically
+      - Detects the chain_id from the signed payload
       - Prints a link to the corresponding block explorer (if available)
+      - Keeps the NonceManager in sync with what was (or failed to be) broadcast
+      - Registers the tx with the GasLimitModel, which learns from its receipt
       - Raises exceptions on failure (for state-machine error propagation)
 
     Returns:
@@ -33,13 +41,22 @@ def broadcast(web3, payload: bytes) -> str:
     if not web3:
         raise ValueError("Web3 provider not initialized.")
 
+    try:
+        tx = decode_signed_tx(payload)
+    except Exception:
+        tx = None  # not a typed tx; nothing to track
+
     try:
         # Send the transaction
-        tx_hash = web3.eth.send_raw_transaction(payload)
+        tx_hash = await web3.eth.send_raw_transaction(payload)
         hex_hash = tx_hash.hex()
 
-        # Detect chain and build explorer link
-        chain_id = getattr(web3.eth, "chain_id", None)
+        chain_id = tx["chainId"] if tx else await web3.eth.chain_id
+        if tx:
+            NonceManager.mark_broadcast(chain_id, tx["nonce"])
+            GasLimitModel.track(tx_hash, GasLimitModel.key(chain_id, tx.get("to"), tx.get("data", b"")))
+
+        # Build explorer link
         explorer_base = EXPLORERS.get(chain_id)
         explorer_link = f"{explorer_base}0x{hex_hash}" if explorer_base else None
 
@@ -53,4 +70,9 @@ def broadcast(web3, payload: bytes) -> str:
         return hex_hash
 
     except Exception as e:
+        if tx and any(marker in str(e).lower() for marker in NONCE_ERROR_MARKERS):
+            # @dev the node has a different view of the nonce, re-read it for the next tx
+            NonceManager.invalidate(tx["chainId"])
+        elif tx:
+            NonceManager.release(tx["chainId"], tx["nonce"])
         raise RuntimeError(f"Error broadcasting transaction: {e}") from e
\ No newline at end of file
@@ -0,0 +1,24 @@
+import asyncio
+
+from near_omni_client.adapters.cctp.fee_service import FeeService
+from near_omni_client.networks import Network
+
+BUFFER = 1.05  # 5% buffer over the minimum fee quoted by Circle
+
+
+async def compute_cctp_fee(from_network: Network, to_network: Network, amount: int, max_bridge_fee: int) -> int:
+    """
+    CCTP fee of bridging `amount` (USDC base units) from `from_network` to `to_network`: the
+    minimum fee of the route (basis points) plus a 5% buffer, capped at `max_bridge_fee`.
+
+    Used both to set the burn `max_fee` (ComputeCctpFees) and to estimate a route's cost
+    before executing it, so the estimate is what is actually paid.
+    """
+    domain = int(to_network.domain)
+    # @dev the fee service is synchronous, keep it off the event loop
+    fees = await asyncio.to_thread(FeeService(from_network).get_fees, destination_domain_id=domain)
+
+    raw_fee = int((fees.minimumFee * amount // 10_000) * BUFFER)
+    print(f"CCTP minimum fee for destination domain {domain}: {fees.minimumFee}, fee for amount {amount}: {raw_fee}")
+
+    return min(raw_fee, max_bridge_fee)
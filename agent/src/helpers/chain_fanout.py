@@ -0,0 +1,75 @@
+import asyncio
+import time
+from typing import Awaitable, Callable, Iterable, TypeVar
+
+T = TypeVar("T")
+
+
+class ChainFetchError(Exception):
+    """
+    Raised when one or more chains fail (or time out) during a per-chain fan-out.
+
+    Attributes:
+        label (str): What was being fetched, for logs.
+        failures (dict[int, BaseException]): chain_id -> the error raised for that chain.
+        results (dict[int, T]): chain_id -> value for the chains that did succeed.
+    """
+    def __init__(self, label: str, failures: dict[int, BaseException], results: dict):
+        self.label = label
+        self.failures = failures
+        self.results = results
+        details = ", ".join(f"chain_id={chain_id}: {error!r}" for chain_id, error in failures.items())
+        super().__init__(f"{label} failed on {len(failures)} chain(s): {details}")
+
+
+async def gather_per_chain(
+    chain_ids: Iterable[int],
+    fetch: Callable[[int], Awaitable[T]],
+    *,
+    timeout_seconds: float,
+    label: str,
+) -> dict[int, T]:
+    """
+    Runs `fetch(chain_id)` for every chain concurrently, each one bounded by its own timeout.
+
+    All chains are always awaited to completion, so a slow or failing chain never hides the
+    outcome of the others.
+
+    Args:
+        chain_ids (Iterable[int]): The chains to fetch.
+        fetch (Callable[[int], Awaitable[T]]): Coroutine function fetching the data of one chain.
+        timeout_seconds (float): Maximum time given to each chain.
+        label (str): Human readable name of the fetch, used in logs and errors.
+
+    Returns:
+        dict[int, T]: chain_id -> fetched value, in the order of `chain_ids`.
+
+    Raises:
+        ChainFetchError: If at least one chain failed or timed out.
+    """
+    chain_ids = list(chain_ids)
+
+    async def _timed(chain_id: int) -> T:
+        started_at = time.perf_counter()
+        try:
+            return await asyncio.wait_for(fetch(chain_id), timeout=timeout_seconds)
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"timed out after {timeout_seconds}s")
+        finally:
+            print(f"⏱ {label} on chain_id={chain_id} took {time.perf_counter() - started_at:.2f}s")
+
+    outcomes = await asyncio.gather(*(_timed(chain_id) for chain_id in chain_ids), return_exceptions=True)
+
+    results: dict[int, T] = {}
+    failures: dict[int, BaseException] = {}
+    for chain_id, outcome in zip(chain_ids, outcomes):
+        if isinstance(outcome, BaseException):
+            print(f"❌ {label} failed on chain_id={chain_id}: {outcome!r}")
+            failures[chain_id] = outcome
+        else:
+            results[chain_id] = outcome
+
+    if failures:
+        raise ChainFetchError(label, failures, results)
+
+    return results
@@ -0,0 +1,122 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict
+
+from eth_typing import ChecksumAddress
+from web3 import AsyncWeb3, Web3
+
+from adapters import Multicall
+from adapters.abis import LENDING_POOL_ABI, USDC_ABI
+
+from .metadata_store import MetadataStore
+
+ATOKEN_ABI = USDC_ABI
+
+
+@dataclass
+class ChainSnapshot:
+    chain_id: int
+    a_token_address: ChecksumAddress
+    reserve_data: Any
+    a_token_vault_balance: int
+    a_token_agent_balance: int
+    usdc_vault_balance: int
+    usdc_agent_balance: int
+    # spender address -> USDC allowance granted by the agent
+    allowances: Dict[ChecksumAddress, int] = field(default_factory=dict)
+
+    def allowance(self, spender: str) -> int:
+        return self.allowances[Web3.to_checksum_address(spender)]
+
+
+class ChainStateReader:
+    """
+    Reads every per-chain value the engine needs (reserve data, aToken and USDC balances
+    of the vault and the agent, and the agent's USDC allowances) in a single Multicall3
+    `aggregate3` call.
+    """
+    rebalancer_vault_address: ChecksumAddress | None = None
+    agent_address: ChecksumAddress | None = None
+
+    @classmethod
+    def configure(cls, *, rebalancer_vault_address: str, agent_address: str):
+        cls.rebalancer_vault_address = Web3.to_checksum_address(rebalancer_vault_address)
+        cls.agent_address = Web3.to_checksum_address(agent_address)
+
+    @classmethod
+    def _ensure_config(cls):
+        if cls.rebalancer_vault_address is None or cls.agent_address is None:
+            raise RuntimeError("ChainStateReader not configured. Call ChainStateReader.configure() first.")
+
+    @classmethod
+    async def read(cls, web3_instance: AsyncWeb3, chain_id: int, chain_config: dict) -> ChainSnapshot:
+        """
+        Reads the snapshot of a chain.
+
+        Args:
+            web3_instance (AsyncWeb3): Initialized Web3 instance connected to the chain.
+            chain_id (int): The chain id, used to remember the aToken address between runs.
+            chain_config (dict): The remote config of the chain (as returned by `get_all_configs`).
+
+        Returns:
+            ChainSnapshot: All balances and allowances read at the same block.
+        """
+        cls._ensure_config()
+
+        lending_pool_address = Web3.to_checksum_address(chain_config["aave"]["lending_pool_address"])
+        usdc_address = Web3.to_checksum_address(chain_config["aave"]["asset"])
+        spenders = [
+            Web3.to_checksum_address(chain_config["cctp"]["messenger_address"]),
+            lending_pool_address,
+            cls.rebalancer_vault_address,
+        ]
+
+        lending_pool = web3_instance.eth.contract(address=lending_pool_address, abi=LENDING_POOL_ABI)
+        usdc = web3_instance.eth.contract(address=usdc_address, abi=USDC_ABI)
+
+        calls = [
+            lending_pool.functions.getReserveData(usdc_address),
+            usdc.functions.balanceOf(cls.rebalancer_vault_address),
+            usdc.functions.balanceOf(cls.agent_address),
+            *[usdc.functions.allowance(cls.agent_address, spender) for spender in spenders],
+        ]
+
+        # @dev the aToken address is only known after the first read of the reserve data,
+        # from then on (it is persisted) its balances travel in the same batch as everything else
+        a_token_address = MetadataStore.get_a_token_address(chain_id)
+        if a_token_address:
+            a_token = web3_instance.eth.contract(address=a_token_address, abi=ATOKEN_ABI)
+            calls += [
+                a_token.functions.balanceOf(cls.rebalancer_vault_address),
+                a_token.functions.balanceOf(cls.agent_address),
+            ]
+
+        results = await Multicall.aggregate3(web3_instance, calls)
+
+        reserve_data, usdc_vault_balance, usdc_agent_balance = results[0:3]
+        allowances = dict(zip(spenders, results[3:3 + len(spenders)]))
+
+        if int(reserve_data[8], 16) == 0:
+            raise ValueError(f"Failed to resolve aToken for chain_id={chain_id}")
+
+        resolved_a_token_address = Web3.to_checksum_address(reserve_data[8])
+
+        if a_token_address == resolved_a_token_address:
+            a_token_vault_balance, a_token_agent_balance = results[3 + len(spenders):]
+        else:
+            MetadataStore.set_a_token_address(chain_id, resolved_a_token_address)
+            a_token = web3_instance.eth.contract(address=resolved_a_token_address, abi=ATOKEN_ABI)
+            a_token_vault_balance, a_token_agent_balance = await Multicall.aggregate3(web3_instance, [
+                a_token.functions.balanceOf(cls.rebalancer_vault_address),
+                a_token.functions.balanceOf(cls.agent_address),
+            ])
+
+        return ChainSnapshot(
+            chain_id=chain_id,
+            a_token_address=resolved_a_token_address,
+            reserve_data=reserve_data,
+            a_token_vault_balance=a_token_vault_balance,
+            a_token_agent_balance=a_token_agent_balance,
+            usdc_vault_balance=usdc_vault_balance,
+            usdc_agent_balance=usdc_agent_balance,
+            allowances=allowances,
+        )
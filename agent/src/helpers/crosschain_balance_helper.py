@@ -1,11 +1,14 @@
 from eth_typing import ChecksumAddress
 from web3 import Web3
 
-from near_omni_client.providers.evm import AlchemyFactoryProvider
+from near_omni_client.providers.interfaces.iprovider_factory import IProviderFactory
 
 from adapters import LendingPool
 from utils import from_chain_id_to_network
 
+from .chain_fanout import gather_per_chain
+from .metadata_store import MetadataStore
+
 ATOKEN_ABI = [
     {
         "constant": True,
@@ -22,43 +25,51 @@ class CrossChainATokenBalanceHelper:
 
     _agent: ChecksumAddress
     _source_chain_id: int
-    _evm_factory_provider: AlchemyFactoryProvider
+    _evm_factory_provider: IProviderFactory
+    _read_timeout_seconds: float = 30
 
     # chain_id -> aToken address (ONLY non-source chains)
     _a_token_by_chain: dict[int, ChecksumAddress] = {}
 
     @classmethod
-    def configure(
+    async def configure(
         cls,
         *,
         agent_address: str,
         source_chain_id: int,
         supported_chains: list[int],
         remote_configs: dict[int, dict],
-        evm_factory_provider: AlchemyFactoryProvider,
+        evm_factory_provider: IProviderFactory,
+        read_timeout_seconds: float = 30,
     ) -> None:
         cls._agent = Web3.to_checksum_address(agent_address)
         cls._source_chain_id = source_chain_id
         cls._a_token_by_chain = {}
         cls._evm_factory_provider = evm_factory_provider
+        cls._read_timeout_seconds = read_timeout_seconds
 
         for chain_id in supported_chains:
             if chain_id == source_chain_id:
                 continue  # 👈 agent doesn't hold aTokens on source chain
 
-            network_id = from_chain_id_to_network(chain_id)
-            web3 = evm_factory_provider.get_provider(network_id)
-
-            lending_pool = remote_configs[chain_id]["aave"]["lending_pool_address"]
-            usdc = remote_configs[chain_id]["aave"]["asset"]
+            a_token_address = MetadataStore.get_a_token_address(chain_id)
 
-            a_token_address = LendingPool.get_atoken_address(
-                web3_instance=web3,
-                lending_pool_address=lending_pool,
-                asset_address=usdc,
-            )
             if not a_token_address:
-                raise ValueError(f"Failed to resolve aToken for chain_id={chain_id}")
+                network_id = from_chain_id_to_network(chain_id)
+                web3 = evm_factory_provider.get_provider(network_id)
+
+                lending_pool = remote_configs[chain_id]["aave"]["lending_pool_address"]
+                usdc = remote_configs[chain_id]["aave"]["asset"]
+
+                a_token_address = await LendingPool.get_atoken_address(
+                    web3_instance=web3,
+                    lending_pool_address=lending_pool,
+                    asset_address=usdc,
+                )
+                if not a_token_address:
+                    raise ValueError(f"Failed to resolve aToken for chain_id={chain_id}")
+
+                MetadataStore.set_a_token_address(chain_id, a_token_address)
 
             cls._a_token_by_chain[chain_id] = Web3.to_checksum_address(a_token_address)
 
@@ -70,24 +81,27 @@ class CrossChainATokenBalanceHelper:
             raise RuntimeError("CrossChainATokenBalanceHelper not configured")
 
     @classmethod
-    def get_total_cross_chain_balance(cls) -> int:
+    async def get_total_cross_chain_balance(cls) -> int:
         """
         Sums aToken balances of AGENT across all NON-source chains.
         """
         cls._ensure()
 
-        total = 0
-
-        for chain_id, a_token in cls._a_token_by_chain.items():
+        async def fetch_balance(chain_id: int) -> int:
             network_id = from_chain_id_to_network(chain_id)
             web3 = cls._evm_factory_provider.get_provider(network_id)
 
-            balance = (
-                web3.eth.contract(address=a_token, abi=ATOKEN_ABI)
+            return await (
+                web3.eth.contract(address=cls._a_token_by_chain[chain_id], abi=ATOKEN_ABI)
                 .functions.balanceOf(cls._agent)
                 .call()
             )
 
-            total += balance
+        balances = await gather_per_chain(
+            cls._a_token_by_chain.keys(),
+            fetch_balance,
+            timeout_seconds=cls._read_timeout_seconds,
+            label="get_total_cross_chain_balance",
+        )
 
-        return total
\ No newline at end of file
+        return sum(balances.values())
\ No newline at end of file
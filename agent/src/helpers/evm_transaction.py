@@ -1,11 +1,15 @@
-from typing import List, Optional
+import asyncio
+from typing import Awaitable, List, Optional
 from dataclasses import dataclass
 
-from web3 import Web3
+from eth_account.typed_transactions import TypedTransaction
+from hexbytes import HexBytes
 from near_omni_client.providers.interfaces.iprovider_factory import IProviderFactory
 from near_omni_client.networks import Network
 
 from .gas_estimator import GasEstimator
+from .metadata_store import MetadataStore
+from .nonce_manager import NonceManager
 
 @dataclass
 class EVMTransaction:
@@ -45,20 +49,31 @@ def get_empty_tx_for_chain(chain_id: int) -> EVMTransaction:
         access_list=[]
     )
 
-def create_partial_tx(
+async def create_partial_tx(
     network: Network,
     agent_address: str,
     evm_factory_provider: IProviderFactory,
     gas_estimator: GasEstimator,
-    gas_limit: int = 0
+    gas_limit: int = 0,
+    urgency: str = "normal",
 ) -> EVMTransaction:
     web3 = evm_factory_provider.get_provider(network=network)
     if not web3:
         raise ValueError("Web3 provider is not initialized.")
 
-    chain_id = web3.eth.chain_id
-    nonce = web3.eth.get_transaction_count(Web3.to_checksum_address(agent_address), block_identifier="pending")
-    fees = gas_estimator.get_eip1559_fees(network=network)
+    chain_id = await MetadataStore.resolve_chain_id(web3, network)
+    nonce, fees = await asyncio.gather(
+        NonceManager.reserve(web3, chain_id, agent_address),
+        gas_estimator.get_eip1559_fees(network=network, urgency=urgency),
+        return_exceptions=True,
+    )
+    if isinstance(fees, BaseException):
+        # @dev the reserved nonce will never be broadcast, give it back
+        if not isinstance(nonce, BaseException):
+            NonceManager.release(chain_id, nonce)
+        raise fees
+    if isinstance(nonce, BaseException):
+        raise nonce
     
     tx = EVMTransaction(
         chain_id=chain_id,
@@ -71,4 +86,43 @@ def create_partial_tx(
         input=[],        
         access_list=[],  
     )
-    return tx
\ No newline at end of file
+    return tx
+
+async def assemble_partial_tx(
+    network: Network,
+    agent_address: str,
+    evm_factory_provider: IProviderFactory,
+    gas_estimator: GasEstimator,
+    to: str,
+    input_payload: Awaitable[bytes],
+    urgency: str = "normal",
+) -> EVMTransaction:
+    """
+    Builds the partial transaction of a step, fetching its independent inputs concurrently:
+      - the calldata (`input_payload`, usually a NEAR `build_*` view) followed by the gas limit,
+        which needs the calldata
+      - chain id, nonce and fees (`create_partial_tx`), which do not
+    """
+    async def _estimate_gas_limit() -> int:
+        return await gas_estimator.estimate_gas_limit(network, agent_address, to, await input_payload)
+
+    gas_limit, tx = await asyncio.gather(
+        _estimate_gas_limit(),
+        create_partial_tx(network, agent_address, evm_factory_provider, gas_estimator, urgency=urgency),
+        return_exceptions=True,
+    )
+    if isinstance(gas_limit, BaseException):
+        if not isinstance(tx, BaseException):
+            NonceManager.release(tx.chain_id, tx.nonce)
+        raise gas_limit
+    if isinstance(tx, BaseException):
+        raise tx
+    tx.gas_limit = gas_limit
+    return tx
+
+def decode_signed_tx(payload: bytes) -> dict:
+    """
+    Decodes a signed typed (EIP-2718) transaction, e.g. the EIP-1559 payloads signed by the
+    rebalancer contract, into its fields (chainId, nonce, to, data, gas, ...).
+    """
+    return TypedTransaction.from_bytes(HexBytes(payload)).as_dict()
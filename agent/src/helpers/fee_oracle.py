@@ -0,0 +1,178 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from statistics import median
+from typing import Optional
+
+from web3 import AsyncWeb3
+
+from near_omni_client.providers.interfaces.iprovider_factory import IProviderFactory
+from near_omni_client.networks.network import Network
+
+GWEI = 10**9
+
+
+@dataclass(frozen=True)
+class FeeTier:
+    """
+    How aggressively a transaction bids for inclusion.
+
+    - reward_percentile: percentile of the priority fees paid in recent blocks to bid
+    - base_fee_multiplier: headroom over the current base fee in `max_fee_per_gas`
+    - min_priority_gwei / max_priority_gwei: clamp applied to the priority fee
+    """
+    reward_percentile: int
+    base_fee_multiplier: float
+    min_priority_gwei: float = 1
+    max_priority_gwei: float = 5
+
+
+DEFAULT_FEE_TIERS: dict[str, FeeTier] = {
+    "low": FeeTier(reward_percentile=25, base_fee_multiplier=1.5),
+    "normal": FeeTier(reward_percentile=50, base_fee_multiplier=2),
+    "urgent": FeeTier(reward_percentile=90, base_fee_multiplier=3, max_priority_gwei=10),
+}
+
+
+@dataclass
+class FeeEstimate:
+    block_number: int
+    fetched_at: float
+    fees_by_tier: dict[str, dict]
+
+
+class FeeOracle:
+    """
+    Keeps an EIP-1559 fee estimate per network, refreshed in the background on every new block.
+
+    The first request for a network fetches the estimate inline and starts a watcher that polls
+    `eth_blockNumber` every `poll_interval_seconds` and re-reads `eth_feeHistory` when the block
+    changes. Later requests are answered from memory. A watcher stops by itself after
+    `idle_seconds` without requests, so nothing is polled between agent runs.
+
+    An estimate older than `max_age_seconds` (e.g. the watcher is failing) is refreshed inline.
+
+    `tiers` adds to or overrides the `DEFAULT_FEE_TIERS` ("low", "normal", "urgent").
+    """
+
+    def __init__(
+        self,
+        evm_factory_provider: IProviderFactory,
+        tiers: Optional[dict[str, FeeTier]] = None,
+        poll_interval_seconds: float = 2.0,
+        max_age_seconds: float = 30.0,
+        idle_seconds: float = 120.0,
+    ):
+        self.evm_factory_provider = evm_factory_provider
+        self.tiers = {**DEFAULT_FEE_TIERS, **(tiers or {})}
+        self.poll_interval_seconds = poll_interval_seconds
+        self.max_age_seconds = max_age_seconds
+        self.idle_seconds = idle_seconds
+
+        self._estimates: dict[Network, FeeEstimate] = {}
+        self._watchers: dict[Network, asyncio.Task] = {}
+        self._last_requested_at: dict[Network, float] = {}
+        self._refresh_locks: dict[Network, asyncio.Lock] = {}
+
+    async def get_fees(self, network: Network, urgency: str = "normal") -> dict:
+        """
+        Returns the fees of the `urgency` tier for the next block on `network`.
+        """
+        if urgency not in self.tiers:
+            raise ValueError(f"Unknown fee urgency '{urgency}'. Expected one of {list(self.tiers)}.")
+
+        self._last_requested_at[network] = time.monotonic()
+
+        estimate = self._estimates.get(network)
+        if estimate is None or time.monotonic() - estimate.fetched_at > self.max_age_seconds:
+            estimate = await self._refresh(network)
+
+        self._ensure_watcher(network)
+
+        return dict(estimate.fees_by_tier[urgency])
+
+    async def stop(self) -> None:
+        """Cancels every background watcher."""
+        watchers = list(self._watchers.values())
+        self._watchers.clear()
+        for task in watchers:
+            task.cancel()
+        await asyncio.gather(*watchers, return_exceptions=True)
+
+    def _ensure_watcher(self, network: Network) -> None:
+        task = self._watchers.get(network)
+        if task is None or task.done():
+            self._watchers[network] = asyncio.create_task(self._watch(network))
+
+    async def _watch(self, network: Network) -> None:
+        web3 = self._get_web3(network)
+
+        while time.monotonic() - self._last_requested_at.get(network, 0.0) < self.idle_seconds:
+            await asyncio.sleep(self.poll_interval_seconds)
+            try:
+                block_number = await web3.eth.block_number
+                estimate = self._estimates.get(network)
+                if estimate is None or block_number > estimate.block_number:
+                    await self._refresh(network)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"⚠️ Fee oracle refresh failed on {network.value}: {e}")
+
+        self._watchers.pop(network, None)
+
+    async def _refresh(self, network: Network) -> FeeEstimate:
+        lock = self._refresh_locks.setdefault(network, asyncio.Lock())
+        requested_at = time.monotonic()
+
+        async with lock:
+            # another caller may have refreshed it while we waited for the lock
+            estimate = self._estimates.get(network)
+            if estimate is not None and estimate.fetched_at >= requested_at:
+                return estimate
+
+            web3 = self._get_web3(network)
+            percentiles = sorted({tier.reward_percentile for tier in self.tiers.values()})
+            history = await web3.eth.fee_history(5, "latest", reward_percentiles=percentiles)
+
+            base_fee = history["baseFeePerGas"][-1]
+            rewards = [r for r in history.get("reward", []) if r]
+            fallback_priority = None
+            if not rewards:
+                # Priority fee: no rewards in the history, use eth_maxPriorityFeePerGas if available
+                try:
+                    fallback_priority = await web3.eth.max_priority_fee
+                except Exception:
+                    fallback_priority = 2 * GWEI
+
+            fees_by_tier = {}
+            for name, tier in self.tiers.items():
+                if rewards:
+                    column = percentiles.index(tier.reward_percentile)
+                    priority = int(median(r[column] for r in rewards))
+                else:
+                    priority = fallback_priority
+
+                # Clamp priority fee to the range allowed by the tier
+                priority = max(int(tier.min_priority_gwei * GWEI), min(priority, int(tier.max_priority_gwei * GWEI)))
+
+                # Max fee with a safety margin to avoid being left out if baseFee rises
+                max_fee = int(base_fee * tier.base_fee_multiplier) + priority
+
+                fees_by_tier[name] = {
+                    "base_fee_per_gas": int(base_fee),
+                    "max_priority_fee_per_gas": int(priority),
+                    "max_fee_per_gas": int(max_fee),
+                }
+
+            # fee_history reports the base fee of the block after `latest`
+            block_number = history["oldestBlock"] + len(history["baseFeePerGas"]) - 2
+            estimate = FeeEstimate(block_number=block_number, fetched_at=time.monotonic(), fees_by_tier=fees_by_tier)
+            self._estimates[network] = estimate
+            return estimate
+
+    def _get_web3(self, network: Network) -> AsyncWeb3:
+        web3 = self.evm_factory_provider.get_provider(network=network)
+        if not web3:
+            raise ValueError("Web3 provider is not initialized.")
+        return web3
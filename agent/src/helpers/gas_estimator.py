@@ -1,14 +1,23 @@
+from typing import Optional
+
 from web3 import Web3
-from statistics import median
 
-from near_omni_client.providers.evm.alchemy_provider import AlchemyFactoryProvider
+from near_omni_client.providers.interfaces.iprovider_factory import IProviderFactory
 from near_omni_client.networks.network import Network
 
+from .fee_oracle import FeeOracle
+from .gas_limit_model import GasLimitModel
+from .metadata_store import MetadataStore
+
 class GasEstimator:
-    def __init__(self, evm_factory_provider: AlchemyFactoryProvider):
+    def __init__(self, evm_factory_provider: IProviderFactory, fee_oracle: Optional[FeeOracle] = None, validate_every: int = 10):
         self.evm_factory_provider = evm_factory_provider
+        self.fee_oracle = fee_oracle or FeeOracle(evm_factory_provider=evm_factory_provider)
+        self.validate_every = validate_every
+        # key -> number of times a learned gas limit was requested
+        self._learned_served: dict[str, int] = {}
 
-    def estimate_gas_limit(
+    async def estimate_gas_limit(
         self,
         network: Network,
         from_address: str,
@@ -18,13 +27,26 @@ class GasEstimator:
         buffer: float = 1.2
     ) -> int:
         """
-        Estimate gas limit for a transaction by simulating it.
-        Adds a safety buffer (default 20%).
+        Gas limit for a transaction.
+
+        Served from the GasLimitModel when it has learned the (chain, contract, method) from
+        previous receipts. Otherwise, and on every `validate_every`-th use of a learned value,
+        the transaction is simulated and a safety buffer (default 20%) is added.
         """
         web3 = self.evm_factory_provider.get_provider(network=network)
         if not web3:
             raise ValueError("Web3 provider is not initialized.")
 
+        chain_id = await MetadataStore.resolve_chain_id(web3, network)
+        key = GasLimitModel.key(chain_id, to_address, data)
+        learned = GasLimitModel.suggest(key)
+
+        if learned is not None:
+            self._learned_served[key] = self._learned_served.get(key, 0) + 1
+            if self._learned_served[key] % self.validate_every != 0:
+                print(f"Using learned gas limit for {key}: {learned}")
+                return learned
+
         tx = {
             "from": Web3.to_checksum_address(from_address),
             "to": Web3.to_checksum_address(to_address) if to_address else None,
@@ -33,43 +55,32 @@ class GasEstimator:
         }
         print(f"Estimating gas for tx: {tx}")
         try:
-            estimate = web3.eth.estimate_gas(tx)
+            estimate = await web3.eth.estimate_gas(tx)
         except Exception as e:
+            if learned is not None:
+                print(f"Gas estimation failed: {e}, using learned gas limit {learned}")
+                return learned
             # fallback to a safe default if estimation fails
             print(f"Gas estimation failed: {e}, using default 500,000")
             return 500000
 
+        if learned is not None:
+            # validation path: never go below what the simulation says
+            if estimate > learned:
+                print(f"Learned gas limit {learned} for {key} is below the estimate {estimate}; using the estimate.")
+                return int(estimate * buffer)
+            return learned
+
         # add buffer and return as int
         return int(estimate * buffer)
     
-    def get_eip1559_fees(self, network: Network) -> dict:
+    async def get_eip1559_fees(self, network: Network, urgency: str = "normal") -> dict:
         """
         Get EIP-1559 fees for the next block on the specified EVM network.
-        This method retrieves the base fee and priority fee for the next block,
-        and calculates the max fee per gas with a safety margin.
-        """
-        web3 = self.evm_factory_provider.get_provider(network=network)
-        if not web3:
-            raise ValueError("Web3 provider is not initialized.")
-       
-        history = web3.eth.fee_history(5, "latest", reward_percentiles=[50])
-        base_fee = history["baseFeePerGas"][-1]
-
-        # Priority fee: tries to use eth_maxPriorityFeePerGas, if not, uses median from history
-        try:
-            priority = web3.eth.max_priority_fee
-        except Exception:
-            rewards = [r[0] for r in history["reward"] if r]
-            priority = int(median(rewards)) if rewards else web3.to_wei(2, "gwei")
+        The estimate is served by the FeeOracle, which keeps it fresh in the background,
+        so this is normally answered from memory.
 
-        # Clamp priority fee to a range between 1 gwei and 5 gwei
-        priority = max(web3.to_wei(1, "gwei"), min(priority, web3.to_wei(5, "gwei")))
-
-        # Max fee with a safety margin x2 to avoid being left out if baseFee rises
-        max_fee = base_fee * 2 + priority
-
-        return {
-            "base_fee_per_gas": int(base_fee),
-            "max_priority_fee_per_gas": int(priority),
-            "max_fee_per_gas": int(max_fee),
-        }
\ No newline at end of file
+        `urgency` selects a fee tier of the oracle, e.g. "low" for approvals and "urgent"
+        for transactions that should be included in the next blocks.
+        """
+        return await self.fee_oracle.get_fees(network=network, urgency=urgency)
@@ -0,0 +1,103 @@
+import json
+import math
+import os
+from typing import Optional
+
+from hexbytes import HexBytes
+from web3 import Web3
+
+
+class GasLimitModel:
+    """
+    Learns the gas limit of the agent's transactions from their receipts.
+
+    Samples of `gasUsed` are kept per (chain id, contract, method selector), the last
+    `max_samples` of each, and persisted to `path` so they survive restarts. Once a key has
+    `min_samples`, `suggest` returns the `percentile` of the samples plus `buffer`, which lets
+    the GasEstimator skip `eth_estimateGas`.
+
+    Transactions are registered with `track` when they are broadcast and recorded when
+    `observe_receipt` sees them confirmed. A revert drops the samples of its key so the next
+    transaction is estimated again.
+    """
+    path: Optional[str] = None
+    max_samples: int = 50
+    min_samples: int = 3
+    percentile: float = 95
+    buffer: float = 0.1
+
+    # "chain_id:to:selector" -> gasUsed samples, oldest first
+    _samples: dict[str, list[int]] = {}
+    # tx hash -> key of the transactions broadcast but not observed yet
+    _pending: dict[str, str] = {}
+
+    @classmethod
+    def load(cls, *, path: str) -> None:
+        cls.path = path
+        cls._samples = {}
+
+        if not os.path.exists(path):
+            return
+
+        try:
+            with open(path) as f:
+                data = json.load(f)
+            cls._samples = {key: [int(v) for v in values] for key, values in data.get("samples", {}).items()}
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Could not read gas limit model at {path} ({e}); starting empty.")
+            return
+
+        print(f"Loaded gas limit model from {path}: {len(cls._samples)} action(s).")
+
+    @staticmethod
+    def key(chain_id: int, to: Optional[str], data: bytes | str) -> str:
+        selector = HexBytes(data)[:4].hex()
+        to = Web3.to_checksum_address(to) if to else "create"
+        return f"{chain_id}:{to}:{selector}"
+
+    @classmethod
+    def suggest(cls, key: str) -> Optional[int]:
+        """Returns the learned gas limit of `key`, or None when there are not enough samples yet."""
+        samples = cls._samples.get(key, [])
+        if len(samples) < cls.min_samples:
+            return None
+
+        ordered = sorted(samples)
+        index = min(len(ordered) - 1, math.ceil(cls.percentile / 100 * len(ordered)) - 1)
+        return int(ordered[index] * (1 + cls.buffer))
+
+    @classmethod
+    def track(cls, tx_hash: str | bytes, key: str) -> None:
+        cls._pending[HexBytes(tx_hash).hex()] = key
+
+    @classmethod
+    def observe_receipt(cls, tx_hash: str | bytes, receipt: dict) -> None:
+        key = cls._pending.pop(HexBytes(tx_hash).hex(), None)
+        if key is None:
+            return  # not broadcast by this process (e.g. resumed after a restart)
+
+        if receipt["status"] == 0:
+            if cls._samples.pop(key, None) is not None:
+                print(f"⚠️ Tx reverted for {key}; dropping its learned gas limit.")
+                cls._save()
+            return
+
+        samples = cls._samples.setdefault(key, [])
+        samples.append(int(receipt["gasUsed"]))
+        del samples[:-cls.max_samples]
+        cls._save()
+
+    @classmethod
+    def _save(cls) -> None:
+        if cls.path is None:
+            return  # not loaded, keep values in memory only
+
+        directory = os.path.dirname(cls.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # write then rename, so a crash never leaves a truncated file behind
+        tmp_path = f"{cls.path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"samples": cls._samples}, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, cls.path)
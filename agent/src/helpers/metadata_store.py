@@ -0,0 +1,105 @@
+import hashlib
+import json
+import os
+from typing import Any, Optional
+
+from eth_typing import ChecksumAddress
+from web3 import AsyncWeb3, Web3
+
+from near_omni_client.networks import Network
+
+
+class MetadataStore:
+    """
+    On-disk store for chain metadata that does not change between runs: the chain id
+    reported by each RPC endpoint and the aToken address of every chain.
+
+    The store is tied to a fingerprint of the NEAR `get_all_configs` result and is wiped
+    whenever the remote configuration changes.
+    """
+    path: Optional[str] = None
+    configs_hash: Optional[str] = None
+
+    # network value -> chain id reported by the RPC
+    _chain_ids: dict[str, int] = {}
+    # chain id -> aToken address
+    _a_tokens: dict[int, ChecksumAddress] = {}
+
+    @classmethod
+    def load(cls, *, path: str, remote_configs: dict) -> None:
+        """
+        Loads the store from `path`, discarding its content if it was built for a different
+        remote configuration.
+        """
+        cls.path = path
+        cls.configs_hash = cls._fingerprint(remote_configs)
+        cls._chain_ids = {}
+        cls._a_tokens = {}
+
+        if not os.path.exists(path):
+            print(f"No metadata store found at {path}; starting empty.")
+            return
+
+        try:
+            with open(path) as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"⚠️ Could not read metadata store at {path} ({e}); starting empty.")
+            return
+
+        if data.get("configs_hash") != cls.configs_hash:
+            print("Remote configs changed since the metadata store was written; invalidating it.")
+            cls._save()
+            return
+
+        cls._chain_ids = {network: int(chain_id) for network, chain_id in data.get("chain_ids", {}).items()}
+        cls._a_tokens = {int(chain_id): Web3.to_checksum_address(address) for chain_id, address in data.get("a_tokens", {}).items()}
+        print(f"Loaded metadata store from {path}: {len(cls._chain_ids)} chain id(s), {len(cls._a_tokens)} aToken(s).")
+
+    @classmethod
+    def get_a_token_address(cls, chain_id: int) -> Optional[ChecksumAddress]:
+        return cls._a_tokens.get(chain_id)
+
+    @classmethod
+    def set_a_token_address(cls, chain_id: int, a_token_address: str) -> None:
+        a_token_address = Web3.to_checksum_address(a_token_address)
+        if cls._a_tokens.get(chain_id) != a_token_address:
+            cls._a_tokens[chain_id] = a_token_address
+            cls._save()
+
+    @classmethod
+    async def resolve_chain_id(cls, web3_instance: AsyncWeb3, network: Network) -> int:
+        """Returns the chain id of a network, asking the RPC only once."""
+        chain_id = cls._chain_ids.get(network.value)
+        if chain_id is not None:
+            return chain_id
+
+        chain_id = await web3_instance.eth.chain_id
+        cls._chain_ids[network.value] = chain_id
+        cls._save()
+        return chain_id
+
+    @staticmethod
+    def _fingerprint(remote_configs: dict) -> str:
+        return hashlib.sha256(json.dumps(remote_configs, sort_keys=True, default=str).encode()).hexdigest()
+
+    @classmethod
+    def _save(cls) -> None:
+        if cls.path is None:
+            return  # not loaded, keep values in memory only
+
+        data: dict[str, Any] = {
+            "configs_hash": cls.configs_hash,
+            "chain_ids": cls._chain_ids,
+            "a_tokens": {str(chain_id): address for chain_id, address in cls._a_tokens.items()},
+        }
+
+        directory = os.path.dirname(cls.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # write then rename, so a crash never leaves a truncated file behind
+        tmp_path = f"{cls.path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(data, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, cls.path)
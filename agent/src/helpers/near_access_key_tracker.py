@@ -0,0 +1,81 @@
+import asyncio
+import time
+from typing import Optional
+
+from near_omni_client.json_rpc.client import NearClient
+
+
+class NearAccessKeyTracker:
+    """
+    Hands out NEAR access-key nonces and a recent block hash locally, per signer key.
+
+    The first transaction of a key reads its nonce and a block hash with `view_access_key`;
+    after that nonces are incremented in memory, so a state-machine action does not need an
+    extra RPC before signing. Block hashes stay valid for a whole epoch-sized window, so the
+    one in use is refreshed in the background once older than `refresh_after_seconds`, and
+    synchronously past `max_age_seconds`. `invalidate` (e.g. on `InvalidNonce` or `Expired`)
+    forces the next transaction to read the key again.
+    """
+    refresh_after_seconds: float = 600
+    max_age_seconds: float = 3600
+
+    # "account_id:public_key" -> next nonce to hand out (None means "sync before using")
+    _next_nonce: dict[str, Optional[int]] = {}
+    # "account_id:public_key" -> (block hash, monotonic time it was read)
+    _block_hash: dict[str, tuple[bytes, float]] = {}
+    _refresh_tasks: dict[str, asyncio.Task] = {}
+    _locks: dict[str, asyncio.Lock] = {}
+
+    @classmethod
+    async def next(cls, near_client: NearClient, account_id: str, public_key: str) -> tuple[int, bytes]:
+        """
+        Reserves the next nonce of a signer key.
+
+        Returns:
+            tuple[int, bytes]: The nonce and the block hash to sign the transaction with.
+        """
+        key = f"{account_id}:{public_key}"
+        async with cls._lock(key):
+            age = time.monotonic() - cls._block_hash[key][1] if key in cls._block_hash else None
+
+            if cls._next_nonce.get(key) is None or age is None or age >= cls.max_age_seconds:
+                await cls._sync(near_client, key, account_id, public_key)
+            elif age >= cls.refresh_after_seconds and key not in cls._refresh_tasks:
+                cls._refresh_tasks[key] = asyncio.create_task(cls._refresh(near_client, key, account_id, public_key))
+
+            nonce = cls._next_nonce[key]
+            cls._next_nonce[key] = nonce + 1
+            return nonce, cls._block_hash[key][0]
+
+    @classmethod
+    def invalidate(cls, account_id: str, public_key: str) -> None:
+        """Forces the next transaction of the key to re-read its nonce and block hash."""
+        key = f"{account_id}:{public_key}"
+        cls._next_nonce[key] = None
+        cls._block_hash.pop(key, None)
+
+    @classmethod
+    async def _sync(cls, near_client: NearClient, key: str, account_id: str, public_key: str) -> None:
+        nonce_and_block_hash = await near_client.get_nonce_and_block_hash(account_id, public_key)
+        local = cls._next_nonce.get(key)
+
+        # @dev the key is read at `final`, which can lag behind nonces already used locally
+        cls._next_nonce[key] = max(nonce_and_block_hash["nonce"], local or 0)
+        cls._block_hash[key] = (nonce_and_block_hash["block_hash"], time.monotonic())
+
+    @classmethod
+    async def _refresh(cls, near_client: NearClient, key: str, account_id: str, public_key: str) -> None:
+        try:
+            async with cls._lock(key):
+                await cls._sync(near_client, key, account_id, public_key)
+        except Exception as e:
+            # the current block hash is still valid, the next transaction retries
+            print(f"⚠️ Background refresh of the NEAR access key {key} failed: {e!r}")
+        finally:
+            cls._refresh_tasks.pop(key, None)
+
+    @classmethod
+    def _lock(cls, key: str) -> asyncio.Lock:
+        if key not in cls._locks:
+            cls._locks[key] = asyncio.Lock()
+        return cls._locks[key]
@@ -0,0 +1,118 @@
+import asyncio
+import base64
+import time
+
+import base58
+from near_omni_client.json_rpc.client import NearClient
+from near_omni_client.json_rpc.exceptions import JsonRpcError
+from near_omni_client.json_rpc.models import TransactionResult
+
+# levels that wait for the receipts to execute, so the result carries the call outcome
+WAIT_UNTIL_LEVELS = ("EXECUTED_OPTIMISTIC", "EXECUTED", "FINAL")
+
+
+def is_stale_access_key_error(error: JsonRpcError) -> bool:
+    """True when a transaction was rejected for its nonce or block hash, i.e. signing it again can succeed."""
+    details = f"{error} {error.cause_info} {error.data}"
+    return "InvalidNonce" in details or "Expired" in details
+
+
+class NearTxSubmitter:
+    """
+    Submits signed NEAR transactions without blocking on them, then tracks them by hash.
+
+    The transaction is sent once with `send_tx` and `wait_until=NONE`, and its outcome is
+    polled with the `tx` method up to the `wait_until` level. RPC timeouts become status
+    checks instead of resubmissions, so an included transaction is never sent again (which
+    used to fail with InvalidNonce). The same signed bytes are only broadcast again when the
+    RPC still does not know the hash after `resubmit_after_seconds`.
+    """
+    wait_until: str = "EXECUTED"
+    poll_interval_seconds: float = 1.0
+    resubmit_after_seconds: float = 10.0
+    timeout_seconds: float = 180
+
+    @classmethod
+    def configure(
+        cls,
+        *,
+        wait_until: str = "EXECUTED",
+        poll_interval_seconds: float = 1.0,
+        resubmit_after_seconds: float = 10.0,
+        timeout_seconds: float = 180,
+    ):
+        if wait_until not in WAIT_UNTIL_LEVELS:
+            raise ValueError(f"Unsupported wait_until level {wait_until!r}, expected one of {WAIT_UNTIL_LEVELS}")
+        cls.wait_until = wait_until
+        cls.poll_interval_seconds = poll_interval_seconds
+        cls.resubmit_after_seconds = resubmit_after_seconds
+        cls.timeout_seconds = timeout_seconds
+
+    @classmethod
+    async def submit(cls, near_client: NearClient, signed_tx: bytes, tx_hash: bytes, sender_account_id: str) -> TransactionResult:
+        """
+        Sends a signed transaction and waits for its outcome.
+
+        Args:
+            near_client (NearClient): Client of the network the transaction is sent to.
+            signed_tx (bytes): Borsh-serialized signed transaction.
+            tx_hash (bytes): Hash of the transaction (sha256 of the unsigned transaction).
+            sender_account_id (str): Signer of the transaction.
+
+        Returns:
+            TransactionResult: The outcome once the transaction reached the `wait_until` level.
+
+        Raises:
+            JsonRpcError: If the transaction is rejected on submission.
+            TimeoutError: If the outcome is not known after `timeout_seconds`.
+        """
+        signed_tx_base64 = base64.b64encode(signed_tx).decode("utf-8")
+        tx_hash_b58 = base58.b58encode(tx_hash).decode("utf-8")
+
+        print(f"Sending NEAR transaction {tx_hash_b58}...")
+        await cls._send(near_client, signed_tx_base64)
+
+        start = time.monotonic()
+        deadline = start + cls.timeout_seconds
+        last_sent_at = start
+
+        while True:
+            try:
+                response = await near_client.provider.call(
+                    "tx",
+                    {"tx_hash": tx_hash_b58, "sender_account_id": sender_account_id, "wait_until": cls.wait_until},
+                )
+                result = response["result"]
+                if "status" in result:
+                    print(f"✅ NEAR transaction {tx_hash_b58} reached {result.get('final_execution_status')} in {time.monotonic() - start:.1f}s.")
+                    return TransactionResult.from_json_response(response)
+            except JsonRpcError as e:
+                # TIMEOUT_ERROR: known but not at the requested level yet; UNKNOWN_TRANSACTION: not seen yet
+                if e.cause_name not in ("TIMEOUT_ERROR", "UNKNOWN_TRANSACTION"):
+                    raise
+                now = time.monotonic()
+                if e.cause_name == "UNKNOWN_TRANSACTION" and now - last_sent_at >= cls.resubmit_after_seconds:
+                    print(f"⚠️ NEAR transaction {tx_hash_b58} still unknown after {now - last_sent_at:.0f}s; broadcasting it again.")
+                    await cls._send(near_client, signed_tx_base64, is_resubmission=True)
+                    last_sent_at = now
+            except Exception as e:
+                # network errors: the transaction may well be in flight, check again
+                print(f"⚠️ Status check of NEAR transaction {tx_hash_b58} failed: {e!r}")
+
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f"NEAR transaction {tx_hash_b58} did not reach {cls.wait_until} within {cls.timeout_seconds}s")
+            await asyncio.sleep(cls.poll_interval_seconds)
+
+    @staticmethod
+    async def _send(near_client: NearClient, signed_tx_base64: str, is_resubmission: bool = False) -> None:
+        try:
+            await near_client.provider.call("send_tx", {"signed_tx_base64": signed_tx_base64, "wait_until": "NONE"})
+        except JsonRpcError as e:
+            # a rejected resubmission usually means the first one was included (InvalidNonce): keep tracking it
+            if is_resubmission or e.cause_name == "TIMEOUT_ERROR":
+                print(f"⚠️ send_tx returned {e}; tracking the transaction by hash.")
+                return
+            raise
+        except Exception as e:
+            # the request may have reached the node, tracking by hash tells us
+            print(f"⚠️ send_tx failed with {e!r}; tracking the transaction by hash.")
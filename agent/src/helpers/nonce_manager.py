@@ -0,0 +1,116 @@
+import asyncio
+import time
+from typing import Optional
+
+from web3 import AsyncWeb3, Web3
+
+
+class NonceManager:
+    """
+    Hands out EVM nonces for the agent address locally, per chain.
+
+    The first reservation on a chain reads the pending transaction count; after that nonces are
+    incremented in memory, so several transactions can be prepared back-to-back without an RPC
+    round trip each, even while earlier reservations are still being signed.
+
+    A reservation that will never be broadcast must be given back with `release`; its nonce is
+    handed out again before any new one, so no gap stalls the later transactions. The chain is
+    queried again (reconciled) when:
+      - every outstanding reservation is older than `reservation_timeout_seconds` (abandoned
+        without a `release`, e.g. the process was interrupted mid-step),
+      - a broadcast failed with a nonce error, or `invalidate` was called for any other reason.
+    """
+    reservation_timeout_seconds: float = 900
+
+    # chain_id -> next new nonce to hand out (None means "reconcile before using")
+    _next_nonce: dict[int, Optional[int]] = {}
+    # chain_id -> nonce -> monotonic time of the reservation, until it is seen in a successful broadcast
+    _outstanding: dict[int, dict[int, float]] = {}
+    # chain_id -> released nonces below `_next_nonce`, handed out again first
+    _released: dict[int, set[int]] = {}
+    _locks: dict[int, asyncio.Lock] = {}
+
+    @classmethod
+    async def reserve(cls, web3_instance: AsyncWeb3, chain_id: int, agent_address: str) -> int:
+        """
+        Reserves the next nonce of the agent on `chain_id`.
+
+        Args:
+            web3_instance (AsyncWeb3): Initialized AsyncWeb3 instance connected to the chain.
+            chain_id (int): The chain the transaction will be sent to.
+            agent_address (str): The agent address, the only sender this manager tracks.
+
+        Returns:
+            int: The nonce to sign the transaction with.
+        """
+        async with cls._lock(chain_id):
+            outstanding = cls._outstanding.setdefault(chain_id, {})
+            released = cls._released.setdefault(chain_id, set())
+
+            now = time.monotonic()
+            if outstanding and all(now - reserved_at >= cls.reservation_timeout_seconds for reserved_at in outstanding.values()):
+                print(f"⚠️ Nonce(s) {sorted(outstanding)} on chainId={chain_id} were reserved but never broadcast; reconciling.")
+                cls._next_nonce[chain_id] = None
+
+            if cls._next_nonce.get(chain_id) is None:
+                await cls._reconcile(web3_instance, chain_id, agent_address)
+
+            if released:
+                nonce = min(released)
+                released.discard(nonce)
+            else:
+                nonce = cls._next_nonce[chain_id]
+                cls._next_nonce[chain_id] = nonce + 1
+            outstanding[nonce] = now
+
+            return nonce
+
+    @classmethod
+    def release(cls, chain_id: int, nonce: int) -> None:
+        """Gives back a reserved nonce whose transaction will not be broadcast."""
+        if cls._outstanding.get(chain_id, {}).pop(nonce, None) is None:
+            return
+
+        if cls._next_nonce.get(chain_id) == nonce + 1:
+            cls._next_nonce[chain_id] = nonce  # the latest reservation, simply rewind
+        elif cls._next_nonce.get(chain_id) is not None:
+            cls._released.setdefault(chain_id, set()).add(nonce)
+
+    @classmethod
+    def mark_broadcast(cls, chain_id: int, nonce: int) -> None:
+        """Records that the transaction using `nonce` reached the node."""
+        cls._outstanding.get(chain_id, {}).pop(nonce, None)
+        cls._released.get(chain_id, set()).discard(nonce)
+
+        # the tx may have been prepared elsewhere (e.g. a signed payload replayed on restart)
+        next_nonce = cls._next_nonce.get(chain_id)
+        if next_nonce is not None and nonce >= next_nonce:
+            cls._next_nonce[chain_id] = nonce + 1
+
+    @classmethod
+    def invalidate(cls, chain_id: int) -> None:
+        """Forces the next reservation on `chain_id` to re-read the nonce from the chain."""
+        cls._next_nonce[chain_id] = None
+        cls._outstanding.pop(chain_id, None)
+        cls._released.pop(chain_id, None)
+
+    @classmethod
+    async def _reconcile(cls, web3_instance: AsyncWeb3, chain_id: int, agent_address: str) -> None:
+        on_chain = await web3_instance.eth.get_transaction_count(Web3.to_checksum_address(agent_address), block_identifier="pending")
+        outstanding = cls._outstanding.get(chain_id, {})
+        local = max(outstanding) + 1 if outstanding else None
+
+        if local is not None and local > on_chain:
+            print(f"⚠️ Nonce gap on chainId={chain_id}: local next nonce {local}, chain pending count {on_chain}; rewinding.")
+        elif local is not None and local < on_chain:
+            print(f"⚠️ Chain pending count {on_chain} is ahead of local nonce {local} on chainId={chain_id}; fast-forwarding.")
+
+        cls._next_nonce[chain_id] = on_chain
+        outstanding.clear()
+        cls._released.get(chain_id, set()).clear()
+
+    @classmethod
+    def _lock(cls, chain_id: int) -> asyncio.Lock:
+        if chain_id not in cls._locks:
+            cls._locks[chain_id] = asyncio.Lock()
+        return cls._locks[chain_id]
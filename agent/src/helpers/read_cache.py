@@ -0,0 +1,131 @@
+import asyncio
+import time
+from typing import Any
+
+from web3 import AsyncHTTPProvider
+from web3.types import RPCEndpoint, RPCResponse
+
+CACHEABLE_BLOCK_TAGS = ("latest", None)
+
+
+class BlockScopedCachingProvider(AsyncHTTPProvider):
+    """
+    AsyncHTTPProvider that serves repeated identical `eth_call`s from memory.
+
+    Calls made against `latest` are pinned to the current block number, so every read issued
+    while that block is current sees the same state and is keyed by
+    (block number, contract, calldata, sender). The current block is refreshed at most every
+    `block_ttl_seconds`, and moves forward immediately whenever a newer block shows up in an
+    `eth_blockNumber` or `eth_getTransactionReceipt` response. This keeps reads done right
+    after a confirmed transaction from landing on a block older than the transaction.
+
+    Entries older than `max_block_age` blocks are evicted as the chain advances.
+
+    `eth_chainId`, which web3's validation middleware issues before every call, is
+    answered from memory after the first response.
+    """
+
+    def __init__(self, endpoint_uri: str, *, block_ttl_seconds: float = 2.0, max_block_age: int = 2, **kwargs: Any):
+        super().__init__(endpoint_uri, **kwargs)
+        self.block_ttl_seconds = block_ttl_seconds
+        self.max_block_age = max_block_age
+
+        self.hits = 0
+        self.misses = 0
+
+        self._current_block: int | None = None
+        self._block_fetched_at: float = 0.0
+        self._block_lock = asyncio.Lock()
+        self._cache: dict[tuple, RPCResponse] = {}
+        self._in_flight: dict[tuple, asyncio.Future] = {}
+        self._chain_id_response: RPCResponse | None = None
+
+    async def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        if method == "eth_call" and self._is_cacheable(params):
+            return await self._cached_call(params)
+
+        if method == "eth_chainId" and self._chain_id_response is not None:
+            return self._chain_id_response
+
+        response = await super().make_request(method, params)
+
+        if method == "eth_chainId" and "result" in response:
+            self._chain_id_response = response
+
+        if method == "eth_blockNumber" and "result" in response:
+            self._observe_block(int(response["result"], 16), fresh=True)
+        elif method == "eth_getTransactionReceipt" and response.get("result"):
+            self._observe_block(int(response["result"]["blockNumber"], 16))
+
+        return response
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 3) if total else 0.0,
+            "entries": len(self._cache),
+            "block": self._current_block,
+        }
+
+    @staticmethod
+    def _is_cacheable(params: Any) -> bool:
+        block = params[1] if len(params) > 1 else None
+        return block in CACHEABLE_BLOCK_TAGS and not (len(params) > 2 and params[2])  # no state overrides
+
+    async def _cached_call(self, params: Any) -> RPCResponse:
+        block_number = await self._get_block_number()
+        tx = params[0]
+        key = (block_number, str(tx.get("to", "")).lower(), tx.get("data") or tx.get("input"), str(tx.get("from", "")).lower())
+
+        if key in self._cache:
+            self.hits += 1
+            return self._cache[key]
+
+        # identical calls already on the wire are joined instead of duplicated
+        if key in self._in_flight:
+            self.hits += 1
+            return await asyncio.shield(self._in_flight[key])
+
+        self.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            response = await super().make_request(RPCEndpoint("eth_call"), [tx, hex(block_number)])
+            if "error" not in response:
+                self._cache[key] = response
+            future.set_result(response)
+            return response
+        except BaseException as e:
+            future.set_exception(e)
+            # mark the exception as retrieved when nobody joined the call
+            future.exception()
+            raise
+        finally:
+            self._in_flight.pop(key, None)
+
+    async def _get_block_number(self) -> int:
+        if self._current_block is not None and time.monotonic() - self._block_fetched_at < self.block_ttl_seconds:
+            return self._current_block
+
+        async with self._block_lock:
+            # another caller may have refreshed it while we waited for the lock
+            if self._current_block is None or time.monotonic() - self._block_fetched_at >= self.block_ttl_seconds:
+                response = await super().make_request(RPCEndpoint("eth_blockNumber"), [])
+                if "error" in response:
+                    raise RuntimeError(f"eth_blockNumber failed: {response['error']}")
+                self._observe_block(int(response["result"], 16), fresh=True)
+
+        return self._current_block
+
+    def _observe_block(self, block_number: int, fresh: bool = False) -> None:
+        if fresh:
+            self._block_fetched_at = time.monotonic()
+
+        if self._current_block is not None and block_number <= self._current_block:
+            return
+
+        self._current_block = block_number
+        oldest_kept = block_number - self.max_block_age
+        self._cache = {key: value for key, value in self._cache.items() if key[0] >= oldest_kept}
@@ -0,0 +1,96 @@
+import asyncio
+import time
+
+from hexbytes import HexBytes
+from web3 import AsyncWeb3
+from web3.exceptions import TransactionNotFound
+from web3.types import TxReceipt
+
+from .gas_limit_model import GasLimitModel
+
+
+class TransactionRevertedError(RuntimeError):
+    """Raised when a transaction was mined but its receipt reports status 0."""
+
+
+class ReceiptWaiter:
+    """
+    Waits for EVM transactions to be mined and confirmed without blocking the event loop.
+
+    Receipts are polled with `eth_getTransactionReceipt` and a transaction is considered
+    settled once it is buried under the confirmation depth configured for its chain.
+    """
+    # chain_id -> number of blocks (including the inclusion block) required
+    confirmations_by_chain: dict[int, int] = {}
+    default_confirmations: int = 1
+    timeout_seconds: float = 300
+    poll_interval_seconds: float = 1.0
+
+    @classmethod
+    def configure(
+        cls,
+        *,
+        confirmations_by_chain: dict[int, int],
+        default_confirmations: int = 1,
+        timeout_seconds: float = 300,
+        poll_interval_seconds: float = 1.0,
+    ):
+        cls.confirmations_by_chain = confirmations_by_chain
+        cls.default_confirmations = default_confirmations
+        cls.timeout_seconds = timeout_seconds
+        cls.poll_interval_seconds = poll_interval_seconds
+
+    @classmethod
+    def confirmations_for(cls, chain_id: int) -> int:
+        return max(1, cls.confirmations_by_chain.get(chain_id, cls.default_confirmations))
+
+    @classmethod
+    async def wait(cls, web3_instance: AsyncWeb3, tx_hash: str | bytes, chain_id: int) -> TxReceipt:
+        """
+        Waits until the transaction is mined with the confirmation depth of its chain.
+
+        Args:
+            web3_instance (AsyncWeb3): Initialized AsyncWeb3 instance connected to the chain.
+            tx_hash (str | bytes): The transaction hash, with or without `0x` prefix.
+            chain_id (int): The chain the transaction was sent to.
+
+        Returns:
+            TxReceipt: The receipt of the confirmed transaction.
+
+        Raises:
+            TimeoutError: If the transaction is not confirmed within `timeout_seconds`.
+            TransactionRevertedError: If the transaction reverted.
+        """
+        tx_hash = HexBytes(tx_hash)
+        required_confirmations = cls.confirmations_for(chain_id)
+        deadline = time.monotonic() + cls.timeout_seconds
+
+        print(f"⏳ Waiting for tx 0x{tx_hash.hex()} on chainId={chain_id} ({required_confirmations} confirmation(s))")
+
+        while True:
+            receipt = await cls._get_receipt(web3_instance, tx_hash)
+
+            if receipt is not None:
+                GasLimitModel.observe_receipt(tx_hash, receipt)
+
+                if receipt["status"] == 0:
+                    raise TransactionRevertedError(f"Transaction 0x{tx_hash.hex()} reverted on chainId={chain_id} in block {receipt['blockNumber']}")
+
+                latest_block = await web3_instance.eth.block_number
+                confirmations = latest_block - receipt["blockNumber"] + 1
+
+                if confirmations >= required_confirmations:
+                    print(f"✅ Tx 0x{tx_hash.hex()} confirmed in block {receipt['blockNumber']} on chainId={chain_id}")
+                    return receipt
+
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f"Transaction 0x{tx_hash.hex()} not confirmed on chainId={chain_id} after {cls.timeout_seconds}s")
+
+            await asyncio.sleep(cls.poll_interval_seconds)
+
+    @staticmethod
+    async def _get_receipt(web3_instance: AsyncWeb3, tx_hash: HexBytes) -> TxReceipt | None:
+        try:
+            return await web3_instance.eth.get_transaction_receipt(tx_hash)
+        except TransactionNotFound:
+            return None
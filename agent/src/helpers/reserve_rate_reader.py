@@ -0,0 +1,107 @@
+from dataclasses import dataclass
+
+from web3 import AsyncWeb3, Web3
+
+from adapters import Multicall
+from adapters.abis import INTEREST_RATE_STRATEGY_ABI, INTEREST_RATE_STRATEGY_V1_ABI, LENDING_POOL_ABI, USDC_ABI
+
+RAY = 10**27
+# bits 64-79 of the reserve configuration bitmap: reserve factor in basis points
+RESERVE_FACTOR_SHIFT = 64
+RESERVE_FACTOR_MASK = 0xFFFF
+
+
+@dataclass
+class ReserveRateState:
+    """
+    Interest rate inputs of an Aave v3 reserve, read at one block.
+
+    Rates and ratios are fractions (0.05 is 5%), amounts are in asset base units.
+    """
+    liquidity_rate: float           # current supply APR
+    total_supply: int               # aToken total supply: available liquidity + debt
+    total_borrow: int               # variable debt token total supply
+    optimal_usage_ratio: float
+    base_variable_borrow_rate: float
+    variable_rate_slope1: float
+    variable_rate_slope2: float
+    reserve_factor: float
+
+    def to_dict(self) -> dict:
+        return {
+            "optimalUsageRatio": self.optimal_usage_ratio,
+            "baseVariableBorrowRate": self.base_variable_borrow_rate,
+            "variableRateSlope1": self.variable_rate_slope1,
+            "variableRateSlope2": self.variable_rate_slope2,
+            "reserveFactor": self.reserve_factor,
+        }
+
+
+class ReserveRateReader:
+    """
+    Reads the reserve state and interest rate strategy parameters of the USDC reserve with
+    two Multicall3 batches: the reserve data (which holds the strategy and token addresses),
+    then the strategy parameters and the aToken and debt token supplies.
+
+    Both strategy ABIs are queried in the second batch with `allow_failure`: v3.1+ markets
+    share a DefaultReserveInterestRateStrategyV2 keyed by reserve, older deployments have one
+    strategy per reserve with argument-less getters. Whichever answers is used.
+    """
+
+    @staticmethod
+    async def read(web3_instance: AsyncWeb3, chain_config: dict) -> ReserveRateState:
+        """
+        Args:
+            web3_instance (AsyncWeb3): Initialized Web3 instance connected to the chain.
+            chain_config (dict): The remote config of the chain (as returned by `get_all_configs`).
+
+        Returns:
+            ReserveRateState: The reserve state and strategy parameters.
+        """
+        lending_pool_address = Web3.to_checksum_address(chain_config["aave"]["lending_pool_address"])
+        usdc_address = Web3.to_checksum_address(chain_config["aave"]["asset"])
+
+        lending_pool = web3_instance.eth.contract(address=lending_pool_address, abi=LENDING_POOL_ABI)
+        (reserve_data,) = await Multicall.aggregate3(web3_instance, [lending_pool.functions.getReserveData(usdc_address)])
+
+        configuration, liquidity_rate_ray = reserve_data[0][0], reserve_data[2]
+        a_token_address, variable_debt_token_address, strategy_address = (Web3.to_checksum_address(reserve_data[i]) for i in (8, 10, 11))
+
+        strategy = web3_instance.eth.contract(address=strategy_address, abi=INTEREST_RATE_STRATEGY_ABI)
+        strategy_v1 = web3_instance.eth.contract(address=strategy_address, abi=INTEREST_RATE_STRATEGY_V1_ABI)
+        a_token = web3_instance.eth.contract(address=a_token_address, abi=USDC_ABI)
+        variable_debt_token = web3_instance.eth.contract(address=variable_debt_token_address, abi=USDC_ABI)
+
+        results = await Multicall.aggregate3(web3_instance, [
+            a_token.functions.totalSupply(),
+            variable_debt_token.functions.totalSupply(),
+            strategy.functions.getOptimalUsageRatio(usdc_address),
+            strategy.functions.getBaseVariableBorrowRate(usdc_address),
+            strategy.functions.getVariableRateSlope1(usdc_address),
+            strategy.functions.getVariableRateSlope2(usdc_address),
+            strategy_v1.functions.OPTIMAL_USAGE_RATIO(),
+            strategy_v1.functions.getBaseVariableBorrowRate(),
+            strategy_v1.functions.getVariableRateSlope1(),
+            strategy_v1.functions.getVariableRateSlope2(),
+        ], allow_failure=True)
+
+        total_supply, total_borrow = results[0:2]
+        if total_supply is None or total_borrow is None:
+            raise ValueError(f"Failed to read the supply of the USDC reserve at {lending_pool_address}")
+
+        parameters = results[2:6] if None not in results[2:6] else results[6:10]
+        if None in parameters:
+            raise ValueError(f"Unsupported interest rate strategy at {strategy_address}")
+
+        optimal_usage_ratio, base_variable_borrow_rate, slope1, slope2 = (value / RAY for value in parameters)
+
+        return ReserveRateState(
+            liquidity_rate=liquidity_rate_ray / RAY,
+            total_supply=total_supply,
+            total_borrow=total_borrow,
+            optimal_usage_ratio=optimal_usage_ratio,
+            base_variable_borrow_rate=base_variable_borrow_rate,
+            variable_rate_slope1=slope1,
+            variable_rate_slope2=slope2,
+            reserve_factor=((configuration >> RESERVE_FACTOR_SHIFT) & RESERVE_FACTOR_MASK) / 10_000,
+        )
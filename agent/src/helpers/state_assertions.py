@@ -1,5 +1,5 @@
 from eth_typing import ChecksumAddress
-from web3 import Web3
+from web3 import AsyncWeb3, Web3
 
 USDC_ABI = [
     {
@@ -33,10 +33,10 @@ class Assert:
     #
 
     @classmethod
-    def usdc_vault_balance(cls, web3_instance: Web3, usdc_address: str, expected_balance):
+    async def usdc_vault_balance(cls, web3_instance: AsyncWeb3, usdc_address: str, expected_balance):
         cls._ensure_config()
 
-        vault_balance = (
+        vault_balance = await (
             web3_instance.eth.contract(address=Web3.to_checksum_address(usdc_address), abi=USDC_ABI)
             .functions.balanceOf(cls.rebalancer_vault_address)
             .call()
@@ -48,10 +48,10 @@ class Assert:
         )
 
     @classmethod
-    def atoken_vault_balance(cls, web3_instance: Web3, atoken_address: str, expected_balance):
+    async def atoken_vault_balance(cls, web3_instance: AsyncWeb3, atoken_address: str, expected_balance):
         cls._ensure_config()
 
-        vault_balance = (
+        vault_balance = await (
             web3_instance.eth.contract(address=Web3.to_checksum_address(atoken_address), abi=ATOKEN_ABI)
             .functions.balanceOf(cls.rebalancer_vault_address)
             .call()
@@ -67,10 +67,10 @@ class Assert:
     #
 
     @classmethod
-    def usdc_agent_balance(cls, web3_instance: Web3, usdc_address: str, expected_balance):
+    async def usdc_agent_balance(cls, web3_instance: AsyncWeb3, usdc_address: str, expected_balance):
         cls._ensure_config()
 
-        agent_balance = (
+        agent_balance = await (
             web3_instance.eth.contract(address=Web3.to_checksum_address(usdc_address), abi=USDC_ABI)
             .functions.balanceOf(cls.agent_address)
             .call()
@@ -82,10 +82,10 @@ class Assert:
         )
 
     @classmethod
-    def usdc_agent_balance_is_at_least(cls, web3_instance: Web3, usdc_address: str, expected_balance):
+    async def usdc_agent_balance_is_at_least(cls, web3_instance: AsyncWeb3, usdc_address: str, expected_balance):
         cls._ensure_config()
 
-        agent_balance = (
+        agent_balance = await (
             web3_instance.eth.contract(address=Web3.to_checksum_address(usdc_address), abi=USDC_ABI)
             .functions.balanceOf(cls.agent_address)
             .call()
@@ -97,10 +97,10 @@ class Assert:
         )
 
     @classmethod
-    def atoken_agent_balance(cls, web3_instance: Web3, atoken_address: str, expected_balance):
+    async def atoken_agent_balance(cls, web3_instance: AsyncWeb3, atoken_address: str, expected_balance):
         cls._ensure_config()
 
-        agent_balance = (
+        agent_balance = await (
             web3_instance.eth.contract(address=Web3.to_checksum_address(atoken_address), abi=ATOKEN_ABI)
             .functions.balanceOf(cls.agent_address)
             .call()
@@ -3,81 +3,28 @@ import time
 import traceback
 
 from config import Config
-from helpers import Assert, BalanceHelper,CrossChainATokenBalanceHelper
-from optimizer import get_extra_data_for_optimization, optimize_chain_allocation_with_direction
-from engine import build_context, StrategyManager, execute_all_rebalance_operations,compute_rebalance_operations, get_allocations, EngineContext
-from adapters import Vault
-from tee import get_tee_info
+import optimizer
+from engine import build_context, StrategyManager, execute_all_rebalance_operations,compute_rebalance_operations, get_allocations, EngineContext, RuntimeState, ActivityLogIndexer, load_session
 
-async def run_once(context: EngineContext, config: Config):
+async def run_once(context: EngineContext, config: Config, runtime_state: RuntimeState, incremental_optimizer: optimizer.IncrementalOptimizer, scenario_engine: "optimizer.ScenarioEngine" = None):
     print("Remote configs for all chains:", context.remote_configs)
 
     config.summary()
 
-    is_worker_registered = await context.rebalancer_contract.is_worker_registered(context.near_wallet.account_id)
-    print(f"Worker registered: {is_worker_registered}")
+    # worker registration, max allowance, helpers and strategies are only refreshed when needed
+    await runtime_state.refresh()
 
-    if not is_worker_registered:
-        print("Worker not registered. Registering now...")
-        
-        tee_info = await get_tee_info(context.near_wallet.account_id)
-
-        if tee_info.get("success") is False:
-            raise RuntimeError(f"get_tee_info failed: {tee_info.get('error')}")
-
-        quote_hex = tee_info["quote_hex"]
-        collateral = tee_info["collateral"]
-        checksum = tee_info["checksum"]
-        tcb_info = tee_info["tcb_info"]
-
-        print(f"Registering worker with TEE info - Quote Hex: {quote_hex}")
-        print(f"Collateral: {collateral}")
-        print(f"Checksum: {checksum}")
-        print(f"TCB Info: {tcb_info}")
-        
-        await context.rebalancer_contract.register_worker(
-            quote_hex=quote_hex,
-            collateral=collateral,
-            checksum=checksum,
-            tcb_info=tcb_info
-        )
-        print("Worker registration completed.")
-
-    agent_evm_address = context.agent_address
-    vault_address = context.vault_address
-
-    # Get max allowance
-    max_allowance = Vault(context.vault_address, context.source_network, context.evm_factory_provider).get_max_total_deposits()
-    print(f"Max allowance for vault {vault_address} on source chain: {max_allowance}")
-   
-   # Configure Crosschain BalanceHelper 
-    CrossChainATokenBalanceHelper.configure(
-        agent_address=agent_evm_address,
-        source_chain_id=context.source_chain_id,
-        supported_chains=context.supported_chains,
-        remote_configs=context.remote_configs,
-        evm_factory_provider=context.evm_factory_provider,
-    )
-
-    # Configure Balance Helper
-    BalanceHelper.configure(rebalancer_vault_address=vault_address, agent_address=agent_evm_address)
-
-    # Configure Assert
-    Assert.configure(rebalancer_vault_address=vault_address, agent_address=agent_evm_address)
-
-    # Configure Strategies
-    StrategyManager.configure(rebalancer_contract=context.rebalancer_contract, evm_factory_provider = context.evm_factory_provider, vault_address=vault_address, config=config, remote_config=context.remote_configs, agent_address=agent_evm_address, max_allowance=max_allowance)
+    # session info, activity log and every signed payload, in one round trip
+    existing_session = await load_session(context.rebalancer_contract)
 
-    existing_session = await context.rebalancer_contract.get_active_session_info() #  returns [nonce, flow, previous_step, pending_step]
-
-    print("💡Existing session info:", existing_session)
+    print("💡Existing session info:", existing_session and (existing_session.nonce, existing_session.flow, existing_session.restart_from))
 
     if existing_session:
         print("Resumed existing rebalance session.")
-        flow = existing_session["flow"]
-        restart_from = existing_session["previous_step"]
+        flow = existing_session.flow
+        restart_from = existing_session.restart_from
 
-        activity_log = await context.rebalancer_contract.get_activity_log()
+        activity_log = existing_session.activity_log
         from_chain_id = activity_log["source_chain"]
         to_chain_id = activity_log["destination_chain"]
         amount = activity_log["amount"]
@@ -86,12 +33,8 @@ async def run_once(context: EngineContext, config: Config):
         usdc_agent_balance_before_in_dest_chain = activity_log["usdc_agent_balance_before_in_dest_chain"]
         a_usdc_agent_balance_before_in_source_chain = activity_log["a_usdc_agent_balance_before_in_source_chain"]
         a_usdc_agent_balance_before_in_dest_chain = activity_log["a_usdc_agent_balance_before_in_dest_chain"]
-        
-        # if there is an existing session but the previous step is None, we set the restart_from to pending_step
-        if restart_from is None:
-            restart_from = existing_session["pending_step"]
 
-        print(f"Resuming from flow: {flow}, from_chain_id: {from_chain_id}, to_chain_id: {to_chain_id}, amount: {amount}, restart_from: {restart_from}")
+        print(f"Resuming from flow: {flow}, from_chain_id: {from_chain_id}, to_chain_id: {to_chain_id}, amount: {amount}, restart_from: {restart_from}, signed payloads: {[t.value for t in existing_session.signed_payloads]}")
         
         await StrategyManager.get_strategy(flow).execute(from_chain_id=from_chain_id, 
             to_chain_id=to_chain_id, 
@@ -101,25 +44,40 @@ async def run_once(context: EngineContext, config: Config):
             usdc_agent_balance_before_in_source_chain=usdc_agent_balance_before_in_source_chain,
             usdc_agent_balance_before_in_dest_chain=usdc_agent_balance_before_in_dest_chain,
             a_usdc_agent_balance_before_in_source_chain=a_usdc_agent_balance_before_in_source_chain,
-            a_usdc_agent_balance_before_in_dest_chain=a_usdc_agent_balance_before_in_dest_chain
+            a_usdc_agent_balance_before_in_dest_chain=a_usdc_agent_balance_before_in_dest_chain,
+            signed_payloads=existing_session.signed_payloads,
         )
 
         print("✅ Rebalance operations computed successfully.")
 
         return
 
-    current_allocations, total_assets_under_management = await get_allocations(context)
+    current_allocations, total_assets_under_management = await get_allocations(context, timeout_seconds=config.chain_read_timeout_seconds)
     
-    extra_data_for_optimization = await get_extra_data_for_optimization(
+    extra_data_for_optimization = await optimizer.get_extra_data_for_optimization(
         total_assets_under_management=total_assets_under_management,
-        mpc_wallet=context.mpc_wallet,
+        evm_factory_provider=context.evm_factory_provider,
         current_allocations=current_allocations,
         configs=context.remote_configs,
         override_interest_rates=config.override_interest_rates,
+        timeout_seconds=config.chain_read_timeout_seconds,
     )
 
-    optimized_allocations = optimize_chain_allocation_with_direction(data=extra_data_for_optimization)
+    # @dev solves again only when the inputs moved past the sensitivity bound, warm-started from the last optimum
+    optimized_allocations = incremental_optimizer.optimize(extra_data_for_optimization)
     print("Optimized Allocations:", optimized_allocations)
+
+    # robust choice between the current allocation and the point optimum, scored over sampled market paths
+    # @dev off the event loop: numpy work in a thread, large grids awaited on the process pool
+    if scenario_engine:
+        # @dev a reused optimum reuses the last selection too, new random scenarios would move the funds for nothing
+        if scenario_engine.last_selection and not incremental_optimizer.last_decision.resolved:
+            scenario_selection = scenario_engine.rescaled_last_selection(extra_data_for_optimization["totalAssetsUnderManagement"])
+        else:
+            scenario_selection = await scenario_engine.select_async(extra_data_for_optimization, optimized_allocations["allocations"])
+        print("Scenario Selection:", {key: value for key, value in scenario_selection.items() if key != "allocations"})
+        optimized_allocations = {**optimized_allocations, "allocations": scenario_selection["allocations"]}
+        print("Robust Allocations:", optimized_allocations["allocations"])
     
     rebalance_operations = compute_rebalance_operations(current_allocations, optimized_allocations["allocations"])
     print("Rebalance Operations:", rebalance_operations)
@@ -128,6 +86,27 @@ async def run_once(context: EngineContext, config: Config):
         print("No rebalance operations needed.")
         return
 
+    # only execute the operations whose extra interest over the holding horizon pays for the bridge and gas
+    route_cost_model = optimizer.RouteCostModel(
+        gas_estimator=context.gas_estimator,
+        tx_tgas=config.tx_tgas,
+        max_bridge_fee=config.max_bridge_fee,
+        native_token_prices_usd=config.native_token_prices_usd,
+    )
+    costs = await route_cost_model.estimate_all(rebalance_operations)
+    rebalance_operations, profitability_report = optimizer.select_profitable_operations(
+        data=extra_data_for_optimization,
+        rebalance_operations=rebalance_operations,
+        costs=costs,
+        holding_horizon_days=config.holding_horizon_days,
+        rate_model=config.optimizer_rate_model,
+    )
+    print("Profitability Report:", profitability_report)
+
+    if not rebalance_operations:
+        print(f"No rebalance operation pays for its costs within {config.holding_horizon_days} days; skipping.")
+        return
+
     # Execute Rebalance Operations 
     await execute_all_rebalance_operations(
         source_chain_id=context.source_chain_id,
@@ -142,12 +121,36 @@ async def main():
     # Build engine context
     context = await build_context(config)
 
+    # Long-lived state refreshed at the start of every run
+    runtime_state = RuntimeState(context, config)
+
+    # Last optimum and its inputs, kept between runs
+    incremental_optimizer = optimizer.IncrementalOptimizer(
+        solver=config.optimizer_solver,
+        rate_model=config.optimizer_rate_model,
+        sensitivity=config.optimizer_sensitivity,
+    )
+
+    # Monte Carlo scoring of the allocations, only when enabled (it loads numpy at startup)
+    scenario_engine = None
+    if config.scenario_count > 0:
+        scenario_engine = optimizer.ScenarioEngine(
+            n_scenarios=config.scenario_count,
+            horizon_days=config.holding_horizon_days,
+            objective=config.scenario_objective,
+            quantile=config.scenario_quantile,
+            rate_model=config.optimizer_rate_model,
+        )
+
+    # Local index of the contract activity logs, for analytics without NEAR RPC
+    activity_log_indexer = ActivityLogIndexer(context.rebalancer_contract, path=config.activity_log_db_path)
+
     interval = config.interval_seconds
     print(f"⏱ Rebalancer interval: {interval}s")
 
     while True:
         try:
-            await run_once(context, config)
+            await run_once(context, config, runtime_state, incremental_optimizer, scenario_engine)
         except Exception as e:
             print("❌ run_once failed:", repr(e))
             traceback.print_exc()
@@ -155,6 +158,13 @@ async def main():
             print("Waiting 30s before retrying...")
             await asyncio.sleep(30)
 
+        try:
+            await activity_log_indexer.sync()
+        except Exception as e:
+            print("⚠️ Activity log sync failed:", repr(e))
+
+        print("📊 EVM read cache stats:", context.evm_factory_provider.read_cache_stats())
+
         print(f"🕒 Sleeping {config.interval_seconds:.0f}s until next run")
         await asyncio.sleep(config.interval_seconds)
 
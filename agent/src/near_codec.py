@@ -0,0 +1,196 @@
+"""
+Typed decoding of NEAR contract results.
+
+View calls return the JSON-serialized value as `.result: list[int]`, and the `build_and_sign_*`
+calls return it base64-encoded as `SuccessValue`. Every value the agent reads is described
+here by a schema built from small decoders (`U32`, `U128`, `ByteVec`, `Option(...)`, ...),
+so a malformed response fails with the path of the offending field instead of a KeyError
+somewhere downstream.
+
+Byte vectors (`Vec<u8>`, serialized as `[1,2,...]`) are decoded with `json.loads`, which
+is much faster than `ast.literal_eval` on signed payloads (see agent/benchmarks).
+"""
+import base64
+import json
+from enum import Enum
+from typing import Any, Callable, Type
+
+from engine_types import Flow, TxType
+
+Decoder = Callable[[Any, str], Any]
+
+
+# ---------------------------
+# Primitive decoders
+# ---------------------------
+def _unsigned(bits: int) -> Decoder:
+    maximum = 2**bits - 1
+
+    def decode(value: Any, path: str) -> int:
+        # numbers, or numeric strings for the near-sdk U64/U128 wrappers
+        if isinstance(value, bool) or not isinstance(value, (int, str)):
+            raise ValueError(f"{path}: expected u{bits}, got {type(value).__name__}")
+        try:
+            number = int(value)
+        except ValueError:
+            raise ValueError(f"{path}: expected u{bits}, got {value!r}")
+        if not 0 <= number <= maximum:
+            raise ValueError(f"{path}: {number} out of range for u{bits}")
+        return number
+
+    return decode
+
+
+U16 = _unsigned(16)
+U32 = _unsigned(32)
+U64 = _unsigned(64)
+U128 = _unsigned(128)
+
+
+def Str(value: Any, path: str) -> str:
+    if not isinstance(value, str):
+        raise ValueError(f"{path}: expected string, got {type(value).__name__}")
+    return value
+
+
+def Bool(value: Any, path: str) -> bool:
+    if not isinstance(value, bool):
+        raise ValueError(f"{path}: expected bool, got {type(value).__name__}")
+    return value
+
+
+def ByteVec(value: Any, path: str) -> bytes:
+    if not isinstance(value, list):
+        raise ValueError(f"{path}: expected byte vector, got {type(value).__name__}")
+    try:
+        return bytes(value)
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"{path}: invalid byte vector ({e})")
+
+
+def Json(value: Any, path: str) -> Any:
+    """Any JSON value, passed through untouched."""
+    return value
+
+
+# ---------------------------
+# Composite decoders
+# ---------------------------
+def Option(inner: Decoder) -> Decoder:
+    def decode(value: Any, path: str) -> Any:
+        return None if value is None else inner(value, path)
+
+    return decode
+
+
+def Vec(inner: Decoder) -> Decoder:
+    def decode(value: Any, path: str) -> list:
+        if not isinstance(value, list):
+            raise ValueError(f"{path}: expected list, got {type(value).__name__}")
+        return [inner(item, f"{path}[{i}]") for i, item in enumerate(value)]
+
+    return decode
+
+
+def Tuple(*items: Decoder) -> Decoder:
+    def decode(value: Any, path: str) -> tuple:
+        if not isinstance(value, list) or len(value) != len(items):
+            raise ValueError(f"{path}: expected tuple of {len(items)} items, got {value!r}")
+        return tuple(item(v, f"{path}[{i}]") for i, (item, v) in enumerate(zip(items, value)))
+
+    return decode
+
+
+def Struct(**fields: Decoder) -> Decoder:
+    def decode(value: Any, path: str) -> dict:
+        if not isinstance(value, dict):
+            raise ValueError(f"{path}: expected object, got {type(value).__name__}")
+        missing = fields.keys() - value.keys()
+        if missing:
+            raise ValueError(f"{path}: missing field(s) {sorted(missing)}")
+        return {name: field(value[name], f"{path}.{name}") for name, field in fields.items()}
+
+    return decode
+
+
+def EnumOf(enum_cls: Type[Enum]) -> Decoder:
+    def decode(value: Any, path: str) -> Enum:
+        try:
+            return enum_cls(value)
+        except ValueError:
+            raise ValueError(f"{path}: {value!r} is not a valid {enum_cls.__name__}")
+
+    return decode
+
+
+# ---------------------------
+# Contract schemas
+# ---------------------------
+# Vec<(ChainId, ChainConfig)>
+CHAIN_CONFIGS = Vec(Tuple(U64, Json))
+
+# Vec<(ChainId, u128)>
+CHAIN_BALANCES = Vec(Tuple(U64, U128))
+
+# Vec<ChainId>
+SUPPORTED_CHAINS = Vec(U64)
+
+# Option<(u64, Flow, Option<Step>, Option<Step>)>
+ACTIVE_SESSION_INFO = Option(Tuple(U64, EnumOf(Flow), Option(EnumOf(TxType)), Option(EnumOf(TxType))))
+
+# ActivityLog
+ACTIVITY_LOG = Struct(
+    activity_type=Str,
+    source_chain=U64,
+    destination_chain=U64,
+    timestamp=U64,
+    nonce=U64,
+    usdc_agent_balance_before_in_source_chain=U128,
+    usdc_agent_balance_before_in_dest_chain=U128,
+    a_usdc_agent_balance_before_in_source_chain=U128,
+    a_usdc_agent_balance_before_in_dest_chain=U128,
+    amount=U128,
+    transactions=Vec(ByteVec),
+)
+
+# Vec<ActivityLog>
+ACTIVITY_LOGS = Vec(ACTIVITY_LOG)
+
+# Option<Worker>
+WORKER_INFO = Option(Struct(checksum=Str, codehash=Str))
+
+# ChainId
+CHAIN_ID = U64
+
+# Option<Vec<u8>>
+SIGNED_PAYLOAD = Option(ByteVec)
+
+
+# ---------------------------
+# Entry points
+# ---------------------------
+def result_bytes(response: Any) -> bytes:
+    """The raw bytes of a view call result (`.result` as list[int])."""
+    result = getattr(response, "result", None)
+    if not isinstance(result, list):
+        raise ValueError("Invalid response format: missing `result` as list[int]")
+    return bytes(result)
+
+
+def decode(raw: bytes | str, schema: Decoder, name: str = "result") -> Any:
+    """Parses `raw` JSON and decodes it with `schema`."""
+    try:
+        parsed = json.loads(raw)
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
+        raise ValueError(f"Failed to decode {name}: {e}")
+    return schema(parsed, name)
+
+
+def decode_result(response: Any, schema: Decoder, name: str = "result") -> Any:
+    """Decodes the result of a view call with `schema`."""
+    return decode(result_bytes(response), schema, name)
+
+
+def decode_success_value(success_value_b64: str, schema: Decoder = ByteVec, name: str = "SuccessValue") -> Any:
+    """Decodes the base64 `SuccessValue` of a transaction outcome with `schema` (a byte vector by default)."""
+    return decode(base64.b64decode(success_value_b64), schema, name)
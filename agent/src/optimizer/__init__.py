@@ -1,8 +1,27 @@
-from .optimizer import optimize_chain_allocation_with_direction
 from .optimizer_data_fetcher import get_extra_data_for_optimization
+from .incremental_optimizer import IncrementalOptimizer, ResolveDecision
+from .route_cost_model import RouteCost, RouteCostModel, select_profitable_operations
+
+
+def __getattr__(name):
+    # @dev the solver pulls in numpy and scipy; load them only once an allocation is actually optimized
+    if name == "optimize_chain_allocation_with_direction":
+        from .optimizer import optimize_chain_allocation_with_direction
+        return optimize_chain_allocation_with_direction
+    if name in ("ScenarioEngine", "ShockModel"):
+        from . import scenario_engine
+        return getattr(scenario_engine, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 __all__ = [
     "optimize_chain_allocation_with_direction",
     "get_extra_data_for_optimization",
-]
\ No newline at end of file
+    "IncrementalOptimizer",
+    "ResolveDecision",
+    "RouteCost",
+    "RouteCostModel",
+    "ScenarioEngine",
+    "ShockModel",
+    "select_profitable_operations",
+]
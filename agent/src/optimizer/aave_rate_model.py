@@ -0,0 +1,91 @@
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+
+@dataclass
+class AaveRateParams:
+    """
+    Parameters of the Aave v3 DefaultReserveInterestRateStrategy of each chain, as arrays of
+    shape (n_chains,). Rates and ratios are fractions (0.05 is 5%).
+
+    `rate_offset` (percentage points) shifts the modeled supply rate so that, at the current
+    supply and debt, it equals the observed (or overridden) `currentInterestRate`.
+    """
+    optimal_usage_ratio: np.ndarray
+    base_variable_borrow_rate: np.ndarray
+    variable_rate_slope1: np.ndarray
+    variable_rate_slope2: np.ndarray
+    reserve_factor: np.ndarray
+    rate_offset: Optional[np.ndarray] = None
+
+    @classmethod
+    def from_chains(cls, chains: list[dict]) -> "AaveRateParams":
+        """
+        Builds the parameters from the `interestRateStrategy` of each chain of the optimizer data,
+        anchored to its `currentInterestRate` when the chains carry their market state.
+        """
+        missing = [chain["chainId"] for chain in chains if not chain.get("interestRateStrategy")]
+        if missing:
+            raise ValueError(f"No interest rate strategy for chain(s) {missing}")
+
+        def column(key: str) -> np.ndarray:
+            return np.array([chain["interestRateStrategy"][key] for chain in chains], dtype=float)
+
+        params = cls(
+            optimal_usage_ratio=column("optimalUsageRatio"),
+            base_variable_borrow_rate=column("baseVariableBorrowRate"),
+            variable_rate_slope1=column("variableRateSlope1"),
+            variable_rate_slope2=column("variableRateSlope2"),
+            reserve_factor=column("reserveFactor"),
+        )
+
+        if all(key in chain for chain in chains for key in ("currentInterestRate", "totalSupply", "totalBorrow")):
+            # @dev without it the curve ignores the observed rate, and OVERRIDE_INTEREST_RATES with it
+            observed = np.array([chain["currentInterestRate"] for chain in chains], dtype=float)
+            modeled = supply_rate([chain["totalSupply"] for chain in chains], [chain["totalBorrow"] for chain in chains], params)
+            params.rate_offset = observed - modeled
+        return params
+
+
+def variable_borrow_rate(usage_ratio, params: AaveRateParams) -> np.ndarray:
+    """
+    Variable borrow rate of the kinked curve:
+
+        base + slope1 * U / U*                              for U <= U*
+        base + slope1 + slope2 * (U - U*) / (1 - U*)        above the kink
+    """
+    optimal = params.optimal_usage_ratio
+    with np.errstate(divide="ignore", invalid="ignore"):
+        below = params.base_variable_borrow_rate + params.variable_rate_slope1 * np.where(optimal > 0, usage_ratio / optimal, 1.0)
+        above = (
+            params.base_variable_borrow_rate
+            + params.variable_rate_slope1
+            + params.variable_rate_slope2 * np.where(optimal < 1, (usage_ratio - optimal) / (1 - optimal), 0.0)
+        )
+    return np.where(usage_ratio <= optimal, below, above)
+
+
+def supply_rate(total_supply, total_borrow, params: AaveRateParams) -> np.ndarray:
+    """
+    Supply APR (%) of reserves with `total_supply` and `total_borrow`: the borrow rate paid on
+    the used share of the liquidity, minus the reserve factor.
+
+    Inputs broadcast against the (n_chains,) parameters, so a batch of candidate supplies of
+    shape (m, n_chains) is evaluated in one call.
+    """
+    total_supply = np.asarray(total_supply, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        usage_ratio = np.where(total_supply > 0, np.asarray(total_borrow, dtype=float) / total_supply, 0.0)
+    # @dev a withdrawal cannot take the supply below the debt, cap at fully used
+    usage_ratio = np.clip(usage_ratio, 0.0, 1.0)
+    rate = variable_borrow_rate(usage_ratio, params) * usage_ratio * (1 - params.reserve_factor) * 100
+    if params.rate_offset is not None:
+        rate = np.maximum(rate + params.rate_offset, 0.0)
+    return rate
+
+
+def supply_rates_for_allocations(allocations, current_alloc, total_supply, total_borrow, params: AaveRateParams) -> np.ndarray:
+    """Supply APR (%) of each chain once the agent holds `allocations` instead of `current_alloc` in it."""
+    return supply_rate(np.asarray(total_supply) + np.asarray(allocations) - np.asarray(current_alloc), total_borrow, params)
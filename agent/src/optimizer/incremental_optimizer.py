@@ -0,0 +1,123 @@
+import copy
+from dataclasses import dataclass
+from typing import Optional
+
+# inputs of each chain compared between runs; the allocation is compared relative to the total funds
+CHAIN_INPUTS = ("currentInterestRate", "supplyElasticity", "totalSupply", "totalBorrow")
+
+
+@dataclass
+class ResolveDecision:
+    """Why the optimizer did or did not solve again on a run."""
+    resolved: bool
+    reason: str
+    max_change: Optional[float] = None   # largest relative input change since the last solve
+    changed_input: Optional[str] = None  # input with that change, e.g. "8453.totalBorrow"
+
+    def to_dict(self) -> dict:
+        return {"resolved": self.resolved, "reason": self.reason, "maxChange": self.max_change, "changedInput": self.changed_input}
+
+
+def _relative_change(previous: float, current: float, scale: float = None) -> float:
+    scale = abs(previous) if scale is None else scale
+    if scale == 0:
+        return 0.0 if current == previous else float("inf")
+    return abs(current - previous) / scale
+
+
+def largest_input_change(previous: dict, current: dict) -> tuple[float, Optional[str]]:
+    """
+    Largest relative change between two optimizer inputs with the same chains, and where it is.
+
+    Allocations are compared relative to the total funds, so an empty chain receiving a few
+    units does not count as an infinite change.
+    """
+    changes = [(_relative_change(previous["totalAssetsUnderManagement"], current["totalAssetsUnderManagement"]), "totalAssetsUnderManagement")]
+    total_funds = max(previous["totalAssetsUnderManagement"], current["totalAssetsUnderManagement"])
+    previous_chains = {chain["chainId"]: chain for chain in previous["chains"]}
+
+    for chain in current["chains"]:
+        chain_id = chain["chainId"]
+        before = previous_chains[chain_id]
+        changes.append((_relative_change(before["currentAllocation"], chain["currentAllocation"], scale=total_funds), f"{chain_id}.currentAllocation"))
+        changes += [(_relative_change(before[key], chain[key]), f"{chain_id}.{key}") for key in CHAIN_INPUTS]
+
+        strategy_before, strategy = before.get("interestRateStrategy") or {}, chain.get("interestRateStrategy") or {}
+        changes += [
+            (_relative_change(strategy_before.get(key, 0), strategy.get(key, 0)), f"{chain_id}.interestRateStrategy.{key}")
+            for key in strategy_before.keys() | strategy.keys()
+        ]
+
+    return max(changes, key=lambda change: change[0])
+
+
+class IncrementalOptimizer:
+    """
+    Keeps the last optimum and the inputs it was solved for, so frequent runs only solve
+    again when the market moved.
+
+    A run whose inputs all changed by less than `sensitivity` (relative, e.g. 0.001 = 0.1%)
+    since the last solve reuses that optimum, rescaled to the current total funds. Changes
+    are measured against the last solve rather than the last run, so slow drift still
+    triggers a solve once it adds up. Otherwise the solver is warm-started from the last
+    optimum. `last_decision` tells which of the two happened and why.
+    """
+
+    def __init__(self, solver: str = "kkt", rate_model: str = "linear", sensitivity: float = 0.001):
+        self.solver = solver
+        self.rate_model = rate_model
+        self.sensitivity = sensitivity
+        self.last_inputs: Optional[dict] = None
+        self.last_result: Optional[dict] = None
+        self.last_decision: Optional[ResolveDecision] = None
+
+    def optimize(self, data: dict) -> dict:
+        """Returns the optimized allocations for `data`, like `optimize_chain_allocation_with_direction`."""
+        decision = self._decide(data)
+        self.last_decision = decision
+
+        if not decision.resolved:
+            print(f"♻️ Reusing the last optimum: {decision.reason}")
+            return self._rescaled_last_result(data["totalAssetsUnderManagement"])
+
+        print(f"🧮 Solving allocations: {decision.reason}")
+        from .optimizer import optimize_chain_allocation_with_direction  # @dev loads numpy/scipy on the first solve only
+
+        result = optimize_chain_allocation_with_direction(data, solver=self.solver, rate_model=self.rate_model, warm_start=self.last_result)
+
+        # only keep real optima, a failed solve returns the current allocation without a solver
+        if "solver" in result:
+            self.last_inputs = copy.deepcopy(data)
+            self.last_result = result
+        return result
+
+    def _decide(self, data: dict) -> ResolveDecision:
+        if self.last_result is None:
+            return ResolveDecision(resolved=True, reason="no previous solution")
+
+        if {chain["chainId"] for chain in data["chains"]} != {chain["chainId"] for chain in self.last_inputs["chains"]}:
+            return ResolveDecision(resolved=True, reason="the set of chains changed")
+
+        max_change, changed_input = largest_input_change(self.last_inputs, data)
+        if max_change > self.sensitivity:
+            return ResolveDecision(
+                resolved=True,
+                reason=f"{changed_input} moved {max_change:.4%} (> {self.sensitivity:.4%})",
+                max_change=max_change,
+                changed_input=changed_input,
+            )
+
+        return ResolveDecision(
+            resolved=False,
+            reason=f"every input within {self.sensitivity:.4%} of the last solve (largest: {changed_input} {max_change:.4%})",
+            max_change=max_change,
+            changed_input=changed_input,
+        )
+
+    def _rescaled_last_result(self, total_funds: int) -> dict:
+        result = dict(self.last_result)
+        previous_total = self.last_result["totalAssetsUnderManagement"]
+        scale = total_funds / previous_total if previous_total else 1.0
+        result["totalAssetsUnderManagement"] = total_funds
+        result["allocations"] = {chain_id: round(amount * scale) for chain_id, amount in self.last_result["allocations"].items()}
+        return result
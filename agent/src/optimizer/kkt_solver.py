@@ -0,0 +1,177 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+# relative tolerance of the bounds and of the optimality certificate
+TOLERANCE = 1e-9
+# relative error on the budget at which the multiplier search stops
+BUDGET_TOLERANCE = 1e-13
+MAX_ITERATIONS = 200
+
+
+@dataclass
+class OptimalityCertificate:
+    """
+    KKT conditions checked at the returned allocation.
+
+    The problem is concave when no chain rate is clamped at zero, so `is_optimal` (every
+    residual within tolerance) proves the allocation is the global optimum.
+    """
+    multiplier: float               # λ, marginal yield of the last unit allocated
+    stationarity_residual: float    # max |f_i'(a_i) - λ| over interior chains (plus bound violations)
+    budget_residual: float          # |Σ a_i - total|, in funds
+    rate_floor_active: bool         # some chain rate would go below zero (objective not concave there)
+    iterations: int
+    is_optimal: bool
+
+    def to_dict(self) -> dict:
+        return {
+            "multiplier": self.multiplier,
+            "stationarityResidual": self.stationarity_residual,
+            "budgetResidual": self.budget_residual,
+            "rateFloorActive": self.rate_floor_active,
+            "iterations": self.iterations,
+            "isOptimal": self.is_optimal,
+        }
+
+
+@dataclass
+class WaterFillingSolution:
+    allocations: np.ndarray  # funds per chain, summing to the total
+    certificate: OptimalityCertificate
+
+
+def rate_terms(current_rates, supply_elasticity, total_supply, total_borrow, current_alloc):
+    """
+    Rewrites the direction-aware rate of each chain as a function of the funds `a` placed in it:
+
+        r(a) = R + e * (100 * B / (K + a) - U) = α + β / (K + a)
+
+    with K the supply of everyone else, α = R - e * U and β = 100 * e * B.
+    """
+    current_utilization = total_borrow / total_supply * 100
+    others_supply = np.maximum(total_supply - current_alloc, 0.0)
+    alpha = current_rates - supply_elasticity * current_utilization
+    beta = 100 * supply_elasticity * total_borrow
+    return alpha, beta, others_supply
+
+
+def marginal_yield(a, alpha, beta, others_supply):
+    """f'(a) for f(a) = a * r(a): α + β K / (K + a)²."""
+    denominator = others_supply + a
+    with np.errstate(divide="ignore", invalid="ignore"):
+        curvature = np.where(denominator > 0, beta * others_supply / denominator**2, 0.0)
+    return alpha + curvature
+
+
+def solve_water_filling(total_funds, current_rates, supply_elasticity, total_supply, total_borrow, current_alloc, initial_multiplier: float = None) -> WaterFillingSolution:
+    """
+    Maximizes Σ a_i * r_i(a_i) subject to Σ a_i = total_funds and 0 <= a_i <= total_funds.
+
+    Each term is concave (β, K >= 0), so the KKT conditions are sufficient: every chain with
+    funds has the same marginal yield λ, chains left empty have a lower one at zero, and a
+    chain holding everything has a higher one at the top. For a given λ the allocation of a
+    chain has a closed form,
+
+        a_i(λ) = clip(sqrt(β_i K_i / (λ - α_i)) - K_i, 0, total_funds),
+
+    and Σ a_i(λ) decreases with λ, so λ is found on the budget ("water filling") with Newton
+    steps on the analytic derivative of Σ a_i(λ), safeguarded by bisection.
+    Chains whose yield does not depend on the amount (β_i K_i = 0) take the remainder.
+
+    `initial_multiplier` (e.g. λ of the previous solution) starts the search there instead of
+    the middle of the bracket; when the market barely moved Newton converges in a few steps.
+    """
+    total_funds = float(total_funds)
+    arrays = [np.asarray(values, dtype=float) for values in (current_rates, supply_elasticity, total_supply, total_borrow, current_alloc)]
+    alpha, beta, others_supply = rate_terms(*arrays)
+    curved = beta * others_supply > 0
+
+    def allocation(multiplier: float) -> np.ndarray:
+        gap = multiplier - alpha
+        with np.errstate(divide="ignore", invalid="ignore"):
+            interior = np.sqrt(np.where(curved & (gap > 0), beta * others_supply / gap, np.inf)) - others_supply
+        # a flat chain gets nothing unless its yield beats λ, then it is capped by the budget
+        flat = np.where(alpha > multiplier, total_funds, 0.0)
+        return np.clip(np.where(curved, interior, flat), 0.0, total_funds)
+
+    def allocation_slope(multiplier: float, allocated: np.ndarray) -> float:
+        # d a_i / d λ = -sqrt(β K) / 2 (λ - α)^(3/2) for chains strictly between their bounds
+        gap = multiplier - alpha
+        free = curved & (gap > 0) & (allocated > 0) & (allocated < total_funds)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return float(-np.sum(np.where(free, np.sqrt(beta * others_supply) / (2 * gap**1.5), 0.0)))
+
+    # bracket λ between the lowest marginal yield at full allocation and the highest at zero
+    low = float(np.min(marginal_yield(total_funds, alpha, beta, others_supply))) - 1.0
+    high = float(np.max(marginal_yield(0.0, alpha, beta, others_supply))) + 1.0
+
+    # safeguarded Newton on the budget: Newton steps while they stay inside the bracket, bisection otherwise
+    iterations = 0
+    scale = max(abs(low), abs(high), 1.0)
+    multiplier = initial_multiplier if initial_multiplier is not None and low < initial_multiplier < high else (low + high) / 2
+    while iterations < MAX_ITERATIONS:
+        iterations += 1
+        allocated = allocation(multiplier)
+        excess = float(np.sum(allocated)) - total_funds
+        if abs(excess) <= BUDGET_TOLERANCE * total_funds:
+            break
+        if excess > 0:
+            low = multiplier
+        else:
+            high = multiplier
+
+        slope = allocation_slope(multiplier, allocated)
+        candidate = multiplier - excess / slope if slope < 0 else None
+        bisection = (low + high) / 2
+        multiplier = candidate if candidate is not None and low < candidate < high else bisection
+        if multiplier in (low, high):
+            break  # bracket collapsed to float precision
+
+    # curved chains at λ, then the remainder to flat chains whose yield is at least λ (best first)
+    allocations = np.where(curved, allocation(multiplier), 0.0)
+    remainder = total_funds - np.sum(allocations)
+    for i in sorted(np.flatnonzero(~curved), key=lambda i: -alpha[i]):
+        if remainder <= 0 or alpha[i] < multiplier - TOLERANCE * scale:
+            break
+        allocations[i] = min(total_funds, remainder)
+        remainder -= allocations[i]
+
+    # rounding leftovers go to the largest funded chain, where they move its marginal yield the least
+    if remainder != 0:
+        allocations[int(np.argmax(allocations))] += remainder
+
+    return WaterFillingSolution(
+        allocations=allocations,
+        certificate=certify(allocations, multiplier, total_funds, alpha, beta, others_supply, iterations),
+    )
+
+
+def certify(allocations, multiplier, total_funds, alpha, beta, others_supply, iterations: int = 0) -> OptimalityCertificate:
+    """Checks the KKT conditions of the water-filling problem at `allocations`."""
+    marginal = marginal_yield(allocations, alpha, beta, others_supply)
+    scale = max(1.0, float(np.max(np.abs(marginal))))
+    at_zero = allocations <= TOLERANCE * total_funds
+    at_top = allocations >= total_funds * (1 - TOLERANCE)
+    interior = ~at_zero & ~at_top
+
+    residuals = np.concatenate([
+        np.abs(marginal[interior] - multiplier),
+        np.maximum(marginal[at_zero] - multiplier, 0.0),   # an empty chain must not yield more than λ
+        np.maximum(multiplier - marginal[at_top], 0.0),    # a full chain must not yield less than λ
+    ])
+    stationarity_residual = float(np.max(residuals)) if residuals.size else 0.0
+    budget_residual = float(abs(np.sum(allocations) - total_funds))
+
+    with np.errstate(divide="ignore"):
+        rates = alpha + np.where(others_supply + allocations > 0, beta / (others_supply + allocations), 0.0)
+    rate_floor_active = bool(np.any(rates < 0))
+
+    return OptimalityCertificate(
+        multiplier=float(multiplier),
+        stationarity_residual=stationarity_residual,
+        budget_residual=budget_residual,
+        rate_floor_active=rate_floor_active,
+        iterations=iterations,
+        is_optimal=stationarity_residual <= 1e-6 * scale and budget_residual <= 1e-6 * max(total_funds, 1.0) and not rate_floor_active,
+    )
@@ -1,7 +1,17 @@
 import numpy as np
 from scipy.optimize import minimize
 
-def optimize_chain_allocation_with_direction(data):
+from .aave_rate_model import AaveRateParams, supply_rates_for_allocations
+from .kkt_solver import certify, marginal_yield, rate_terms, solve_water_filling
+
+SOLVERS = ("kkt", "slsqp")
+RATE_MODELS = ("linear", "aave")
+
+# candidate moves per chain are multiples of total_funds / GRID_STEPS
+GRID_STEPS = 1000
+
+
+def optimize_chain_allocation_with_direction(data, solver: str = "kkt", rate_model: str = "linear", warm_start: dict = None):
     """
     Optimizes allocation of funds across multiple AAVE chains with direction-aware elasticity.
     
@@ -15,6 +25,13 @@ def optimize_chain_allocation_with_direction(data):
                 - supplyElasticity: How much interest rate changes per 1% utilization
                 - totalSupply: Total supplied assets in the market
                 - totalBorrow: Total borrowed assets in the market
+                - interestRateStrategy: Aave strategy parameters (only for the "aave" rate model)
+        solver (str): "kkt" (exact water-filling on the Lagrange multiplier, default) or
+            "slsqp" (scipy SLSQP, kept for comparison); used by the linear rate model
+        rate_model (str): "linear" (current rate + supplyElasticity * Δutilization, default) or
+            "aave" (the kinked Aave v3 curve, solved exactly on a grid of candidate allocations)
+        warm_start (dict): A previous result of this function; the KKT solver starts from its
+            multiplier and SLSQP from its allocations. The grid search is exhaustive and ignores it.
     
     Returns:
         dict: Optimized allocations across chains
@@ -26,6 +43,11 @@ def optimize_chain_allocation_with_direction(data):
     # Check if we have chains to optimize
     if not chains:
         return data
+
+    if solver not in SOLVERS:
+        raise ValueError(f"Unknown optimizer solver {solver!r}, expected one of {SOLVERS}")
+    if rate_model not in RATE_MODELS:
+        raise ValueError(f"Unknown rate model {rate_model!r}, expected one of {RATE_MODELS}")
     
     # Extract chain data into arrays for optimization
     n_chains = len(chains)
@@ -39,9 +61,96 @@ def optimize_chain_allocation_with_direction(data):
     # Calculate current utilization rates
     current_utilization = total_borrow / total_supply * 100  # percentage
     
-    # Initial allocation proportions (current state)
+    # Initial allocation proportions (current state, or the previous optimum when warm-starting)
     x0 = current_alloc / total_funds
+    if warm_start and all(chain_id in warm_start["allocations"] for chain_id in chain_ids):
+        previous = np.array([warm_start["allocations"][chain_id] for chain_id in chain_ids], dtype=float)
+        if previous.sum() > 0:
+            x0 = previous / previous.sum()
     
+    alpha, beta, others_supply = rate_terms(current_rates, supply_elasticity, total_supply, total_borrow, current_alloc)
+
+    if rate_model == "aave":
+        rate_params = AaveRateParams.from_chains(chains)
+        result_x = _solve_aave_grid(total_funds, current_alloc, total_supply, total_borrow, rate_params) / total_funds
+        solver = "grid"
+        certificate = None
+        success = True
+    elif solver == "kkt":
+        previous_certificate = (warm_start or {}).get("optimalityCertificate") or {}
+        solution = solve_water_filling(
+            total_funds, current_rates, supply_elasticity, total_supply, total_borrow, current_alloc,
+            initial_multiplier=previous_certificate.get("multiplier"),
+        )
+        certificate = solution.certificate
+        result_x = solution.allocations / total_funds
+        success = True
+        if not certificate.is_optimal:
+            print(f"⚠️ Water-filling allocation not certified optimal: {certificate}")
+    else:
+        result_x, success = _solve_slsqp(x0, n_chains, total_funds, total_borrow, total_supply, current_alloc, current_rates, current_utilization, supply_elasticity)
+        certificate = None
+        if success:
+            # the multiplier of a KKT point is the common marginal yield of the funded chains
+            allocation = result_x * total_funds
+            marginal = marginal_yield(allocation, alpha, beta, others_supply)
+            funded = allocation > 0
+            multiplier = float(np.median(marginal[funded])) if np.any(funded) else float(np.max(marginal))
+            certificate = certify(allocation, multiplier, total_funds, alpha, beta, others_supply)
+
+    if success:
+        result_x = np.asarray(result_x)
+        # Convert optimal proportions to allocations
+        optimal_alloc = result_x * total_funds
+
+        # 1) Current average interest rate
+        #    Weighted by the current allocations
+        current_alloc_proportions = current_alloc / total_funds
+        current_average_interest = np.sum(current_alloc_proportions * current_rates)
+
+        # 2) Updated interest rate after rebalancing
+        if rate_model == "aave":
+            updated_rates = supply_rates_for_allocations(optimal_alloc, current_alloc, total_supply, total_borrow, rate_params)
+        else:
+            delta_u = (optimal_alloc - current_alloc) / total_supply * 100
+            updated_rates = current_rates + supply_elasticity * delta_u
+
+        # 3) Projected average interest rate
+        #    Weighted by the new allocation proportions (result_x)
+        projected_average_interest = np.sum(result_x * updated_rates)
+
+        # 4) Projected change in interest rates for each chain
+        projected_interest_changes = updated_rates - current_rates
+
+        # Prepare output with new allocations
+        new_allocations = {}
+        for i, chain_id in enumerate(chain_ids):
+            ## TRY COMMENTING OUT THE RESTRICTION ON OPTIMAL ALLOCATION
+            # # Return null if allocation didn't change significantly (within 1%)
+            # if abs(optimal_alloc[i] - current_alloc[i]) < 0.05 * current_alloc[i]:
+            #     new_allocations[chain_id] = None
+            # else:
+                new_allocations[chain_id] = round(optimal_alloc[i])
+
+        return {
+            "totalAssetsUnderManagement": total_funds,
+            "allocations": new_allocations,
+            "currentAverageInterestRate": f"{current_average_interest:.2f}%",
+            "updatedInterestRates": [f"{rate:.2f}%" for rate in updated_rates],
+            "projectedInterestRateChanges": [f"{change:.2f}%" for change in projected_interest_changes],
+            "projectedAverageInterestRate": f"{projected_average_interest:.2f}%",
+            "solver": solver,
+            "rateModel": rate_model,
+            "optimalityCertificate": certificate.to_dict() if certificate else None,
+        }
+    else:
+        return {
+            "totalAssetsUnderManagement": total_funds,
+            "allocations": {chain_id: round(current_alloc[i]) for i, chain_id in enumerate(chain_ids)}
+        }
+
+
+def _solve_slsqp(x0, n_chains, total_funds, total_borrow, total_supply, current_alloc, current_rates, current_utilization, supply_elasticity):
     # Objective function to maximize (negative for minimization)
     def objective(x):
         # Calculate the net change in allocation for each chain
@@ -70,56 +179,65 @@ def optimize_chain_allocation_with_direction(data):
         
         # Weighted average return (negative for minimization)
         return -np.sum(x * new_rates)
+
+    # Analytic gradient of the objective: -(r_i + x_i * dr_i/dx_i)
+    def gradient(x):
+        new_total_supply = total_supply + x * total_funds - current_alloc
+        safe_supply = np.where(new_total_supply > 0, new_total_supply, 1)
+        new_rates = current_rates + supply_elasticity * (np.where(new_total_supply > 0, total_borrow / safe_supply * 100, 0) - current_utilization)
+        rate_slope = np.where(new_total_supply > 0, -supply_elasticity * total_borrow * 100 * total_funds / safe_supply**2, 0)
+        rate_slope = np.where(new_rates > 0, rate_slope, 0)
+        return -(np.maximum(new_rates, 0) + x * rate_slope)
     
     # Constraints: sum of allocations = 1
-    constraints = [{'type': 'eq', 'fun': lambda x: np.sum(x) - 1.0}]
+    constraints = [{'type': 'eq', 'fun': lambda x: np.sum(x) - 1.0, 'jac': lambda x: np.ones_like(x)}]
     
     # Bounds: allocations between 0 and 1
     bounds = [(0, 1) for _ in range(n_chains)]
     
     # Solve optimization problem
-    result = minimize(objective, x0, method='SLSQP', bounds=bounds, constraints=constraints)
-    
-    if result.success:
-        # Convert optimal proportions to allocations
-        optimal_alloc = result.x * total_funds
+    result = minimize(objective, x0, jac=gradient, method='SLSQP', bounds=bounds, constraints=constraints)
+    return result.x, result.success
 
-        # 1) Current average interest rate
-        #    Weighted by the current allocations
-        current_alloc_proportions = current_alloc / total_funds
-        current_average_interest = np.sum(current_alloc_proportions * current_rates)
 
-        # 2) Updated interest rate after rebalancing
-        delta_u = (optimal_alloc - current_alloc) / total_supply * 100
-        updated_rates = current_rates + supply_elasticity * delta_u
+def _solve_aave_grid(total_funds, current_alloc, total_supply, total_borrow, rate_params: AaveRateParams):
+    """
+    Maximizes Σ a_i * r_i(a_i) under the Aave rate curves, whose kink makes the objective
+    non-concave, so marginal-yield methods can stop at the wrong side of it.
 
-        # 3) Projected average interest rate
-        #    Weighted by the new allocation proportions (result.x)
-        projected_average_interest = np.sum(result.x * updated_rates)
+    Every chain may move by j * Δ (Δ = total_funds / GRID_STEPS, |j| <= GRID_STEPS), which
+    keeps unchanged chains exactly where they are. The yield of every candidate of every
+    chain is evaluated in one vectorized call, then a dynamic program over the running sum
+    of the moves picks the best combination whose moves sum to zero (budget preserved).
+    """
+    n_chains = len(current_alloc)
+    step = total_funds / GRID_STEPS
+    moves = np.arange(-GRID_STEPS, GRID_STEPS + 1)
 
-        # 4) Projected change in interest rates for each chain
-        projected_interest_changes = updated_rates - current_rates
+    candidates = current_alloc[None, :] + moves[:, None] * step
+    feasible = (candidates >= -1e-9 * total_funds) & (candidates <= total_funds * (1 + 1e-9))
+    candidates = np.clip(candidates, 0.0, total_funds)
+    yields = candidates * supply_rates_for_allocations(candidates, current_alloc, total_supply, total_borrow, rate_params) / 100
 
-        # Prepare output with new allocations
-        new_allocations = {}
-        for i, chain_id in enumerate(chain_ids):
-            ## TRY COMMENTING OUT THE RESTRICTION ON OPTIMAL ALLOCATION
-            # # Return null if allocation didn't change significantly (within 1%)
-            # if abs(optimal_alloc[i] - current_alloc[i]) < 0.05 * current_alloc[i]:
-            #     new_allocations[chain_id] = None
-            # else:
-                new_allocations[chain_id] = round(optimal_alloc[i])
+    # best[s]: best yield of the chains seen so far when their moves add up to s - GRID_STEPS
+    best = np.full(moves.size, -np.inf)
+    best[GRID_STEPS] = 0.0
+    choices = []
+    for i in range(n_chains):
+        chain_moves = moves[feasible[:, i]]
+        chain_yields = yields[feasible[:, i], i]
+        previous = np.arange(moves.size)[:, None] - chain_moves[None, :]
+        reachable = (previous >= 0) & (previous < moves.size)
+        totals = np.where(reachable, best[np.clip(previous, 0, moves.size - 1)] + chain_yields[None, :], -np.inf)
+        picked = np.argmax(totals, axis=1)
+        choices.append(chain_moves[picked])
+        best = totals[np.arange(moves.size), picked]
 
-        return {
-            "totalAssetsUnderManagement": total_funds,
-            "allocations": new_allocations,
-            "currentAverageInterestRate": f"{current_average_interest:.2f}%",
-            "updatedInterestRates": [f"{rate:.2f}%" for rate in updated_rates],
-            "projectedInterestRateChanges": [f"{change:.2f}%" for change in projected_interest_changes],
-            "projectedAverageInterestRate": f"{projected_average_interest:.2f}%"
-        }
-    else:
-        return {
-            "totalAssetsUnderManagement": total_funds,
-            "allocations": {chain_id: round(current_alloc[i]) for i, chain_id in enumerate(chain_ids)}
-        }
\ No newline at end of file
+    # walk back from "moves add up to zero"
+    chosen = np.zeros(n_chains, dtype=int)
+    position = GRID_STEPS
+    for i in reversed(range(n_chains)):
+        chosen[i] = choices[i][position]
+        position -= chosen[i]
+
+    return np.clip(current_alloc + chosen * step, 0.0, total_funds)
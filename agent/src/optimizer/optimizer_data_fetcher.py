@@ -1,40 +1,44 @@
-from web3 import Web3
-from near_omni_client.adapters.aave import LendingPool
-from near_omni_client.wallets import MPCWallet
-
+from helpers import AsyncAlchemyFactoryProvider, ReserveRateReader, gather_per_chain
 from utils import from_chain_id_to_network
 
-async def get_extra_data_for_optimization(total_assets_under_management, mpc_wallet: MPCWallet, current_allocations, configs, override_interest_rates: dict = None) -> dict:
+async def get_extra_data_for_optimization(total_assets_under_management, evm_factory_provider: AsyncAlchemyFactoryProvider, current_allocations, configs, override_interest_rates: dict = None, timeout_seconds: float = 30) -> dict:
     
     data = {
         "chains": [],
         "totalAssetsUnderManagement": total_assets_under_management
     }
 
-    for chain_id, allocation in current_allocations.items():
-        network = from_chain_id_to_network(chain_id)
-        asset_in_network = configs[chain_id]["aave"]["asset"]
-        asset_address = Web3.to_checksum_address(asset_in_network)
-        lending_pool = LendingPool(wallet=mpc_wallet, network=network)
+    async def fetch_chain_data(chain_id: int) -> dict:
+        web3_instance = evm_factory_provider.get_provider(from_chain_id_to_network(chain_id))
+
+        # @dev reserve state and interest rate strategy in two multicalls
+        reserve = await ReserveRateReader.read(web3_instance, configs[chain_id])
 
         if override_interest_rates and chain_id in override_interest_rates:
             interest_rate = override_interest_rates[chain_id]
         else:
-            interest_rate =  lending_pool.get_interest_rate(asset_address)
-            
-        slope =  lending_pool.get_slope(asset_address)
-        total_supply, total_borrow =  lending_pool.get_supply_and_borrow(asset_address)
-        
-        data["chains"].append({
+            interest_rate = reserve.liquidity_rate * 100
+
+        # linear elasticity: the slope of the strategy segment the reserve currently sits on
+        usage_ratio = reserve.total_borrow / reserve.total_supply if reserve.total_supply > 0 else 0
+        slope = reserve.variable_rate_slope1 if usage_ratio <= reserve.optimal_usage_ratio else reserve.variable_rate_slope2
+
+        return {
             "chainId": chain_id,
-            "currentAllocation": allocation,
+            "currentAllocation": current_allocations[chain_id],
             "currentInterestRate": interest_rate,
-            "supplyElasticity": slope,
-            "totalSupply": total_supply,
-            "totalBorrow": total_borrow
-        })
-
-    return data
+            "supplyElasticity": slope * 100,
+            "totalSupply": reserve.total_supply,
+            "totalBorrow": reserve.total_borrow,
+            "interestRateStrategy": reserve.to_dict(),
+        }
 
+    chains_data = await gather_per_chain(
+        current_allocations.keys(),
+        fetch_chain_data,
+        timeout_seconds=timeout_seconds,
+        label="get_extra_data_for_optimization",
+    )
+    data["chains"] = list(chains_data.values())
 
-    
\ No newline at end of file
+    return data
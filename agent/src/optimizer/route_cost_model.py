@@ -0,0 +1,168 @@
+import asyncio
+from dataclasses import dataclass
+
+from helpers import GasEstimator, compute_cctp_fee
+from utils import from_chain_id_to_network
+
+USDC_DECIMALS = 6
+MIN_NEAR_GAS_PRICE = 100_000_000  # yoctoNEAR per gas, the protocol minimum
+YOCTO_PER_NEAR = 10**24
+WEI_PER_ETH = 10**18
+
+# @dev typical gasUsed of each EVM transaction of a rebalance; approvals are for the max allowance, so they are not counted per route
+WITHDRAW_GAS = 250_000   # Aave withdraw, or vault withdrawForCrossChainAllocation
+BURN_GAS = 200_000       # CCTP depositForBurn
+MINT_GAS = 250_000       # CCTP receiveMessage
+SUPPLY_GAS = 250_000     # Aave supply, or vault returnFunds
+
+# NEAR transactions of a rebalance: start, the four signed steps and complete
+NEAR_TXS_PER_REBALANCE = 6
+
+
+@dataclass
+class RouteCost:
+    """Cost of moving funds along one route, in USDC base units."""
+    bridge_fee: int   # CCTP fee withheld from the minted amount
+    evm_gas: int      # withdraw + burn on the source chain, mint + supply on the destination chain
+    near_gas: int     # NEAR state-machine transactions, priced at the gas attached to them (upper bound)
+
+    @property
+    def total(self) -> int:
+        return self.bridge_fee + self.evm_gas + self.near_gas
+
+    def to_dict(self) -> dict:
+        return {"bridgeFee": self.bridge_fee, "evmGas": self.evm_gas, "nearGas": self.near_gas, "total": self.total}
+
+
+class RouteCostModel:
+    """
+    Estimates what a rebalance operation costs before it is executed.
+
+    - bridge fee: CCTP fee of the route, from the same `compute_cctp_fee` as ComputeCctpFees
+    - EVM gas: gas units of the withdraw/burn/mint/supply sequence at the current base fee
+      plus priority fee of the FeeOracle "normal" tier
+    - NEAR gas: the gas attached to every state-machine transaction, at the minimum gas price
+
+    Native gas is converted to USDC with `native_token_prices_usd` (e.g. {"ETH": 3000, "NEAR": 3});
+    every supported EVM chain pays gas in ETH, which `Config` validates (`ETH_GAS_NETWORKS`).
+    """
+
+    def __init__(self, gas_estimator: GasEstimator, tx_tgas: int, max_bridge_fee: int, native_token_prices_usd: dict[str, float]):
+        self.gas_estimator = gas_estimator
+        self.tx_tgas = tx_tgas
+        self.max_bridge_fee = max_bridge_fee
+        self.native_token_prices_usd = native_token_prices_usd
+
+    async def estimate(self, from_chain_id: int, to_chain_id: int, amount: int) -> RouteCost:
+        from_network = from_chain_id_to_network(from_chain_id)
+        to_network = from_chain_id_to_network(to_chain_id)
+
+        bridge_fee, source_gas_price, destination_gas_price = await asyncio.gather(
+            compute_cctp_fee(from_network, to_network, amount, self.max_bridge_fee),
+            self._gas_price(from_network),
+            self._gas_price(to_network),
+        )
+
+        evm_gas_wei = (WITHDRAW_GAS + BURN_GAS) * source_gas_price + (MINT_GAS + SUPPLY_GAS) * destination_gas_price
+        near_gas_yocto = NEAR_TXS_PER_REBALANCE * self.tx_tgas * 10**12 * MIN_NEAR_GAS_PRICE
+
+        return RouteCost(
+            bridge_fee=bridge_fee,
+            evm_gas=self._to_usdc(evm_gas_wei / WEI_PER_ETH, "ETH"),
+            near_gas=self._to_usdc(near_gas_yocto / YOCTO_PER_NEAR, "NEAR"),
+        )
+
+    async def estimate_all(self, rebalance_operations: list[dict]) -> list[RouteCost]:
+        return list(await asyncio.gather(*(self.estimate(op["from"], op["to"], op["amount"]) for op in rebalance_operations)))
+
+    async def _gas_price(self, network) -> int:
+        fees = await self.gas_estimator.get_eip1559_fees(network)
+        return fees["base_fee_per_gas"] + fees["max_priority_fee_per_gas"]
+
+    def _to_usdc(self, native_amount: float, symbol: str) -> int:
+        price = self.native_token_prices_usd.get(symbol)
+        if price is None:
+            raise ValueError(f"No USD price configured for {symbol}; set it in NATIVE_TOKEN_PRICES_USD.")
+        return round(native_amount * price * 10**USDC_DECIMALS)
+
+
+def yearly_yield(data: dict, allocations: dict[int, int], rate_model: str = "linear") -> float:
+    """
+    Yearly interest of `allocations`, in USDC base units, with the rate model of the optimizer:
+    every chain's rate moves with the utilization change its new supply causes.
+    """
+    if rate_model == "aave":
+        # @dev numpy is only loaded when the kinked model is used, like the solver
+        from .aave_rate_model import AaveRateParams, supply_rates_for_allocations
+
+        chains = data["chains"]
+        amounts = [allocations.get(chain["chainId"], 0) for chain in chains]
+        rates = supply_rates_for_allocations(
+            amounts,
+            [chain["currentAllocation"] for chain in chains],
+            [chain["totalSupply"] for chain in chains],
+            [chain["totalBorrow"] for chain in chains],
+            AaveRateParams.from_chains(chains),
+        )
+        return float(sum(amount * rate / 100 for amount, rate in zip(amounts, rates)))
+
+    total = 0.0
+    for chain in data["chains"]:
+        amount = allocations.get(chain["chainId"], 0)
+        new_supply = chain["totalSupply"] + amount - chain["currentAllocation"]
+        new_utilization = chain["totalBorrow"] / new_supply * 100 if new_supply > 0 else 0
+        current_utilization = chain["totalBorrow"] / chain["totalSupply"] * 100
+        rate = max(0.0, chain["currentInterestRate"] + chain["supplyElasticity"] * (new_utilization - current_utilization))
+        total += amount * rate / 100
+    return total
+
+
+def net_gain(data: dict, rebalance_operations: list[dict], costs: list[RouteCost], holding_horizon_days: float, rate_model: str = "linear") -> float:
+    """Extra interest earned over the holding horizon by executing the operations, minus their costs."""
+    current = {chain["chainId"]: chain["currentAllocation"] for chain in data["chains"]}
+    updated = dict(current)
+    for op in rebalance_operations:
+        updated[op["from"]] = updated.get(op["from"], 0) - op["amount"]
+        updated[op["to"]] = updated.get(op["to"], 0) + op["amount"]
+
+    extra_interest = (yearly_yield(data, updated, rate_model) - yearly_yield(data, current, rate_model)) * holding_horizon_days / 365
+    return extra_interest - sum(cost.total for cost in costs)
+
+
+def select_profitable_operations(data: dict, rebalance_operations: list[dict], costs: list[RouteCost], holding_horizon_days: float, rate_model: str = "linear") -> tuple[list[dict], dict]:
+    """
+    Keeps the rebalance operations that pay for themselves within the holding horizon.
+
+    Operations are dropped one at a time, each time the one whose removal raises the net
+    gain the most, until no removal helps. The remaining set is returned only if its net
+    gain is positive, otherwise nothing is worth executing.
+
+    Returns:
+        tuple[list[dict], dict]: The operations to execute and a report of the decision.
+    """
+    selected = list(range(len(rebalance_operations)))
+
+    def gain_of(indexes: list[int]) -> float:
+        return net_gain(data, [rebalance_operations[i] for i in indexes], [costs[i] for i in indexes], holding_horizon_days, rate_model)
+
+    gain = gain_of(selected)
+    while selected:
+        best_gain, best_index = max((gain_of([j for j in selected if j != i]), i) for i in selected)
+        if best_gain <= gain:
+            break
+        gain = best_gain
+        selected.remove(best_index)
+
+    if gain <= 0:
+        selected = []
+        gain = 0.0
+
+    report = {
+        "holdingHorizonDays": holding_horizon_days,
+        "netGain": gain,
+        "operations": [
+            {**op, "cost": cost.to_dict(), "selected": i in selected}
+            for i, (op, cost) in enumerate(zip(rebalance_operations, costs))
+        ],
+    }
+    return [rebalance_operations[i] for i in selected], report
@@ -0,0 +1,284 @@
+import asyncio
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+from .aave_rate_model import AaveRateParams, supply_rates_for_allocations
+
+OBJECTIVES = ("mean", "quantile")
+
+# evaluations (candidates x scenarios x steps x chains) held in memory at once
+CHUNK_ELEMENTS = 1 << 22
+# below this many evaluations one process is faster than shipping the scenarios to workers
+PARALLEL_MIN_ELEMENTS = 1 << 27
+# candidates scored by `select`: moves from the current allocation to the optimum (both included), and perturbations of the optimum
+PARTIAL_MOVES = 11
+PERTURBATIONS = 20
+
+
+@dataclass(frozen=True)
+class ShockModel:
+    """
+    Daily shocks of the market of every chain, as correlated random walks:
+
+    - supply_volatility / borrow_volatility: std of the daily log change of the reserve supply and debt
+    - rate_volatility: std of the daily change of the supply rate, in percentage points
+    - correlation: share of the variance coming from a factor common to all chains
+    """
+    supply_volatility: float = 0.01
+    borrow_volatility: float = 0.02
+    rate_volatility: float = 0.05
+    correlation: float = 0.5
+
+
+@dataclass
+class Scenarios:
+    """Sampled market paths, arrays of shape (scenarios, steps, chains)."""
+    total_supply: np.ndarray
+    total_borrow: np.ndarray
+    rate_shift: np.ndarray  # added to the modeled supply rate, percentage points
+
+    @property
+    def count(self) -> int:
+        return self.total_supply.shape[0]
+
+    def split(self, parts: int) -> list["Scenarios"]:
+        return [
+            Scenarios(total_supply=supply, total_borrow=borrow, rate_shift=shift)
+            for supply, borrow, shift in zip(
+                np.array_split(self.total_supply, parts),
+                np.array_split(self.total_borrow, parts),
+                np.array_split(self.rate_shift, parts),
+            )
+        ]
+
+
+def _market(data: dict, rate_model: str) -> dict:
+    chains = data["chains"]
+    market = {key: np.array([chain[key] for chain in chains], dtype=float) for key in ("currentAllocation", "currentInterestRate", "supplyElasticity", "totalSupply", "totalBorrow")}
+    market["rate_params"] = AaveRateParams.from_chains(chains) if rate_model == "aave" else None
+    market["rate_model"] = rate_model
+    return market
+
+
+def _evaluate_chunk(market: dict, candidates: np.ndarray, scenarios: Scenarios) -> np.ndarray:
+    """Yearly yield of every candidate in every scenario, averaged over the path: shape (candidates, scenarios)."""
+    current = market["currentAllocation"]
+    n_scenarios, steps, n_chains = scenarios.total_supply.shape
+    per_candidate = n_scenarios * steps * n_chains
+    batch = max(1, CHUNK_ELEMENTS // per_candidate)
+
+    yields = np.empty((len(candidates), n_scenarios))
+    for start in range(0, len(candidates), batch):
+        allocations = candidates[start:start + batch, None, None, :]  # (m, 1, 1, n) against (S, T, n)
+
+        if market["rate_model"] == "aave":
+            rates = supply_rates_for_allocations(allocations, current, scenarios.total_supply[None], scenarios.total_borrow[None], market["rate_params"])
+        else:
+            # @dev in place: the temporaries of the plain expression cost more than the arithmetic
+            rates = scenarios.total_supply[None] + (allocations - current)
+            drained = rates <= 0  # no supply left: utilization 0, like the optimizer
+            np.divide(scenarios.total_borrow[None], rates, out=rates, where=~drained)
+            rates[drained] = 0.0
+            rates *= 100
+            rates -= market["totalBorrow"] / market["totalSupply"] * 100
+            rates *= market["supplyElasticity"]
+            rates += market["currentInterestRate"]
+
+        rates += scenarios.rate_shift[None]
+        np.maximum(rates, 0.0, out=rates)
+        rates *= allocations
+        yields[start:start + batch] = rates.sum(axis=(2, 3)) / (steps * 100)
+    return yields
+
+
+class ScenarioEngine:
+    """
+    Scores allocations against sampled market paths instead of the current rates only.
+
+    `sample` draws `n_scenarios` paths over `horizon_days`, one step every `step_days`, for the
+    supply, debt and supply rate of every chain. `evaluate` computes the yield of a batch of candidate
+    allocations in every scenario in one vectorized pass (chunked to bound memory), and
+    `select` keeps the candidate with the best expected yield ("mean") or the best yield in
+    the worst `quantile` of the scenarios ("quantile").
+
+    Large grids are split by scenario across a process pool, created on first use and kept
+    for later runs. Workers are spawned rather than forked, since the agent has event-loop
+    and I/O threads running. `select_async` and `evaluate_async` do the same work without
+    blocking the event loop: the numpy work runs in a thread, and the pool futures are awaited.
+
+    Both keep their result in `last_selection`, so a run that reuses the last optimum can
+    reuse the last selection too (`rescaled_last_selection`) instead of drawing new scenarios.
+    """
+    _pool: Optional[ProcessPoolExecutor] = None
+
+    def __init__(
+        self,
+        n_scenarios: int = 2000,
+        horizon_days: int = 30,
+        step_days: int = 5,
+        objective: str = "mean",
+        quantile: float = 0.05,
+        rate_model: str = "linear",
+        shocks: ShockModel = ShockModel(),
+        max_workers: Optional[int] = None,
+        seed: Optional[int] = None,
+    ):
+        if objective not in OBJECTIVES:
+            raise ValueError(f"Unknown scenario objective {objective!r}, expected one of {OBJECTIVES}")
+        self.n_scenarios = n_scenarios
+        self.horizon_days = horizon_days
+        self.step_days = step_days
+        self.objective = objective
+        self.quantile = quantile
+        self.rate_model = rate_model
+        self.shocks = shocks
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.rng = np.random.default_rng(seed)
+        self.last_selection: Optional[dict] = None
+
+    def sample(self, data: dict) -> Scenarios:
+        chains = data["chains"]
+        steps = max(1, int(self.horizon_days // self.step_days))
+        shape = (self.n_scenarios, steps, len(chains))
+
+        def correlated_walk(daily_volatility: float) -> np.ndarray:
+            volatility = daily_volatility * np.sqrt(self.step_days)
+            common = self.rng.standard_normal((self.n_scenarios, steps, 1))
+            own = self.rng.standard_normal(shape)
+            increments = volatility * (np.sqrt(self.shocks.correlation) * common + np.sqrt(1 - self.shocks.correlation) * own)
+            return np.cumsum(increments, axis=1)
+
+        total_supply = np.array([chain["totalSupply"] for chain in chains], dtype=float)
+        total_borrow = np.array([chain["totalBorrow"] for chain in chains], dtype=float)
+
+        supply_paths = total_supply * np.exp(correlated_walk(self.shocks.supply_volatility))
+        # @dev debt cannot exceed the liquidity supplied
+        borrow_paths = np.minimum(total_borrow * np.exp(correlated_walk(self.shocks.borrow_volatility)), supply_paths)
+
+        return Scenarios(
+            total_supply=supply_paths,
+            total_borrow=borrow_paths,
+            rate_shift=correlated_walk(self.shocks.rate_volatility),
+        )
+
+    def evaluate(self, data: dict, candidates: np.ndarray, scenarios: Scenarios) -> np.ndarray:
+        """
+        Yearly yield (asset base units) of each candidate allocation in each scenario.
+
+        Args:
+            candidates (np.ndarray): Allocations of shape (candidates, chains), in the chain order of `data`.
+
+        Returns:
+            np.ndarray: Shape (candidates, scenarios).
+        """
+        market = _market(data, self.rate_model)
+        candidates = np.asarray(candidates, dtype=float)
+
+        if not self._use_pool(candidates, scenarios):
+            return _evaluate_chunk(market, candidates, scenarios)
+
+        parts = scenarios.split(self.max_workers)
+        results = self._get_pool(self.max_workers).map(_evaluate_chunk, [market] * len(parts), [candidates] * len(parts), parts)
+        return np.concatenate(list(results), axis=1)
+
+    async def evaluate_async(self, data: dict, candidates: np.ndarray, scenarios: Scenarios) -> np.ndarray:
+        """Like `evaluate`, in a worker thread for small grids and awaiting the process pool for large ones."""
+        market = _market(data, self.rate_model)
+        candidates = np.asarray(candidates, dtype=float)
+
+        if not self._use_pool(candidates, scenarios):
+            return await asyncio.to_thread(_evaluate_chunk, market, candidates, scenarios)
+
+        pool = self._get_pool(self.max_workers)
+        results = await asyncio.gather(*(
+            asyncio.wrap_future(pool.submit(_evaluate_chunk, market, candidates, part))
+            for part in scenarios.split(self.max_workers)
+        ))
+        return np.concatenate(results, axis=1)
+
+    def select(self, data: dict, optimal_allocations: dict) -> dict:
+        """
+        Picks the most robust of the allocations between the current one and the point optimum.
+
+        Candidates are the current allocation, the optimum, partial moves towards it, and
+        random perturbations of the optimum. Returns the chosen allocations (same shape as
+        the `allocations` of the optimizer) and the score of the chosen and point-optimal ones.
+        """
+        start = time.perf_counter()
+        candidates, scenarios = self._candidates_and_scenarios(data, optimal_allocations)
+        yields = self.evaluate(data, candidates, scenarios)
+        self.last_selection = self._choose(data, candidates, scenarios, yields, start)
+        return self.last_selection
+
+    async def select_async(self, data: dict, optimal_allocations: dict) -> dict:
+        """Like `select`, without blocking the event loop."""
+        start = time.perf_counter()
+        candidates, scenarios = await asyncio.to_thread(self._candidates_and_scenarios, data, optimal_allocations)
+        yields = await self.evaluate_async(data, candidates, scenarios)
+        self.last_selection = await asyncio.to_thread(self._choose, data, candidates, scenarios, yields, start)
+        return self.last_selection
+
+    def rescaled_last_selection(self, total_funds: int) -> dict:
+        """The last selection with its allocations rescaled to `total_funds`, like the reused optimum."""
+        previous_total = sum(self.last_selection["allocations"].values())
+        scale = total_funds / previous_total if previous_total else 1.0
+        allocations = {chain_id: round(amount * scale) for chain_id, amount in self.last_selection["allocations"].items()}
+        # @dev the rounding remainder goes to the largest allocation, as in `_choose`
+        largest = max(allocations, key=allocations.get)
+        allocations[largest] += int(round(total_funds)) - sum(allocations.values())
+        return {**self.last_selection, "allocations": allocations, "reused": True}
+
+    def _candidates_and_scenarios(self, data: dict, optimal_allocations: dict) -> tuple[np.ndarray, Scenarios]:
+        chains = data["chains"]
+        chain_ids = [chain["chainId"] for chain in chains]
+        total_funds = data["totalAssetsUnderManagement"]
+
+        current = np.array([chain["currentAllocation"] for chain in chains], dtype=float)
+        optimal = np.array([optimal_allocations[chain_id] for chain_id in chain_ids], dtype=float)
+
+        partial_moves = current + np.linspace(0, 1, PARTIAL_MOVES)[:, None] * (optimal - current)
+        perturbed = self.rng.dirichlet(optimal / max(total_funds, 1) * 200 + 1e-3, size=PERTURBATIONS) * total_funds
+        candidates = np.vstack([partial_moves, perturbed])
+
+        return candidates, self.sample(data)
+
+    def _choose(self, data: dict, candidates: np.ndarray, scenarios: Scenarios, yields: np.ndarray, start: float) -> dict:
+        chain_ids = [chain["chainId"] for chain in data["chains"]]
+        total_funds = data["totalAssetsUnderManagement"]
+
+        expected = yields.mean(axis=1)
+        downside = np.quantile(yields, self.quantile, axis=1)
+        best = int(np.argmax(expected if self.objective == "mean" else downside))
+        point_optimum = PARTIAL_MOVES - 1
+
+        allocations = np.round(candidates[best]).astype(int)
+        allocations[int(np.argmax(allocations))] += int(round(total_funds)) - int(allocations.sum())
+
+        return {
+            "allocations": dict(zip(chain_ids, allocations.tolist())),
+            "objective": self.objective,
+            "quantile": self.quantile,
+            "scenarios": scenarios.count,
+            "candidates": len(candidates),
+            "expectedYield": float(expected[best]),
+            "downsideYield": float(downside[best]),
+            "pointOptimumExpectedYield": float(expected[point_optimum]),
+            "pointOptimumDownsideYield": float(downside[point_optimum]),
+            "elapsedMs": (time.perf_counter() - start) * 1000,
+        }
+
+    def _use_pool(self, candidates: np.ndarray, scenarios: Scenarios) -> bool:
+        elements = candidates.shape[0] * scenarios.total_supply.size
+        return self.max_workers > 1 and elements >= PARALLEL_MIN_ELEMENTS
+
+    @classmethod
+    def _get_pool(cls, max_workers: int) -> ProcessPoolExecutor:
+        if cls._pool is None:
+            cls._pool = ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context("spawn"))
+        return cls._pool
@@ -1 +0,0 @@
-POLL_INTERVAL_SECONDS = 5
\ No newline at end of file
@@ -1,5 +1,4 @@
-from helpers import broadcast
-from adapters import USDC
+from helpers import broadcast, ReceiptWaiter
 from ..strategy_context import StrategyContext
 from .step import Step
 from .step_names import StepName
@@ -10,7 +9,7 @@ class ApproveAaveUSDCBeforeSupplyIfRequired(Step):
     async def run(self, ctx: StrategyContext) -> None:
         # @dev since this action can only happen directly in the destination chain, we use the lending pool address there.
         spender = ctx.aave_lending_pool_address_on_destination_chain
-        allowance = USDC.get_allowance(web3_instance=ctx.web3_destination, usdc_address=ctx.usdc_token_address_on_destination_chain, spender=spender, owner=ctx.agent_address)
+        allowance = (await ctx.get_chain_snapshot(ctx.to_chain_id)).allowance(spender)
 
         print(f"Current allowance for Aave supply on chainId={ctx.to_chain_id} is {allowance}")
 
@@ -23,7 +22,8 @@ class ApproveAaveUSDCBeforeSupplyIfRequired(Step):
                 to=ctx.usdc_token_address_on_destination_chain
             )
 
-            broadcast(ctx.web3_destination, payload)
+            tx_hash = await broadcast(ctx.web3_destination, payload)
+            await ReceiptWaiter.wait(ctx.web3_destination, tx_hash, ctx.to_chain_id)
 
             print("✅ USDC approved for Aave supply successfully.")
             print(f"✅ Approved {ctx.max_allowance} of token {ctx.usdc_token_address_on_destination_chain} to spender {spender} on chainId={ctx.to_chain_id}")
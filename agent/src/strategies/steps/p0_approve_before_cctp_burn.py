@@ -1,5 +1,4 @@
-from helpers import broadcast
-from adapters import USDC
+from helpers import broadcast, ReceiptWaiter
 from ..strategy_context import StrategyContext
 from .step import Step
 from .step_names import StepName
@@ -11,7 +10,7 @@ class ApproveBeforeCctpBurnIfRequired(Step):
         # @dev since this action can only happen in the source chain, we use the messenger address there
         spender = ctx.messenger_address_on_source_chain # the messenger contract is the spender
         usdc_address = ctx.usdc_token_address_on_source_chain
-        allowance = USDC.get_allowance(web3_instance=ctx.web3_source, usdc_address=usdc_address, spender=spender, owner=ctx.agent_address)
+        allowance = (await ctx.get_chain_snapshot(ctx.from_chain_id)).allowance(spender)
       
         print(f"Current allowance for CCTP burn on chainId={ctx.from_chain_id} is {allowance}")
 
@@ -24,7 +23,8 @@ class ApproveBeforeCctpBurnIfRequired(Step):
                 to=usdc_address
             )
 
-            broadcast(ctx.web3_source, payload)
+            tx_hash = await broadcast(ctx.web3_source, payload)
+            await ReceiptWaiter.wait(ctx.web3_source, tx_hash, ctx.from_chain_id)
 
             print("✅ USDC approved for CCTP burn successfully.")
             print(f"✅ Approved {ctx.max_allowance} of token {usdc_address} to spender {spender} on chainId={ctx.from_chain_id}")
@@ -1,5 +1,4 @@
-from helpers import broadcast
-from adapters import USDC
+from helpers import broadcast, ReceiptWaiter
 from ..strategy_context import StrategyContext
 from .step import Step
 from .step_names import StepName
@@ -12,7 +11,7 @@ class ApproveVaultToSpendAgentUSDCIfRequired(Step):
         usdc_address = ctx.usdc_token_address_on_destination_chain
 
         # @dev this can only happen when the agent is returning funds to the source chain, in this case the source chain is the destination chain
-        allowance = USDC.get_allowance(web3_instance=ctx.web3_destination, usdc_address=usdc_address, spender=spender, owner=ctx.agent_address)
+        allowance = (await ctx.get_chain_snapshot(ctx.to_chain_id)).allowance(spender)
         
         if allowance < ctx.max_allowance:
             print("Approving USDC for vault...")
@@ -22,7 +21,8 @@ class ApproveVaultToSpendAgentUSDCIfRequired(Step):
                 spender=spender
             )
 
-            broadcast(ctx.web3_destination, payload)
+            tx_hash = await broadcast(ctx.web3_destination, payload)
+            await ReceiptWaiter.wait(ctx.web3_destination, tx_hash, ctx.to_chain_id)
 
             print("✅ USDC approved for vault successfully.")
         else:
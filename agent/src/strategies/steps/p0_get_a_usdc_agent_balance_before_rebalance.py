@@ -1,5 +1,3 @@
-from adapters import LendingPool
-from helpers import BalanceHelper
 from ..strategy_context import StrategyContext
 from .step import Step
 from .step_names import StepName
@@ -11,12 +9,12 @@ class GetAUSDCBalanceBeforeRebalance(Step):
     async def run(self, ctx: StrategyContext) -> None:
         print("Getting AUSDC agent balance before rebalance...")
         
-        ctx.a_token_address_on_destination_chain = LendingPool.get_atoken_address(ctx.web3_destination, ctx.aave_lending_pool_address_on_destination_chain, ctx.usdc_token_address_on_destination_chain)
+        ctx.a_token_address_on_destination_chain = (await ctx.get_chain_snapshot(ctx.to_chain_id)).a_token_address
 
         if ctx.a_token_address_on_destination_chain is None:
             raise ValueError("a_token_address_on_destination_chain is not set in context.")
         
-        ctx.a_token_address_on_source_chain = LendingPool.get_atoken_address(ctx.web3_source, ctx.aave_lending_pool_address_on_source_chain, ctx.usdc_token_address_on_source_chain)
+        ctx.a_token_address_on_source_chain = (await ctx.get_chain_snapshot(ctx.from_chain_id)).a_token_address
 
         if ctx.a_token_address_on_source_chain is None:
             raise ValueError("a_token_address_on_source_chain is not set in context.")
@@ -32,12 +30,12 @@ class GetAUSDCBalanceBeforeRebalance(Step):
             
             return
         
-        ctx.a_usdc_agent_balance_before_in_source_chain = BalanceHelper.get_atoken_agent_balance(ctx.web3_source, ctx.a_token_address_on_source_chain)
+        ctx.a_usdc_agent_balance_before_in_source_chain = (await ctx.get_chain_snapshot(ctx.from_chain_id)).a_token_agent_balance
 
         if ctx.a_usdc_agent_balance_before_in_source_chain is None:
             raise ValueError("a_usdc_agent_balance_before_in_source_chain is not set in context.")
         
-        ctx.a_usdc_agent_balance_before_in_dest_chain = BalanceHelper.get_atoken_agent_balance(ctx.web3_destination, ctx.a_token_address_on_destination_chain)
+        ctx.a_usdc_agent_balance_before_in_dest_chain = (await ctx.get_chain_snapshot(ctx.to_chain_id)).a_token_agent_balance
 
         if ctx.a_usdc_agent_balance_before_in_dest_chain is None:
             raise ValueError("a_usdc_agent_balance_before_in_dest_chain is not set in context.")
@@ -1,4 +1,3 @@
-from helpers import BalanceHelper
 from ..strategy_context import StrategyContext
 from .step import Step
 from .step_names import StepName
@@ -21,12 +20,12 @@ class GetUSDCBalanceBeforeRebalance(Step):
             
             return
         
-        ctx.usdc_agent_balance_before_in_source_chain = BalanceHelper.get_usdc_agent_balance(ctx.web3_source, ctx.usdc_token_address_on_source_chain)
+        ctx.usdc_agent_balance_before_in_source_chain = (await ctx.get_chain_snapshot(ctx.from_chain_id)).usdc_agent_balance
         
         if ctx.usdc_agent_balance_before_in_source_chain is None:
             raise ValueError("USDC agent balance before rebalance in source chain is not set in context.")
         
-        ctx.usdc_agent_balance_before_in_dest_chain = BalanceHelper.get_usdc_agent_balance(ctx.web3_destination, ctx.usdc_token_address_on_destination_chain)
+        ctx.usdc_agent_balance_before_in_dest_chain = (await ctx.get_chain_snapshot(ctx.to_chain_id)).usdc_agent_balance
         
         if ctx.usdc_agent_balance_before_in_dest_chain is None:
             raise ValueError("USDC agent balance before rebalance in dest chain is not set in context.")
@@ -1,4 +1,4 @@
-from helpers import broadcast
+from helpers import broadcast, ReceiptWaiter
 from engine_types import TxType
 from web3.exceptions import TransactionNotFound
 from ..strategy_context import StrategyContext
@@ -16,7 +16,7 @@ class WithdrawFromRebalancer(Step):
         print(f"payload type: {self.PAYLOAD_TYPE.value}")
 
         if ctx.is_restart:
-            payload = await ctx.rebalancer_contract.get_signed_payload(self.PAYLOAD_TYPE)
+            payload = await ctx.get_signed_payload(self.PAYLOAD_TYPE)
 
             if payload:
                 print("Found existing signed payload for rebalancer withdraw.")
@@ -24,11 +24,13 @@ class WithdrawFromRebalancer(Step):
                 tx_hash = ctx.web3_source.keccak(signed_rlp)
 
                 try:
-                    ctx.web3_source.eth.get_transaction(tx_hash)
-                    return
+                    await ctx.web3_source.eth.get_transaction(tx_hash)
                 except TransactionNotFound:
-                    broadcast(ctx.web3_source, signed_rlp)
-                    return
+                    await broadcast(ctx.web3_source, signed_rlp)
+
+                # @dev the payload may still be pending, wait for it before moving on
+                await ReceiptWaiter.wait(ctx.web3_source, tx_hash, ctx.from_chain_id)
+                return
         
         print("No existing signed payload found for rebalancer withdraw.")
         # if no existing signed payload, build and sign a new one
@@ -38,6 +40,7 @@ class WithdrawFromRebalancer(Step):
             to=ctx.vault_address
         )
         
-        broadcast(ctx.web3_source, payload)
+        tx_hash = await broadcast(ctx.web3_source, payload)
+        await ReceiptWaiter.wait(ctx.web3_source, tx_hash, ctx.from_chain_id)
 
         print(f"✅ Withdrew {ctx.amount} USDC from rebalancer on chain {ctx.from_chain_id}.")
\ No newline at end of file
@@ -1,4 +1,4 @@
-from helpers import broadcast
+from helpers import broadcast, ReceiptWaiter
 from engine_types import TxType
 
 from ..strategy_context import StrategyContext
@@ -20,7 +20,7 @@ class CctpBurn(Step):
         burn_token = ctx.usdc_token_address_on_source_chain
 
         if ctx.is_restart:
-            payload = await ctx.rebalancer_contract.get_signed_payload(self.PAYLOAD_TYPE)
+            payload = await ctx.get_signed_payload(self.PAYLOAD_TYPE)
 
             if payload:
                 print("Found existing signed payload for CctpBurn.")
@@ -29,14 +29,15 @@ class CctpBurn(Step):
 
                 # Check if the transaction is already mined
                 try:
-                    ctx.web3_source.eth.get_transaction(tx_hash)
-                    ctx.burn_tx_hash = f"0x{tx_hash.hex()}"
-                    return
+                    await ctx.web3_source.eth.get_transaction(tx_hash)
                 except Exception:
                     # If not found, broadcast the signed payload
-                    broadcast(ctx.web3_source, signed_rlp)
-                    ctx.burn_tx_hash = f"0x{tx_hash.hex()}"
-                    return
+                    await broadcast(ctx.web3_source, signed_rlp)
+
+                # @dev the payload may still be pending, wait for it before moving on
+                await ReceiptWaiter.wait(ctx.web3_source, tx_hash, ctx.from_chain_id)
+                ctx.burn_tx_hash = f"0x{tx_hash.hex()}"
+                return
 
         print("No existing signed payload for CctpBurn found")
 
@@ -49,7 +50,8 @@ class CctpBurn(Step):
             to=ctx.messenger_address_on_source_chain
         )
 
-        tx_hash = broadcast(ctx.web3_source, payload)
+        tx_hash = await broadcast(ctx.web3_source, payload)
+        await ReceiptWaiter.wait(ctx.web3_source, tx_hash, ctx.from_chain_id)
 
         print("✅ CctpBurn transaction broadcasted successfully!")
 
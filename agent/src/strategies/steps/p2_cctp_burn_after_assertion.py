@@ -13,6 +13,6 @@ class CctpBurnAfterAssertion(Step):
         print(f"balance computing both values: {ctx.usdc_agent_balance_before_in_source_chain - (ctx.cctp_fees or 0)}")
         
         # Step 4: Assert balance is (balance before - fees)
-        Assert.usdc_agent_balance(ctx.web3_source, ctx.usdc_token_address_on_source_chain, expected_balance=ctx.usdc_agent_balance_before_in_source_chain - (ctx.cctp_fees or 0))
+        await Assert.usdc_agent_balance(ctx.web3_source, ctx.usdc_token_address_on_source_chain, expected_balance=ctx.usdc_agent_balance_before_in_source_chain - (ctx.cctp_fees or 0))
 
         print("✅ Assertion after CCTP burn passed.")
\ No newline at end of file
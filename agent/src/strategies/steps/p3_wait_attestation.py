@@ -1,22 +1,17 @@
-import time
-from near_omni_client.adapters.cctp.attestation_service import AttestationService
+from helpers import AttestationPoller
 from ..strategy_context import StrategyContext
 from .step import Step
 from .step_names import StepName
-from .constants import POLL_INTERVAL_SECONDS
 
 class WaitAttestation(Step):
     NAME = StepName.WaitAttestation
 
     async def run(self, ctx: StrategyContext):
-        attestation_service = AttestationService(ctx.from_network_id)
-
-        attestation = attestation_service.retrieve_attestation(
-            transaction_hash=ctx.burn_tx_hash
+        attestation = await AttestationPoller.wait_for_attestation(
+            network=ctx.from_network_id,
+            tx_hash=ctx.burn_tx_hash
         )
 
         print("✅ Attestation retrieved successfully!")
         
-        ctx.attestation = attestation
-
-        time.sleep(POLL_INTERVAL_SECONDS)
\ No newline at end of file
+        ctx.attestation = attestation
\ No newline at end of file
@@ -1,10 +1,8 @@
-import time
-from helpers import broadcast
+from helpers import broadcast, ReceiptWaiter
 from engine_types import TxType
 from ..strategy_context import StrategyContext
 from .step import Step
 from .step_names import StepName
-from .constants import POLL_INTERVAL_SECONDS
 
 class CctpMint(Step):
     NAME = StepName.CctpMint
@@ -15,7 +13,7 @@ class CctpMint(Step):
 
     async def run(self, ctx: StrategyContext):
         if ctx.is_restart:
-            payload = await ctx.rebalancer_contract.get_signed_payload(self.PAYLOAD_TYPE)
+            payload = await ctx.get_signed_payload(self.PAYLOAD_TYPE)
 
             if payload:
                 print("Found existing signed payload for CctpMint.")
@@ -24,12 +22,14 @@ class CctpMint(Step):
 
                 # Check if the transaction is already mined
                 try:
-                    ctx.web3_destination.eth.get_transaction(tx_hash)
-                    return
+                    await ctx.web3_destination.eth.get_transaction(tx_hash)
                 except Exception:
                     # If not found, broadcast the signed payload
-                    broadcast(ctx.web3_destination, signed_rlp)
-                    return
+                    await broadcast(ctx.web3_destination, signed_rlp)
+
+                # @dev the payload may still be pending, wait for it before moving on
+                await ReceiptWaiter.wait(ctx.web3_destination, tx_hash, ctx.to_chain_id)
+                return
             
         print("No existing signed payload for CctpMint found")
 
@@ -40,8 +40,7 @@ class CctpMint(Step):
             to=ctx.transmitter_address_on_destination_chain
         )
 
-        broadcast(ctx.web3_destination, payload)
-
-        print("Mint transaction broadcasted successfully!")
+        tx_hash = await broadcast(ctx.web3_destination, payload)
+        await ReceiptWaiter.wait(ctx.web3_destination, tx_hash, ctx.to_chain_id)
 
-        time.sleep(POLL_INTERVAL_SECONDS)
\ No newline at end of file
+        print("Mint transaction broadcasted successfully!")
\ No newline at end of file
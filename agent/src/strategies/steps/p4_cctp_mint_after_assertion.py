@@ -7,6 +7,6 @@ class CctpMintAfterAssertion(Step):
     NAME = StepName.CctpMintAfterAssertion
 
     async def run(self, ctx: StrategyContext):
-        Assert.usdc_agent_balance_is_at_least(ctx.web3_destination, ctx.usdc_token_address_on_destination_chain, expected_balance=ctx.amount)
+        await Assert.usdc_agent_balance_is_at_least(ctx.web3_destination, ctx.usdc_token_address_on_destination_chain, expected_balance=ctx.amount)
 
         print("Balance assertion after mint passed.")
\ No newline at end of file
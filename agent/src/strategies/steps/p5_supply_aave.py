@@ -1,11 +1,9 @@
-import time
-from helpers import broadcast
+from helpers import broadcast, ReceiptWaiter
 from engine_types import TxType
 
 from ..strategy_context import StrategyContext
 from .step import Step
 from .step_names import StepName
-from .constants import POLL_INTERVAL_SECONDS
 
 class SupplyAave(Step):
     NAME = StepName.SupplyAave
@@ -20,7 +18,7 @@ class SupplyAave(Step):
         referral = ctx.remote_config[ctx.to_chain_id]["aave"]["referral_code"]
 
         if ctx.is_restart:
-            supply_payload = await ctx.rebalancer_contract.get_signed_payload(self.PAYLOAD_TYPE)
+            supply_payload = await ctx.get_signed_payload(self.PAYLOAD_TYPE)
 
             if supply_payload:
                 print("Found existing signed payload for AaveSupply.")
@@ -29,12 +27,14 @@ class SupplyAave(Step):
 
                 # Check if the transaction is already mined
                 try:
-                    ctx.web3_destination.eth.get_transaction(tx_hash)
-                    return
+                    await ctx.web3_destination.eth.get_transaction(tx_hash)
                 except Exception:
                     # If not found, broadcast the signed payload
-                    broadcast(ctx.web3_destination, signed_rlp)
-                    return
+                    await broadcast(ctx.web3_destination, signed_rlp)
+
+                # @dev the payload may still be pending, wait for it before moving on
+                await ReceiptWaiter.wait(ctx.web3_destination, tx_hash, ctx.to_chain_id)
+                return
             
         print("No existing signed payload for AaveSupply found")
         
@@ -47,8 +47,7 @@ class SupplyAave(Step):
             to=ctx.aave_lending_pool_address_on_destination_chain
         )
 
-        broadcast(ctx.web3_destination, supply_payload)
-
-        print("Aave supply transaction broadcasted successfully.")
+        tx_hash = await broadcast(ctx.web3_destination, supply_payload)
+        await ReceiptWaiter.wait(ctx.web3_destination, tx_hash, ctx.to_chain_id)
 
-        time.sleep(POLL_INTERVAL_SECONDS)  # Wait for a short period to ensure the transaction is processed
\ No newline at end of file
+        print("Aave supply transaction broadcasted successfully.")
\ No newline at end of file
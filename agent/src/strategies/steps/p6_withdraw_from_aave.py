@@ -1,4 +1,4 @@
-from helpers import broadcast
+from helpers import broadcast, ReceiptWaiter
 from engine_types import TxType
 
 from ..strategy_context import StrategyContext
@@ -17,7 +17,7 @@ class WithdrawFromAave(Step):
         on_behalf = ctx.agent_address
 
         if ctx.is_restart:
-            payload = await ctx.rebalancer_contract.get_signed_payload(self.PAYLOAD_TYPE)
+            payload = await ctx.get_signed_payload(self.PAYLOAD_TYPE)
         
             if payload:
                 print("Found existing signed payload for AaveWithdraw.")
@@ -25,12 +25,14 @@ class WithdrawFromAave(Step):
                 tx_hash = ctx.web3_source.keccak(signed_rlp)
                 # Check if the transaction is already mined
                 try:
-                    ctx.web3_source.eth.get_transaction(tx_hash)
-                    return
+                    await ctx.web3_source.eth.get_transaction(tx_hash)
                 except Exception:
                     # If not found, broadcast the signed payload
-                    broadcast(ctx.web3_source, signed_rlp)
-                    return
+                    await broadcast(ctx.web3_source, signed_rlp)
+
+                # @dev the payload may still be pending, wait for it before moving on
+                await ReceiptWaiter.wait(ctx.web3_source, tx_hash, ctx.from_chain_id)
+                return
 
         print("No existing signed payload for AaveWithdraw found")
 
@@ -43,6 +45,7 @@ class WithdrawFromAave(Step):
             on_behalf_of=on_behalf,
             to=ctx.aave_lending_pool_address_on_source_chain
         )
-        broadcast(ctx.web3_source, payload)
+        tx_hash = await broadcast(ctx.web3_source, payload)
+        await ReceiptWaiter.wait(ctx.web3_source, tx_hash, ctx.from_chain_id)
 
         print("✅ Withdraw from Aave transaction broadcasted successfully!")
\ No newline at end of file
@@ -8,7 +8,7 @@ class WithdrawFromAaveAfterAssertion(Step):
 
     async def run(self, ctx: StrategyContext) -> None:
         # Check USDC balance after withdrawing from Aave + balance before rebalance
-        Assert.usdc_agent_balance(ctx.web3_source, ctx.usdc_token_address_on_source_chain, expected_balance=ctx.amount + ctx.usdc_agent_balance_before_in_source_chain)
+        await Assert.usdc_agent_balance(ctx.web3_source, ctx.usdc_token_address_on_source_chain, expected_balance=ctx.amount + ctx.usdc_agent_balance_before_in_source_chain)
         
         print("Assertion after withdrawing from Aave completed successfully.")
 
@@ -1,5 +1,5 @@
 from engine_types.tx_type import TxType
-from helpers import broadcast, CrossChainATokenBalanceHelper
+from helpers import broadcast, ReceiptWaiter, CrossChainATokenBalanceHelper
 
 from ..strategy_context import StrategyContext
 from .step import Step
@@ -16,7 +16,7 @@ class DepositIntoRebalancer(Step):
         print("Depositing into rebalancer...")
 
         if ctx.is_restart:
-            payload = await ctx.rebalancer_contract.get_signed_payload(self.PAYLOAD_TYPE)
+            payload = await ctx.get_signed_payload(self.PAYLOAD_TYPE)
         
             if payload:
                 print("Found existing signed payload for RebalancerDeposit.")
@@ -24,21 +24,24 @@ class DepositIntoRebalancer(Step):
                 tx_hash = ctx.web3_destination.keccak(signed_rlp)
                 # Check if the transaction is already mined
                 try:
-                    ctx.web3_destination.eth.get_transaction(tx_hash)
-                    return
+                    await ctx.web3_destination.eth.get_transaction(tx_hash)
                 except Exception:
                     # If not found, broadcast the signed payload
-                    broadcast(ctx.web3_destination, signed_rlp)
-                    return
+                    await broadcast(ctx.web3_destination, signed_rlp)
+
+                # @dev the payload may still be pending, wait for it before moving on
+                await ReceiptWaiter.wait(ctx.web3_destination, tx_hash, ctx.to_chain_id)
+                return
         
         print("No existing signed payload for RebalancerDeposit found")
         
-        crosschain_balance = CrossChainATokenBalanceHelper.get_total_cross_chain_balance()
+        crosschain_balance = await CrossChainATokenBalanceHelper.get_total_cross_chain_balance()
         
         print(f"Cross-chain AToken balance: {crosschain_balance}")
         
         deposit_payload = await ctx.rebalancer_contract.build_and_sign_return_funds_tx(to_chain_id=ctx.to_chain_id, cross_chain_a_token_balance=crosschain_balance,  amount=ctx.amount, to=ctx.vault_address)
 
-        broadcast(ctx.web3_destination, deposit_payload)
+        tx_hash = await broadcast(ctx.web3_destination, deposit_payload)
+        await ReceiptWaiter.wait(ctx.web3_destination, tx_hash, ctx.to_chain_id)
 
         print("Deposit transaction broadcasted successfully!")
\ No newline at end of file
@@ -1,9 +1,9 @@
 from typing import Dict, Optional
-from near_omni_client.providers.evm.alchemy_provider import AlchemyFactoryProvider
 
 from adapters import RebalancerContract
+from helpers import AsyncAlchemyFactoryProvider
 from config import Config
-from engine_types import Flow
+from engine_types import Flow, TxType
 
 from .strategy_context import StrategyContext
 from .steps import retry_async_step
@@ -13,7 +13,7 @@ class Strategy:
     STEPS: list[type] = []
     COMMON_STEPS: list[type] = []
 
-    def __init__(self, *, rebalancer_contract: RebalancerContract, evm_factory_provider: AlchemyFactoryProvider, vault_address: str, config: Config, remote_config: Dict[str, dict], agent_address: str, max_allowance: int):
+    def __init__(self, *, rebalancer_contract: RebalancerContract, evm_factory_provider: AsyncAlchemyFactoryProvider, vault_address: str, config: Config, remote_config: Dict[str, dict], agent_address: str, max_allowance: int):
         self.rebalancer_contract = rebalancer_contract
         self.evm_factory_provider = evm_factory_provider
         self.vault_address = vault_address
@@ -31,7 +31,8 @@ class Strategy:
             usdc_agent_balance_before_in_source_chain: Optional[int] = None,
             usdc_agent_balance_before_in_dest_chain: Optional[int] = None,
             a_usdc_agent_balance_before_in_source_chain: Optional[int] = None,
-            a_usdc_agent_balance_before_in_dest_chain: Optional[int] = None
+            a_usdc_agent_balance_before_in_dest_chain: Optional[int] = None,
+            signed_payloads: Optional[Dict[TxType, bytes]] = None
         ):
         ctx = self._make_context(
             from_chain_id=from_chain_id,
@@ -42,7 +43,8 @@ class Strategy:
             usdc_agent_balance_before_in_source_chain=usdc_agent_balance_before_in_source_chain,
             usdc_agent_balance_before_in_dest_chain=usdc_agent_balance_before_in_dest_chain,
             a_usdc_agent_balance_before_in_source_chain=a_usdc_agent_balance_before_in_source_chain,
-            a_usdc_agent_balance_before_in_dest_chain=a_usdc_agent_balance_before_in_dest_chain
+            a_usdc_agent_balance_before_in_dest_chain=a_usdc_agent_balance_before_in_dest_chain,
+            signed_payloads=signed_payloads
         )
         await self._run_phases(ctx, restart_from)
 
@@ -54,7 +56,8 @@ class Strategy:
                     usdc_agent_balance_before_in_source_chain: Optional[int] = None,
                     usdc_agent_balance_before_in_dest_chain: Optional[int] = None,
                     a_usdc_agent_balance_before_in_source_chain: Optional[int] = None,
-                    a_usdc_agent_balance_before_in_dest_chain: Optional[int] = None
+                    a_usdc_agent_balance_before_in_dest_chain: Optional[int] = None,
+                    signed_payloads: Optional[Dict[TxType, bytes]] = None
         ) -> StrategyContext:
         print(f"🟩 Flow {self.NAME} | from={from_chain_id} to={to_chain_id} amount={amount}")
         return StrategyContext(
@@ -74,7 +77,8 @@ class Strategy:
             usdc_agent_balance_before_in_source_chain=usdc_agent_balance_before_in_source_chain,
             usdc_agent_balance_before_in_dest_chain=usdc_agent_balance_before_in_dest_chain,
             a_usdc_agent_balance_before_in_source_chain=a_usdc_agent_balance_before_in_source_chain,
-            a_usdc_agent_balance_before_in_dest_chain=a_usdc_agent_balance_before_in_dest_chain
+            a_usdc_agent_balance_before_in_dest_chain=a_usdc_agent_balance_before_in_dest_chain,
+            signed_payloads=signed_payloads
         )
 
     async def _run_phases(self, ctx: StrategyContext, restart_from: Optional[str] = None):
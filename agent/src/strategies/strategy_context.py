@@ -1,10 +1,10 @@
 from typing import Optional
 from config import Config
 from adapters import RebalancerContract
+from helpers import ChainStateReader, ChainSnapshot, AsyncAlchemyFactoryProvider
 from utils import from_chain_id_to_network
-from engine_types import Flow
+from engine_types import Flow, TxType
 
-from near_omni_client.providers.evm import AlchemyFactoryProvider
 from near_omni_client.adapters.cctp.attestation_service_types import Message
 
 class StrategyContext:
@@ -18,7 +18,7 @@ class StrategyContext:
         config: Config,
         agent_address: str,
         vault_address: str,
-        evm_factory_provider: AlchemyFactoryProvider,
+        evm_factory_provider: AsyncAlchemyFactoryProvider,
         rebalancer_contract: RebalancerContract,
         flow: Flow,
         max_allowance: int,
@@ -27,7 +27,8 @@ class StrategyContext:
         usdc_agent_balance_before_in_source_chain: Optional[int] = None,
         usdc_agent_balance_before_in_dest_chain: Optional[int] = None,
         a_usdc_agent_balance_before_in_source_chain: Optional[int] = None,
-        a_usdc_agent_balance_before_in_dest_chain: Optional[int] = None
+        a_usdc_agent_balance_before_in_dest_chain: Optional[int] = None,
+        signed_payloads: Optional[dict[TxType, bytes]] = None
     ):
         self.from_chain_id = from_chain_id
         self.to_chain_id = to_chain_id
@@ -58,6 +59,10 @@ class StrategyContext:
 
         self.is_restart = is_restart
         self.restart_from = restart_from
+
+        # payloads signed before a restart, loaded with the session (None when not loaded)
+        self.signed_payloads = signed_payloads
+        self._unchecked_payload_types: set[TxType] = set(TxType) if signed_payloads is not None else set()
         
         # ===== filled by phases =====
         self.nonce: Optional[int] = None
@@ -73,4 +78,23 @@ class StrategyContext:
 
         self.cctp_fees: Optional[int] = None
         self.burn_tx_hash: Optional[str] = None
-        self.attestation: Optional[Message] = None
\ No newline at end of file
+        self.attestation: Optional[Message] = None
+
+        # chain_id -> snapshot read before any transaction of the flow is sent
+        self.chain_snapshots: dict[int, ChainSnapshot] = {}
+
+    async def get_chain_snapshot(self, chain_id: int) -> ChainSnapshot:
+        if chain_id not in self.chain_snapshots:
+            web3_instance = self.web3_source if chain_id == self.from_chain_id else self.web3_destination
+            self.chain_snapshots[chain_id] = await ChainStateReader.read(web3_instance=web3_instance, chain_id=chain_id, chain_config=self.remote_config[chain_id])
+        return self.chain_snapshots[chain_id]
+
+    async def get_signed_payload(self, payload_type: TxType) -> bytes | None:
+        """
+        Signed payload of a step, served from the payloads loaded with the session the first time
+        each step asks. Later lookups (e.g. a retried step that signed since) go to the contract.
+        """
+        if payload_type in self._unchecked_payload_types:
+            self._unchecked_payload_types.discard(payload_type)
+            return self.signed_payloads.get(payload_type)
+        return await self.rebalancer_contract.get_signed_payload(payload_type)
@@ -1,8 +1,5 @@
 import binascii
 import sys
-import ast
-import base64
-import json
 
 from web3 import Web3
 from typing import Any, Dict, Optional
@@ -10,6 +7,8 @@ from near_omni_client.networks import Network
 from near_omni_client.chain_signatures.utils import get_evm_address
 from near_omni_client.chain_signatures.kdf import Kdf
 
+import near_codec
+
 
 def parse_chain_config(response: Any) -> dict:
     """
@@ -23,13 +22,7 @@ def parse_chain_config(response: Any) -> dict:
     Raises:
         ValueError: If the response format is invalid or decoding fails.
     """
-    if not hasattr(response, "result") or not isinstance(response.result, list):
-        raise ValueError("Invalid response format: missing `result` as list[int]")
-
-    try:
-        return json.loads(bytes(response.result).decode("utf-8"))
-    except Exception as e:
-        raise ValueError(f"Failed to decode result: {e}")
+    return near_codec.decode_result(response, near_codec.Json, "chain config")
 
 def parse_chain_configs(response: Any) -> Dict[str, dict]:
     """
@@ -44,19 +37,7 @@ def parse_chain_configs(response: Any) -> Dict[str, dict]:
     Raises:
         ValueError: If the response format is invalid or parsing fails.
     """
-    if not hasattr(response, "result") or not isinstance(response.result, list):
-        raise ValueError("Invalid response: expected .result to be list[int]")
-
-    try:
-        raw = bytes(response.result).decode("utf-8")
-        parsed = json.loads(raw)
-
-        if not isinstance(parsed, list):
-            raise ValueError("Expected a list of [chain_id, config] pairs")
-
-        return {chain_id: config for chain_id, config in parsed}
-    except Exception as e:
-        raise ValueError(f"Failed to parse configs: {e}")
+    return {chain_id: config for chain_id, config in near_codec.decode_result(response, near_codec.CHAIN_CONFIGS, "configs")}
     
 def parse_u32_result(response) -> int:
     """
@@ -71,13 +52,7 @@ def parse_u32_result(response) -> int:
     Raises:
         ValueError: If the response format is invalid or decoding fails.
     """
-    if not hasattr(response, "result") or not isinstance(response.result, list):
-        raise ValueError("Invalid response format")
-
-    try:
-        return int(bytes(response.result).decode("utf-8"))
-    except Exception as e:
-        raise ValueError(f"Failed to parse u32 from result: {e}")
+    return near_codec.decode_result(response, near_codec.U32)
     
 def parse_chain_balances(response: Any) -> Dict[str, int]:
     """
@@ -89,19 +64,7 @@ def parse_chain_balances(response: Any) -> Dict[str, int]:
     Returns:
         Dict[str, int]: Mapping of `chain_id` → balance u128 (int in Python)
     """
-    if not hasattr(response, "result") or not isinstance(response.result, list):
-        raise ValueError("Invalid response: missing `.result` as list[int]")
-
-    try:
-        decoded = bytes(response.result).decode("utf-8")
-        parsed = json.loads(decoded)
-
-        if not isinstance(parsed, list):
-            raise ValueError("Expected a list of [chain_id, u128_string] pairs")
-
-        return {chain_id: int(balance_str) for chain_id, balance_str in parsed}
-    except Exception as e:
-        raise ValueError(f"Failed to parse Vec<(ChainId, u128)>: {e}")
+    return {chain_id: balance for chain_id, balance in near_codec.decode_result(response, near_codec.CHAIN_BALANCES, "chain balances")}
     
 def to_usdc_units(value: float) -> int:
     return int(value * 1_000_000)  # USDC has 6 decimal places
@@ -135,20 +98,10 @@ def address_to_bytes32(addr: str) -> bytes:
     return addr_bytes.rjust(32, b'\x00')
 
 def extract_signed_rlp_without_prefix(success_value_b64: str) -> bytes:
-    raw = base64.b64decode(success_value_b64)
-
-    int_list = ast.literal_eval(raw.decode("utf-8"))
-
-    payload_bytes = bytes(int_list)
-
-    return payload_bytes
+    return near_codec.decode_success_value(success_value_b64)
 
 def extract_signed_rlp(success_value_b64: str) -> bytes:
-    raw = base64.b64decode(success_value_b64)
-
-    int_list = ast.literal_eval(raw.decode("utf-8"))
-
-    payload_bytes = bytes(int_list)
+    payload_bytes = near_codec.decode_success_value(success_value_b64)
 
     # Remove the first byte (the 0x01 prefix)
     signed_rlp = payload_bytes[1:]
@@ -191,18 +144,7 @@ def parse_supported_chains(response: Any) -> list[int]:
     Raises:
         ValueError: If the response format is invalid or parsing fails.
     """
-    if not hasattr(response, "result") or not isinstance(response.result, list):
-        raise ValueError("Invalid response: expected .result to be list[int]")
-
-    try:
-        raw = bytes(response.result).decode("utf-8")
-        parsed = json.loads(raw)
-
-        if not isinstance(parsed, list):
-            raise ValueError("Expected a list of chain IDs")
-        return parsed
-    except Exception as e:
-        raise ValueError(f"Failed to parse supported chains: {e}")
+    return near_codec.decode_result(response, near_codec.SUPPORTED_CHAINS, "supported chains")
 
 def parse_activity_log(response: Any) -> Dict:
     """
@@ -226,33 +168,16 @@ def parse_activity_log(response: Any) -> Dict:
         transactions: List[List[int]]
       }
     """
-    if not hasattr(response, "result") or not isinstance(response.result, list):
-        raise ValueError("Invalid response: missing .result as list[int]")
-
-    try:
-        raw = bytes(response.result).decode("utf-8")
-        parsed = json.loads(raw)
-    except Exception as e:
-        raise ValueError(f"Failed to decode activity log: {e}")
-
-    if not isinstance(parsed, dict):
-        raise ValueError("Invalid activity log format")
-
-    return {
-        "activity_type": parsed["activity_type"],
-        "source_chain": int(parsed["source_chain"]),
-        "destination_chain": int(parsed["destination_chain"]),
-        "timestamp": int(parsed["timestamp"]),
-        "nonce": int(parsed["nonce"]),
-        "usdc_agent_balance_before_in_source_chain": int(parsed["usdc_agent_balance_before_in_source_chain"]),  # u128 string → int
-        "usdc_agent_balance_before_in_dest_chain": int(parsed["usdc_agent_balance_before_in_dest_chain"]),  # u128 string → int
-        "a_usdc_agent_balance_before_in_source_chain": int(parsed["a_usdc_agent_balance_before_in_source_chain"]),  # u128 string → int
-        "a_usdc_agent_balance_before_in_dest_chain": int(parsed["a_usdc_agent_balance_before_in_dest_chain"]),  # u128 string → int
-        "amount": int(parsed["amount"]),  # u128 string → int
-        "transactions": [
-            bytes(tx) for tx in parsed.get("transactions", [])
-        ],
-    }
+    return near_codec.decode_result(response, near_codec.ACTIVITY_LOG, "activity log")
+
+def parse_activity_logs(response: Any) -> list[Dict]:
+    """
+    Parse get_latest_logs response, a list of activity logs (see `parse_activity_log`), newest first.
+
+    Rust return:
+      Vec<ActivityLog>
+    """
+    return near_codec.decode_result(response, near_codec.ACTIVITY_LOGS, "activity logs")
 
 def parse_worker_info(response: Any) -> Optional[Dict[str, str]]:
     """
@@ -268,35 +193,7 @@ def parse_worker_info(response: Any) -> Optional[Dict[str, str]]:
         "codehash": "str"
       }
     """
-    # NEAR view calls typically return bytes as list[int] under `response.result`.
-    if not hasattr(response, "result") or not isinstance(response.result, list):
-        raise ValueError("Invalid response format: missing `result` as list[int]")
-
-    try:
-        raw = bytes(response.result).decode("utf-8")
-        parsed = json.loads(raw)
-    except Exception as e:
-        raise ValueError(f"Failed to decode worker info: {e}")
-
-    # `Option<T>` maps to `null` when None.
-    if parsed is None:
-        return None
-
-    if not isinstance(parsed, dict):
-        raise ValueError("Invalid worker info format: expected dict or null")
-
-    # Validate required fields.
-    if "checksum" not in parsed or "codehash" not in parsed:
-        raise ValueError("Invalid worker info: missing required fields")
-
-    if not isinstance(parsed["checksum"], str) or not isinstance(parsed["codehash"], str):
-        raise ValueError("Invalid worker info: fields must be strings")
-
-    return {
-        "checksum": parsed["checksum"],
-        "codehash": parsed["codehash"],
-    }
-
+    return near_codec.decode_result(response, near_codec.WORKER_INFO, "worker info")
 
 def parse_bool(response: Any) -> bool:
     """
@@ -309,20 +206,8 @@ def parse_bool(response: Any) -> bool:
       true
       false
     """
-    # NEAR view calls typically return bytes as list[int] under `response.result`.
-    if not hasattr(response, "result") or not isinstance(response.result, list):
-        raise ValueError("Invalid response format: missing `result` as list[int]")
-
-    try:
-        raw = bytes(response.result).decode("utf-8")
-        parsed = json.loads(raw)
-    except Exception as e:
-        raise ValueError(f"Failed to decode boolean result: {e}")
-
-    if not isinstance(parsed, bool):
-        raise ValueError(f"Invalid boolean format: expected bool, got {type(parsed)}")
+    return near_codec.decode_result(response, near_codec.Bool)
 
-    return parsed
 
 if __name__ == "__main__":
     if len(sys.argv) != 4:
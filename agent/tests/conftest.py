@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+
+def _make_market(n, seed=0):
+    rng = np.random.default_rng(seed)
+    total_supply = rng.uniform(1e12, 1e14, n)
+    total_borrow = total_supply * rng.uniform(0.3, 0.9, n)
+    total_funds = 1e12
+    return {
+        "totalAssetsUnderManagement": total_funds,
+        "chains": [
+            {
+                "chainId": i,
+                "currentAllocation": allocation,
+                "currentInterestRate": rate,
+                "supplyElasticity": elasticity,
+                "totalSupply": supply,
+                "totalBorrow": borrow,
+            }
+            for i, (allocation, rate, elasticity, supply, borrow) in enumerate(zip(
+                rng.dirichlet(np.ones(n)) * total_funds,
+                rng.uniform(1, 8, n),
+                rng.uniform(0.01, 0.2, n),
+                total_supply,
+                total_borrow,
+            ))
+        ],
+    }
+
+
+def _average_rate(data, allocations):
+    total_funds = data["totalAssetsUnderManagement"]
+    result = 0.0
+    for chain in data["chains"]:
+        amount = allocations[chain["chainId"]]
+        new_supply = chain["totalSupply"] + amount - chain["currentAllocation"]
+        utilization_change = chain["totalBorrow"] / new_supply * 100 - chain["totalBorrow"] / chain["totalSupply"] * 100
+        rate = max(0.0, chain["currentInterestRate"] + chain["supplyElasticity"] * utilization_change)
+        result += amount / total_funds * rate
+    return result
+
+
+@pytest.fixture
+def make_market():
+    """Random market of `n` chains in the optimizer input format, reproducible per `seed`."""
+    return _make_market
+
+
+@pytest.fixture
+def average_rate():
+    """Weighted supply rate of an allocation under the linear model, to compare solutions."""
+    return _average_rate
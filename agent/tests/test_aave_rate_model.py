@@ -0,0 +1,116 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from config import OPTIMIZER_RATE_MODELS
+from optimizer import optimize_chain_allocation_with_direction
+from optimizer.optimizer import RATE_MODELS
+from optimizer.aave_rate_model import AaveRateParams, supply_rate, supply_rates_for_allocations
+
+USDC = 10**6
+
+# USDC-like strategy: 0% base, 6.5% up to 92% usage, then +60% to full usage, 10% reserve factor
+STRATEGY = {"optimalUsageRatio": 0.92, "baseVariableBorrowRate": 0.0, "variableRateSlope1": 0.065, "variableRateSlope2": 0.6, "reserveFactor": 0.1}
+
+
+def modeled_rate(usage):
+    """Supply APR (%) of the STRATEGY curve at `usage`, what the chain reports as its current rate."""
+    params = AaveRateParams.from_chains([{"chainId": 0, "interestRateStrategy": STRATEGY}])
+    return float(supply_rate([1.0], [usage], params)[0])
+
+
+def make_market(usages, supplies, allocations, rates=None):
+    rates = rates or [modeled_rate(usage) for usage in usages]
+    return {
+        "totalAssetsUnderManagement": sum(allocations),
+        "chains": [
+            {
+                "chainId": i,
+                "currentAllocation": allocation,
+                "currentInterestRate": rate,
+                "supplyElasticity": 0.0,
+                "totalSupply": supply,
+                "totalBorrow": supply * usage,
+                "interestRateStrategy": STRATEGY,
+            }
+            for i, (usage, supply, allocation, rate) in enumerate(zip(usages, supplies, allocations, rates))
+        ],
+    }
+
+
+def test_supply_rate_follows_the_kinked_curve():
+    params = AaveRateParams.from_chains([{"chainId": 0, "interestRateStrategy": STRATEGY}])
+    supply = np.array([[100.0], [100.0], [100.0]])
+    borrow = np.array([[46.0], [92.0], [96.0]])
+
+    rates = supply_rate(supply, borrow, params)[:, 0]
+
+    # borrow rate 3.25%, 6.5% and 6.5% + 60% * 0.5; supply rate = borrow rate * usage * (1 - reserve factor)
+    assert rates == pytest.approx([3.25 * 0.46 * 0.9, 6.5 * 0.92 * 0.9, 36.5 * 0.96 * 0.9])
+
+
+def test_grid_matches_brute_force_across_the_kink():
+    # chain 0 sits above the kink: adding funds there first earns slope2, then falls back to slope1
+    data = make_market(usages=[0.97, 0.80, 0.50], supplies=[20e6 * USDC, 50e6 * USDC, 80e6 * USDC], allocations=[2e6 * USDC, 2e6 * USDC, 2e6 * USDC])
+    chains = data["chains"]
+    params = AaveRateParams.from_chains(chains)
+    current = np.array([chain["currentAllocation"] for chain in chains])
+    supply = np.array([chain["totalSupply"] for chain in chains])
+    borrow = np.array([chain["totalBorrow"] for chain in chains])
+    total = data["totalAssetsUnderManagement"]
+
+    def yearly(allocations):
+        return float(np.sum(allocations * supply_rates_for_allocations(allocations, current, supply, borrow, params)))
+
+    result = optimize_chain_allocation_with_direction(data, rate_model="aave")
+    allocations = np.array([result["allocations"][i] for i in range(3)], dtype=float)
+
+    steps = 60
+    brute_force = max(
+        yearly(np.array([i, j, steps - i - j]) * total / steps)
+        for i, j in itertools.product(range(steps + 1), repeat=2) if i + j <= steps
+    )
+
+    assert result["solver"] == "grid"
+    assert allocations.sum() == pytest.approx(total, rel=1e-9)
+    assert yearly(allocations) >= brute_force * (1 - 1e-9)
+
+
+def test_unchanged_market_keeps_the_current_allocation():
+    data = make_market(usages=[0.8, 0.8], supplies=[50e6 * USDC, 50e6 * USDC], allocations=[1e6 * USDC, 1e6 * USDC])
+
+    result = optimize_chain_allocation_with_direction(data, rate_model="aave")
+
+    assert result["allocations"] == {0: 1e6 * USDC, 1: 1e6 * USDC}
+
+
+def test_curve_is_anchored_to_the_current_rate():
+    data = make_market(usages=[0.8, 0.5], supplies=[50e6 * USDC, 50e6 * USDC], allocations=[1e6 * USDC, 1e6 * USDC], rates=[7.0, 0.5])
+    chains = data["chains"]
+    current = [chain["currentAllocation"] for chain in chains]
+
+    rates = supply_rates_for_allocations(current, current, [chain["totalSupply"] for chain in chains], [chain["totalBorrow"] for chain in chains], AaveRateParams.from_chains(chains))
+
+    assert rates == pytest.approx([7.0, 0.5])
+
+
+def test_overridden_rates_move_the_funds():
+    def allocations(rates):
+        data = make_market(usages=[0.8, 0.8], supplies=[50e6 * USDC, 50e6 * USDC], allocations=[1e6 * USDC, 1e6 * USDC], rates=rates)
+        return optimize_chain_allocation_with_direction(data, rate_model="aave")["allocations"]
+
+    assert allocations([50.0, 1.0]) == {0: 2e6 * USDC, 1: 0}
+    assert allocations([1.0, 50.0]) == {0: 0, 1: 2e6 * USDC}
+
+
+def test_aave_model_needs_the_strategy_parameters():
+    data = make_market(usages=[0.8], supplies=[50e6 * USDC], allocations=[1e6 * USDC])
+    del data["chains"][0]["interestRateStrategy"]
+
+    with pytest.raises(ValueError):
+        optimize_chain_allocation_with_direction(data, rate_model="aave")
+
+
+def test_config_validates_the_same_rate_models():
+    assert OPTIMIZER_RATE_MODELS == RATE_MODELS
@@ -0,0 +1,160 @@
+import asyncio
+
+import pytest
+
+from engine_types import Flow, TxType
+from engine.activity_log_indexer import ActivityLogIndexer, FLOW_SIGNED_STEPS
+
+BASE = 8453
+ARBITRUM = 42161
+
+
+class StubContract:
+    """Serves `get_latest_logs` pages (newest first) and the active session, counting the page sizes asked."""
+
+    def __init__(self):
+        self.logs: list[dict] = []
+        self.active_nonce = None
+        self.counts: list[int] = []
+
+    def add_log(self, steps: list[TxType], destination_chain: int = ARBITRUM, amount: int = 1_000_000) -> dict:
+        log = {
+            "activity_type": "rebalance",
+            "source_chain": BASE,
+            "destination_chain": destination_chain,
+            "timestamp": 1_700_000_000_000,
+            "nonce": len(self.logs),
+            "usdc_agent_balance_before_in_source_chain": 0,
+            "usdc_agent_balance_before_in_dest_chain": 0,
+            "a_usdc_agent_balance_before_in_source_chain": 0,
+            "a_usdc_agent_balance_before_in_dest_chain": 0,
+            "amount": amount,
+            "transactions": [bytes([step.as_u8, 2, 248]) for step in steps],
+        }
+        self.logs.append(log)
+        return log
+
+    async def get_latest_logs(self, count: int):
+        self.counts.append(count)
+        return list(reversed(self.logs[-count:]))
+
+    async def get_active_session_info(self):
+        return None if self.active_nonce is None else {"nonce": self.active_nonce}
+
+
+@pytest.fixture
+def contract():
+    return StubContract()
+
+
+@pytest.fixture
+def indexer(contract, tmp_path):
+    indexer = ActivityLogIndexer(contract, path=str(tmp_path / "activity_logs.sqlite3"), page_size=2, max_page_size=8)
+    yield indexer
+    indexer.close()
+
+
+def sync(indexer) -> int:
+    return asyncio.run(indexer.sync())
+
+
+def rows(indexer) -> dict[int, tuple]:
+    return {nonce: (closed, closed_seen_at_ms, complete) for nonce, closed, closed_seen_at_ms, complete in indexer._db.execute(
+        "SELECT nonce, closed, closed_seen_at_ms, complete FROM activity_logs"
+    )}
+
+
+def test_resume_nonce_is_the_first_open_log_or_the_next_one(contract, indexer):
+    assert indexer._resume_nonce() == 0
+
+    for _ in range(3):
+        contract.add_log(FLOW_SIGNED_STEPS[Flow.AaveToAave])
+    contract.active_nonce = 1
+    sync(indexer)
+    assert indexer._resume_nonce() == 1
+
+    contract.active_nonce = None
+    sync(indexer)
+    assert indexer._resume_nonce() == 3
+
+
+def test_open_log_is_synced_again_until_it_closes(contract, indexer):
+    contract.add_log(FLOW_SIGNED_STEPS[Flow.AaveToAave])
+    contract.add_log([TxType.AaveWithdraw])
+    contract.active_nonce = 1
+    sync(indexer)
+
+    assert rows(indexer)[1] == (0, None, 0)
+
+    # the session signs its remaining steps and completes
+    contract.logs[1]["transactions"] = [bytes([step.as_u8]) for step in FLOW_SIGNED_STEPS[Flow.AaveToAave]]
+    contract.active_nonce = None
+
+    assert sync(indexer) == 1
+    closed, closed_seen_at_ms, complete = rows(indexer)[1]
+    assert (closed, complete) == (1, 1)
+    assert closed_seen_at_ms is not None
+
+
+def test_close_time_is_only_known_for_logs_seen_after_the_first_sync(contract, indexer):
+    contract.add_log(FLOW_SIGNED_STEPS[Flow.AaveToAave])
+    sync(indexer)
+    contract.add_log(FLOW_SIGNED_STEPS[Flow.AaveToAave])
+    sync(indexer)
+
+    # already closed when the index was created: no duration
+    assert rows(indexer)[0][1] is None
+    # created and closed between two syncs
+    assert rows(indexer)[1][1] is not None
+    assert list(indexer.session_durations()) == [1]
+
+
+def test_complete_needs_every_signed_step_of_the_flow(contract, indexer):
+    contract.add_log(FLOW_SIGNED_STEPS[Flow.RebalancerToAave])
+    contract.add_log([TxType.RebalancerWithdrawToAllocate, TxType.CCTPBurn])
+    contract.add_log([TxType.AaveWithdraw])  # flow unknown
+    sync(indexer)
+
+    assert [complete for _, _, complete in rows(indexer).values()] == [1, 0, 0]
+
+
+def test_failure_rates_per_route(contract, indexer):
+    contract.add_log(FLOW_SIGNED_STEPS[Flow.AaveToAave])
+    contract.add_log([TxType.AaveWithdraw, TxType.CCTPBurn])
+    contract.add_log(FLOW_SIGNED_STEPS[Flow.AaveToRebalancer], destination_chain=BASE)
+    contract.add_log([TxType.AaveWithdraw], destination_chain=BASE)
+    contract.active_nonce = 3  # open sessions are not counted yet
+    sync(indexer)
+
+    assert indexer.failure_rates() == {(BASE, ARBITRUM): 0.5, (BASE, BASE): 0.0}
+
+
+def test_page_doubling_stops_at_the_max_page_size(contract, indexer):
+    for _ in range(20):
+        contract.add_log(FLOW_SIGNED_STEPS[Flow.AaveToAave])
+
+    assert sync(indexer) == 8
+    assert contract.counts == [2, 4, 8]
+    assert indexer._resume_nonce() == 20
+
+    contract.add_log(FLOW_SIGNED_STEPS[Flow.AaveToAave])
+    contract.counts.clear()
+
+    assert sync(indexer) == 1
+    assert contract.counts == [2]
+
+
+def test_open_log_out_of_the_page_is_closed(contract, indexer):
+    contract.add_log([TxType.AaveWithdraw])
+    contract.active_nonce = 0
+    sync(indexer)
+
+    for _ in range(20):
+        contract.add_log(FLOW_SIGNED_STEPS[Flow.AaveToAave])
+    contract.active_nonce = None
+    sync(indexer)
+
+    closed, closed_seen_at_ms, complete = rows(indexer)[0]
+    assert (closed, complete) == (1, 0)
+    assert closed_seen_at_ms is not None
+    assert indexer._resume_nonce() == 21
@@ -0,0 +1,91 @@
+import pytest
+
+import helpers  # noqa: F401  # @dev helpers before adapters, as in main
+from adapters.calldata import U256_MAX, Calldata
+
+# @dev inputs of the contract encoder and `tx_builders.rs` tests, expected calldata laid out
+# word by word from the Solidity signatures, independently of the ABIs used by `Calldata`
+TOKEN = "0x7d2768de84f9a91b2c744cf0f0865d2e4b30f4bf"
+ASSET = "0xeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeee"
+USER = "0x1234567890123456789012345678901234567890"
+AGENT = "0x87870Bca3F3fD6335C3F4ce8392D69350B4fA4E2"
+AGENT_BYTES32 = "0x" + "00" * 12 + AGENT[2:]
+
+ZERO = "00" * 32
+
+
+def calldata(selector: str, *words: str) -> bytes:
+    return bytes.fromhex(selector + "".join(words))
+
+
+def word(value: int | str) -> str:
+    if isinstance(value, str):
+        return value[2:].lower().rjust(64, "0")
+    return f"{value:064x}"
+
+
+@pytest.mark.parametrize("spender, amount, expected", [
+    # approve(address,uint256)
+    (TOKEN, 10_000, calldata("095ea7b3", word(TOKEN), word(0x2710))),
+    (TOKEN, U256_MAX, calldata("095ea7b3", word(TOKEN), "f" * 64)),
+])
+def test_approve(spender, amount, expected):
+    assert Calldata.approve(spender, amount) == expected
+
+
+def test_aave_supply():
+    # supply(address,uint256,address,uint16), 1e18 to `USER`
+    expected = calldata("617ba037", word(ASSET), "0000000000000000000000000000000000000000000000000de0b6b3a7640000", word(USER), ZERO)
+
+    assert Calldata.aave_supply(ASSET, 10**18, USER, 0) == expected
+
+
+def test_aave_withdraw():
+    # withdraw(address,uint256,address), 5e17 to `USER`
+    expected = calldata("69328dec", word(ASSET), "00000000000000000000000000000000000000000000000006f05b59d3b20000", word(USER))
+
+    assert Calldata.aave_withdraw(ASSET, 5 * 10**17, USER) == expected
+
+
+@pytest.mark.parametrize("mint_recipient", [AGENT_BYTES32, bytes.fromhex(AGENT_BYTES32[2:])])
+def test_deposit_for_burn(mint_recipient):
+    # depositForBurn(uint256,uint32,bytes32,address,bytes32,uint256,uint32)
+    expected = calldata(
+        "8e0250ee",
+        word(1000),
+        word(100),
+        word(AGENT_BYTES32),
+        word(AGENT),
+        word(AGENT_BYTES32),
+        word(0),
+        word(0),
+    )
+
+    assert Calldata.deposit_for_burn(1000, 100, mint_recipient, AGENT, AGENT_BYTES32, 0, 0) == expected
+
+
+def test_receive_message():
+    # receiveMessage(bytes,bytes): two offsets, then each length and its zero-padded bytes
+    expected = calldata(
+        "57ecfd28",
+        word(0x40),
+        word(0x80),
+        word(len(b"example message")),
+        "6578616d706c65206d657373616765".ljust(64, "0"),
+        word(len(b"example attestation")),
+        "6578616d706c65206174746573746174696f6e".ljust(64, "0"),
+    )
+
+    assert Calldata.receive_message(b"example message", "0x" + b"example attestation".hex()) == expected
+
+
+def test_withdraw_for_cross_chain_allocation():
+    # withdrawForCrossChainAllocation(uint256,uint256)
+    assert Calldata.withdraw_for_cross_chain_allocation(1_000_000, 2_000_000) == calldata("a8a6a077", word(0xF4240), word(0x1E8480))
+    assert Calldata.withdraw_for_cross_chain_allocation(1234, None) == calldata("a8a6a077", word(1234), ZERO)
+
+
+def test_return_funds():
+    # returnFunds(uint256,uint256)
+    assert Calldata.return_funds(500_000, 3_000_000) == calldata("37cd2f7e", word(0x7A120), word(0x2DC6C0))
+    assert Calldata.return_funds(1234, None) == calldata("37cd2f7e", word(1234), ZERO)
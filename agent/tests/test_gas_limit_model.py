@@ -0,0 +1,134 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+from near_omni_client.networks import Network
+
+from helpers import GasEstimator, GasLimitModel, MetadataStore
+
+CHAIN_ID = 8453
+POOL = "0xA238Dd80C259a72e81d7e4664a9801593F98d1c5"
+SUPPLY_CALLDATA = bytes.fromhex("617ba037") + bytes(128)
+TX_HASH = "0x" + "ab" * 32
+
+
+class StubWeb3:
+    """Only `eth.estimate_gas`, returning `estimate` and counting the calls."""
+
+    def __init__(self, estimate: int):
+        self.estimate = estimate
+        self.calls = 0
+
+        async def estimate_gas(tx):
+            self.calls += 1
+            return self.estimate
+
+        self.eth = SimpleNamespace(estimate_gas=estimate_gas)
+
+
+class StubFactory:
+    def __init__(self, web3):
+        self.web3 = web3
+
+    def get_provider(self, network):
+        return self.web3
+
+
+@pytest.fixture(autouse=True)
+def reset_gas_limit_model(monkeypatch):
+    monkeypatch.setattr(GasLimitModel, "path", None)
+    monkeypatch.setattr(GasLimitModel, "_samples", {})
+    monkeypatch.setattr(GasLimitModel, "_pending", {})
+    monkeypatch.setitem(MetadataStore._chain_ids, Network.BASE_MAINNET.value, CHAIN_ID)
+
+
+def observe(key, gas_used, status=1, tx_hash=TX_HASH):
+    GasLimitModel.track(tx_hash, key)
+    GasLimitModel.observe_receipt(tx_hash, {"status": status, "gasUsed": gas_used})
+
+
+def test_key_is_chain_contract_and_selector():
+    key = GasLimitModel.key(CHAIN_ID, POOL.lower(), SUPPLY_CALLDATA)
+
+    assert key == f"{CHAIN_ID}:{POOL}:617ba037"
+    assert GasLimitModel.key(CHAIN_ID, None, "0x617ba037") == f"{CHAIN_ID}:create:617ba037"
+
+
+def test_suggest_needs_min_samples_then_returns_percentile_plus_buffer():
+    key = GasLimitModel.key(CHAIN_ID, POOL, SUPPLY_CALLDATA)
+
+    observe(key, 100_000)
+    observe(key, 120_000)
+    assert GasLimitModel.suggest(key) is None
+
+    observe(key, 110_000)
+    assert GasLimitModel.suggest(key) == int(120_000 * 1.1)
+
+
+def test_only_the_last_samples_are_kept(monkeypatch):
+    monkeypatch.setattr(GasLimitModel, "max_samples", 3)
+    key = GasLimitModel.key(CHAIN_ID, POOL, SUPPLY_CALLDATA)
+
+    for gas_used in (500_000, 100_000, 100_000, 100_000):
+        observe(key, gas_used)
+
+    assert GasLimitModel.suggest(key) == int(100_000 * 1.1)
+
+
+def test_revert_drops_the_learned_limit():
+    key = GasLimitModel.key(CHAIN_ID, POOL, SUPPLY_CALLDATA)
+    for _ in range(3):
+        observe(key, 100_000)
+
+    observe(key, 100_000, status=0)
+
+    assert GasLimitModel.suggest(key) is None
+
+
+def test_untracked_receipts_are_ignored():
+    GasLimitModel.observe_receipt(TX_HASH, {"status": 1, "gasUsed": 100_000})
+
+    assert GasLimitModel._samples == {}
+
+
+def test_samples_survive_a_reload(tmp_path):
+    path = str(tmp_path / "gas_limits.json")
+    GasLimitModel.load(path=path)
+    key = GasLimitModel.key(CHAIN_ID, POOL, SUPPLY_CALLDATA)
+    for _ in range(3):
+        observe(key, 100_000)
+
+    GasLimitModel.load(path=path)
+
+    with open(path) as f:
+        assert json.load(f)["samples"] == {key: [100_000] * 3}
+    assert GasLimitModel.suggest(key) == int(100_000 * 1.1)
+
+
+def test_estimator_serves_the_learned_limit_and_validates_periodically():
+    web3 = StubWeb3(estimate=150_000)
+    estimator = GasEstimator(StubFactory(web3), fee_oracle=object(), validate_every=3)
+    key = GasLimitModel.key(CHAIN_ID, POOL, SUPPLY_CALLDATA)
+    for _ in range(3):
+        observe(key, 100_000)
+
+    def estimate():
+        return asyncio.run(estimator.estimate_gas_limit(Network.BASE_MAINNET, POOL, POOL, SUPPLY_CALLDATA))
+
+    assert [estimate(), estimate()] == [110_000, 110_000]
+    assert web3.calls == 0
+
+    # every third use is simulated, and the simulation wins when it needs more gas
+    assert estimate() == int(150_000 * 1.2)
+    assert web3.calls == 1
+
+
+def test_estimator_simulates_unknown_actions():
+    web3 = StubWeb3(estimate=150_000)
+    estimator = GasEstimator(StubFactory(web3), fee_oracle=object())
+
+    gas_limit = asyncio.run(estimator.estimate_gas_limit(Network.BASE_MAINNET, POOL, POOL, SUPPLY_CALLDATA))
+
+    assert gas_limit == int(150_000 * 1.2)
+    assert web3.calls == 1
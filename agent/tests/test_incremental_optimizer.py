@@ -0,0 +1,53 @@
+import copy
+
+from optimizer import IncrementalOptimizer, optimize_chain_allocation_with_direction
+
+
+def scaled(data, key, factor):
+    data = copy.deepcopy(data)
+    for chain in data["chains"]:
+        chain[key] *= factor
+    return data
+
+
+def test_first_run_solves_and_small_moves_reuse_the_optimum(make_market):
+    optimizer = IncrementalOptimizer(sensitivity=0.001)
+    data = make_market(5, seed=1)
+
+    first = optimizer.optimize(data)
+    assert optimizer.last_decision.resolved
+    assert optimizer.last_decision.reason == "no previous solution"
+
+    second = optimizer.optimize(scaled(data, "totalBorrow", 1.0005))
+    assert not optimizer.last_decision.resolved
+    assert optimizer.last_decision.max_change < 0.001
+    assert second["allocations"] == first["allocations"]
+
+
+def test_moves_past_the_bound_solve_again_from_the_last_optimum(make_market):
+    optimizer = IncrementalOptimizer(sensitivity=0.001)
+    data = make_market(20, seed=2)
+    optimizer.optimize(data)
+
+    moved = scaled(data, "totalBorrow", 1.01)
+    warm = optimizer.optimize(moved)
+    cold = optimize_chain_allocation_with_direction(moved)
+
+    assert optimizer.last_decision.resolved
+    assert optimizer.last_decision.changed_input.endswith(".totalBorrow")
+    assert warm["optimalityCertificate"]["isOptimal"]
+    assert warm["optimalityCertificate"]["iterations"] <= cold["optimalityCertificate"]["iterations"]
+
+
+def test_drift_is_measured_from_the_last_solve(make_market):
+    optimizer = IncrementalOptimizer(sensitivity=0.001)
+    data = make_market(3, seed=3)
+    optimizer.optimize(data)
+
+    # three runs of +0.04% each: the third one is past the bound relative to the solved inputs
+    decisions = []
+    for step in range(1, 4):
+        optimizer.optimize(scaled(data, "totalSupply", 1 + 0.0004 * step))
+        decisions.append(optimizer.last_decision.resolved)
+
+    assert decisions == [False, False, True]
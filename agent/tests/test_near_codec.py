@@ -0,0 +1,99 @@
+import base64
+import json
+from types import SimpleNamespace
+
+import pytest
+
+import near_codec
+from engine_types import Flow, TxType
+
+
+def view_response(value):
+    """A view call response as returned by the NEAR provider: the JSON value as `.result: list[int]`."""
+    return SimpleNamespace(result=list(json.dumps(value).encode()))
+
+
+def activity_log(**overrides):
+    log = {
+        "activity_type": "rebalance",
+        "source_chain": 8453,
+        "destination_chain": 42161,
+        "timestamp": 1_700_000_000_000_000_000,
+        "nonce": 3,
+        "usdc_agent_balance_before_in_source_chain": "1000000",
+        "usdc_agent_balance_before_in_dest_chain": "0",
+        "a_usdc_agent_balance_before_in_source_chain": "0",
+        "a_usdc_agent_balance_before_in_dest_chain": "2000000",
+        "amount": "500000",
+        "transactions": [[2, 248, 1], []],
+    }
+    return {**log, **overrides}
+
+
+def test_unsigned_accepts_numbers_and_numeric_strings():
+    assert near_codec.U128(str(2**128 - 1), "amount") == 2**128 - 1
+    assert near_codec.U64(8453, "chain") == 8453
+
+
+@pytest.mark.parametrize("value, message", [
+    (-1, "out of range for u32"),
+    (2**32, "out of range for u32"),
+    ("12a", "expected u32"),
+    (True, "expected u32, got bool"),
+    (1.5, "expected u32, got float"),
+])
+def test_unsigned_rejects_invalid_values(value, message):
+    with pytest.raises(ValueError, match=message):
+        near_codec.U32(value, "result")
+
+
+def test_chain_configs_and_balances():
+    configs = near_codec.decode_result(view_response([[8453, {"aave": {"referral_code": 0}}]]), near_codec.CHAIN_CONFIGS)
+    balances = near_codec.decode_result(view_response([[8453, "340282366920938463463374607431768211455"]]), near_codec.CHAIN_BALANCES)
+
+    assert configs == [(8453, {"aave": {"referral_code": 0}})]
+    assert balances == [(8453, 2**128 - 1)]
+
+
+def test_active_session_info_decodes_enums():
+    response = view_response([7, "AaveToAave", "CCTPBurn", None])
+
+    assert near_codec.decode_result(response, near_codec.ACTIVE_SESSION_INFO) == (7, Flow.AaveToAave, TxType.CCTPBurn, None)
+    assert near_codec.decode_result(view_response(None), near_codec.ACTIVE_SESSION_INFO) is None
+
+
+def test_activity_log_decodes_amounts_and_payloads():
+    log = near_codec.decode_result(view_response(activity_log()), near_codec.ACTIVITY_LOG)
+
+    assert log["amount"] == 500_000
+    assert log["usdc_agent_balance_before_in_source_chain"] == 1_000_000
+    assert log["transactions"] == [bytes([2, 248, 1]), b""]
+
+
+def test_errors_name_the_offending_field():
+    with pytest.raises(ValueError, match=r"activity logs\[1\]\.transactions\[0\]: invalid byte vector"):
+        near_codec.decode_result(view_response([activity_log(), activity_log(transactions=[[256]])]), near_codec.ACTIVITY_LOGS, "activity logs")
+
+    with pytest.raises(ValueError, match=r"missing field\(s\) \['amount'\]"):
+        log = activity_log()
+        del log["amount"]
+        near_codec.decode_result(view_response(log), near_codec.ACTIVITY_LOG)
+
+    with pytest.raises(ValueError, match=r"result\[2\]: 'Unknown' is not a valid TxType"):
+        near_codec.decode_result(view_response([7, "AaveToAave", "Unknown", None]), near_codec.ACTIVE_SESSION_INFO)
+
+
+def test_malformed_responses():
+    with pytest.raises(ValueError, match="missing `result`"):
+        near_codec.decode_result(SimpleNamespace(result=None), near_codec.U32)
+
+    with pytest.raises(ValueError, match="Failed to decode configs"):
+        near_codec.decode_result(SimpleNamespace(result=list(b"[1,")), near_codec.CHAIN_CONFIGS, "configs")
+
+
+def test_success_value_is_a_byte_vector_by_default():
+    payload = bytes([2, 248, 113, 130])
+    success_value = base64.b64encode(json.dumps(list(payload)).encode()).decode()
+
+    assert near_codec.decode_success_value(success_value) == payload
+    assert near_codec.decode_success_value(base64.b64encode(b"null").decode(), near_codec.SIGNED_PAYLOAD) is None
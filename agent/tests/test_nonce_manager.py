@@ -0,0 +1,144 @@
+import asyncio
+import base64
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from helpers import EVMTransaction, NonceManager
+from helpers.evm_transaction import get_empty_tx_for_chain
+from adapters import RebalancerContract
+
+CHAIN_ID = 8453
+AGENT = "0x000000000000000000000000000000000000dEaD"
+
+
+class StubWeb3:
+    """Only `eth.get_transaction_count`, returning the pending count and counting the calls."""
+
+    def __init__(self, pending_count: int):
+        self.pending_count = pending_count
+        self.calls = 0
+
+        async def get_transaction_count(address, block_identifier=None):
+            self.calls += 1
+            return self.pending_count
+
+        self.eth = SimpleNamespace(get_transaction_count=get_transaction_count)
+
+
+@pytest.fixture(autouse=True)
+def reset_nonce_manager():
+    NonceManager.invalidate(CHAIN_ID)
+    NonceManager._locks.clear()
+    yield
+    NonceManager.invalidate(CHAIN_ID)
+
+
+def reserve(web3):
+    return asyncio.run(NonceManager.reserve(web3, CHAIN_ID, AGENT))
+
+
+def test_back_to_back_reservations_get_consecutive_nonces():
+    web3 = StubWeb3(pending_count=7)
+
+    assert [reserve(web3), reserve(web3), reserve(web3)] == [7, 8, 9]
+    assert web3.calls == 1
+
+
+def test_broadcast_keeps_the_local_counter():
+    web3 = StubWeb3(pending_count=7)
+
+    first, second = reserve(web3), reserve(web3)
+    NonceManager.mark_broadcast(CHAIN_ID, first)
+    NonceManager.mark_broadcast(CHAIN_ID, second)
+    web3.pending_count = 9
+
+    assert reserve(web3) == 9
+    assert web3.calls == 1
+
+
+def test_broadcast_of_a_replayed_tx_fast_forwards():
+    web3 = StubWeb3(pending_count=7)
+
+    reserve(web3)
+    NonceManager.mark_broadcast(CHAIN_ID, 12)
+
+    assert reserve(web3) == 13
+
+
+def test_released_nonce_fills_the_gap_first():
+    web3 = StubWeb3(pending_count=7)
+
+    first, second, third = reserve(web3), reserve(web3), reserve(web3)
+    NonceManager.release(CHAIN_ID, second)
+    NonceManager.mark_broadcast(CHAIN_ID, first)
+
+    assert reserve(web3) == second
+    assert reserve(web3) == third + 1
+    assert web3.calls == 1
+
+
+def test_releasing_the_latest_reservation_rewinds():
+    web3 = StubWeb3(pending_count=7)
+
+    reserve(web3)
+    NonceManager.release(CHAIN_ID, reserve(web3))
+
+    assert reserve(web3) == 8
+
+
+def test_abandoned_reservations_reconcile_with_the_chain(monkeypatch):
+    web3 = StubWeb3(pending_count=7)
+    reserve(web3)
+    reserve(web3)
+
+    # both reservations were never broadcast nor released, only nonce 7 reached the chain
+    monkeypatch.setattr(NonceManager, "reservation_timeout_seconds", 0)
+    web3.pending_count = 8
+
+    assert reserve(web3) == 8
+    assert web3.calls == 2
+
+
+def test_invalidate_rereads_the_chain():
+    web3 = StubWeb3(pending_count=7)
+    reserve(web3)
+
+    NonceManager.invalidate(CHAIN_ID)
+    web3.pending_count = 5
+
+    assert reserve(web3) == 5
+    assert web3.calls == 2
+
+
+def test_failed_signature_releases_the_nonce_for_the_retry():
+    web3 = StubWeb3(pending_count=7)
+    signed = bytes([1, 2, 248, 1])  # contract prefix byte, then the signed RLP
+    outcomes = [RuntimeError("NEAR tx timed out"), SimpleNamespace(status={"SuccessValue": base64.b64encode(json.dumps(list(signed)).encode()).decode()})]
+
+    async def sign_and_submit(**kwargs):
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    contract = RebalancerContract.__new__(RebalancerContract)
+    contract.config = SimpleNamespace(tx_tgas=300)
+    contract._sign_and_submit_transaction = sign_and_submit
+
+    def partial_tx() -> EVMTransaction:
+        tx = get_empty_tx_for_chain(CHAIN_ID)
+        tx.nonce = reserve(web3)
+        return tx
+
+    # first attempt of the step: the contract call fails after the nonce was reserved
+    first = partial_tx()
+    with pytest.raises(RuntimeError):
+        asyncio.run(contract._sign_partial_transaction(method="build_and_sign_aave_supply_tx", args={}, partial_tx=first))
+
+    # the retry signs with the same nonce, without leaving a gap
+    retry = partial_tx()
+    assert retry.nonce == first.nonce == 7
+    assert asyncio.run(contract._sign_partial_transaction(method="build_and_sign_aave_supply_tx", args={}, partial_tx=retry)) == signed[1:]
+    assert web3.calls == 1
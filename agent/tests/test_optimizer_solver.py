@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+
+from config import OPTIMIZER_SOLVERS
+from optimizer import optimize_chain_allocation_with_direction
+from optimizer.kkt_solver import solve_water_filling
+from optimizer.optimizer import SOLVERS
+
+
+def solve(data):
+    arrays = {key: np.array([chain[key] for chain in data["chains"]]) for key in data["chains"][0]}
+    return solve_water_filling(
+        data["totalAssetsUnderManagement"],
+        arrays["currentInterestRate"],
+        arrays["supplyElasticity"],
+        arrays["totalSupply"],
+        arrays["totalBorrow"],
+        arrays["currentAllocation"],
+    )
+
+
+@pytest.mark.parametrize("n", [2, 5, 20, 100])
+def test_water_filling_is_feasible_and_certified(n, make_market):
+    data = make_market(n, seed=n)
+    solution = solve(data)
+
+    assert solution.certificate.is_optimal
+    assert np.all(solution.allocations >= 0)
+    assert solution.allocations.sum() == pytest.approx(data["totalAssetsUnderManagement"], rel=1e-12)
+
+
+@pytest.mark.parametrize("n", [2, 5, 20])
+def test_water_filling_is_at_least_as_good_as_slsqp(n, make_market, average_rate):
+    data = make_market(n, seed=100 + n)
+    kkt = optimize_chain_allocation_with_direction(data, solver="kkt")
+    slsqp = optimize_chain_allocation_with_direction(data, solver="slsqp")
+
+    assert average_rate(data, kkt["allocations"]) >= average_rate(data, slsqp["allocations"]) - 1e-6
+
+
+def test_flat_chains_take_the_remainder_by_yield():
+    # no borrow: the rate does not depend on the amount supplied
+    solution = solve_water_filling(
+        100.0,
+        current_rates=np.array([3.0, 5.0]),
+        supply_elasticity=np.array([0.1, 0.1]),
+        total_supply=np.array([1_000.0, 1_000.0]),
+        total_borrow=np.array([0.0, 0.0]),
+        current_alloc=np.array([50.0, 50.0]),
+    )
+
+    assert solution.allocations.tolist() == [0.0, 100.0]
+    assert solution.certificate.is_optimal
+
+
+def test_unknown_solver_is_rejected(make_market):
+    with pytest.raises(ValueError):
+        optimize_chain_allocation_with_direction(make_market(2), solver="newton")
+
+
+def test_config_validates_the_same_solvers():
+    assert OPTIMIZER_SOLVERS == SOLVERS
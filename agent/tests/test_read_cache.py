@@ -0,0 +1,133 @@
+import asyncio
+
+import pytest
+from web3 import AsyncHTTPProvider
+
+from helpers import BlockScopedCachingProvider
+
+POOL = "0xa238dd80c259a72e81d7e4664a9801593f98d1c5"
+CALL = {"to": POOL, "data": "0x35ea6a75"}
+
+
+class StubNode:
+    """Stands in for the HTTP transport: answers every request and records it."""
+
+    def __init__(self, block: int = 100):
+        self.block = block
+        self.requests = []
+
+    async def make_request(self, provider, method, params):
+        self.requests.append((method, params))
+        await asyncio.sleep(0)
+        if method == "eth_blockNumber":
+            return {"jsonrpc": "2.0", "id": 1, "result": hex(self.block)}
+        if method == "eth_chainId":
+            return {"jsonrpc": "2.0", "id": 1, "result": "0x2105"}
+        if method == "eth_getTransactionReceipt":
+            return {"jsonrpc": "2.0", "id": 1, "result": {"blockNumber": hex(self.block), "status": "0x1"}}
+        if method == "eth_call" and params[0]["data"] == "0xdeadbeef":
+            return {"jsonrpc": "2.0", "id": 1, "error": {"code": 3, "message": "execution reverted"}}
+        return {"jsonrpc": "2.0", "id": 1, "result": f"0x{len(self.requests):064x}"}
+
+    def calls(self, method="eth_call"):
+        return [params for requested, params in self.requests if requested == method]
+
+
+@pytest.fixture
+def node(monkeypatch):
+    node = StubNode()
+
+    async def make_request(provider, method, params):
+        return await node.make_request(provider, method, params)
+
+    monkeypatch.setattr(AsyncHTTPProvider, "make_request", make_request)
+    return node
+
+
+def make_provider(**kwargs):
+    return BlockScopedCachingProvider("http://localhost:8545", **kwargs)
+
+
+def test_repeated_calls_are_served_from_the_pinned_block(node):
+    provider = make_provider(block_ttl_seconds=60)
+
+    async def run():
+        first = await provider.make_request("eth_call", [CALL, "latest"])
+        second = await provider.make_request("eth_call", [CALL])
+        return first, second
+
+    first, second = asyncio.run(run())
+
+    assert first == second
+    assert node.calls() == [[CALL, hex(100)]]
+    assert provider.stats()["hits"] == 1 and provider.stats()["misses"] == 1
+
+
+def test_concurrent_identical_calls_are_joined(node):
+    provider = make_provider(block_ttl_seconds=60)
+
+    async def run():
+        return await asyncio.gather(*(provider.make_request("eth_call", [CALL, "latest"]) for _ in range(5)))
+
+    responses = asyncio.run(run())
+
+    assert all(response == responses[0] for response in responses)
+    assert len(node.calls()) == 1
+    assert len(node.calls("eth_blockNumber")) == 1
+
+
+def test_a_newer_receipt_moves_the_block_and_evicts_old_entries(node):
+    provider = make_provider(block_ttl_seconds=60, max_block_age=2)
+
+    async def run():
+        await provider.make_request("eth_call", [CALL, "latest"])
+        node.block = 105
+        await provider.make_request("eth_getTransactionReceipt", ["0x" + "ab" * 32])
+        await provider.make_request("eth_call", [CALL, "latest"])
+
+    asyncio.run(run())
+
+    assert node.calls() == [[CALL, hex(100)], [CALL, hex(105)]]
+    assert provider.stats()["entries"] == 1
+    assert provider.stats()["block"] == 105
+
+
+def test_expired_block_is_read_again(node):
+    provider = make_provider(block_ttl_seconds=0)
+
+    async def run():
+        await provider.make_request("eth_call", [CALL, "latest"])
+        node.block = 101
+        await provider.make_request("eth_call", [CALL, "latest"])
+
+    asyncio.run(run())
+
+    assert node.calls() == [[CALL, hex(100)], [CALL, hex(101)]]
+
+
+def test_errors_explicit_blocks_and_state_overrides_are_not_cached(node):
+    provider = make_provider(block_ttl_seconds=60)
+    reverting = {"to": POOL, "data": "0xdeadbeef"}
+
+    async def run():
+        for _ in range(2):
+            await provider.make_request("eth_call", [reverting, "latest"])
+            await provider.make_request("eth_call", [CALL, "0x10"])
+            await provider.make_request("eth_call", [CALL, "latest", {POOL: {"balance": "0x1"}}])
+
+    asyncio.run(run())
+
+    assert len(node.calls()) == 6
+    assert provider.stats()["entries"] == 0
+
+
+def test_chain_id_is_asked_once(node):
+    provider = make_provider()
+
+    async def run():
+        return [await provider.make_request("eth_chainId", []) for _ in range(3)]
+
+    responses = asyncio.run(run())
+
+    assert {response["result"] for response in responses} == {"0x2105"}
+    assert len(node.calls("eth_chainId")) == 1
@@ -0,0 +1,75 @@
+import asyncio
+from types import SimpleNamespace
+
+from near_omni_client.networks import Network
+
+import helpers.cctp_fees as cctp_fees
+from optimizer.route_cost_model import RouteCost, net_gain, select_profitable_operations
+
+USDC = 10**6
+
+
+def make_market():
+    # chain 1 pays 2%, chain 2 pays 6%; neither rate moves much with 1M USDC
+    return {
+        "totalAssetsUnderManagement": 2_000_000 * USDC,
+        "chains": [
+            {"chainId": 1, "currentAllocation": 1_000_000 * USDC, "currentInterestRate": 2.0, "supplyElasticity": 0.01, "totalSupply": 10**9 * USDC, "totalBorrow": 5 * 10**8 * USDC},
+            {"chainId": 2, "currentAllocation": 1_000_000 * USDC, "currentInterestRate": 6.0, "supplyElasticity": 0.01, "totalSupply": 10**9 * USDC, "totalBorrow": 5 * 10**8 * USDC},
+        ],
+    }
+
+
+def test_keeps_an_operation_that_pays_for_itself():
+    operations = [{"from": 1, "to": 2, "amount": 100_000 * USDC}]
+    costs = [RouteCost(bridge_fee=USDC, evm_gas=2 * USDC, near_gas=USDC)]
+
+    selected, report = select_profitable_operations(make_market(), operations, costs, holding_horizon_days=30)
+
+    # ~4% on 100k for 30 days is ~330 USDC, far above 4 USDC of costs
+    assert selected == operations
+    assert report["netGain"] == net_gain(make_market(), operations, costs, 30) > 0
+
+
+def test_drops_operations_that_do_not_pay_for_themselves():
+    operations = [
+        {"from": 1, "to": 2, "amount": 100_000 * USDC},
+        {"from": 1, "to": 2, "amount": 10 * USDC},  # earns a few cents, costs dollars
+    ]
+    costs = [RouteCost(bridge_fee=USDC, evm_gas=2 * USDC, near_gas=USDC)] * 2
+
+    selected, report = select_profitable_operations(make_market(), operations, costs, holding_horizon_days=30)
+
+    assert selected == operations[:1]
+    assert [op["selected"] for op in report["operations"]] == [True, False]
+
+
+def test_nothing_is_executed_when_costs_exceed_the_gain():
+    operations = [{"from": 1, "to": 2, "amount": 100_000 * USDC}]
+    costs = [RouteCost(bridge_fee=USDC, evm_gas=500 * USDC, near_gas=USDC)]
+
+    selected, report = select_profitable_operations(make_market(), operations, costs, holding_horizon_days=30)
+
+    assert selected == []
+    assert report["netGain"] == 0.0
+
+
+class StubFeeService:
+    """Quotes a 1 bps minimum fee for every route."""
+
+    def __init__(self, network):
+        self.network = network
+
+    def get_fees(self, destination_domain_id):
+        return SimpleNamespace(minimumFee=1)
+
+
+def test_cctp_fee_is_the_buffered_minimum_fee_capped(monkeypatch):
+    monkeypatch.setattr(cctp_fees, "FeeService", StubFeeService)
+
+    def fee(amount, max_bridge_fee):
+        return asyncio.run(cctp_fees.compute_cctp_fee(Network.BASE_MAINNET, Network.ARBITRUM_MAINNET, amount, max_bridge_fee))
+
+    # 1 bps of 1,000 USDC is 0.1 USDC, plus the 5% buffer
+    assert fee(1_000 * USDC, max_bridge_fee=USDC) == 105_000
+    assert fee(100_000 * USDC, max_bridge_fee=USDC) == USDC
@@ -0,0 +1,87 @@
+import asyncio
+
+import numpy as np
+import pytest
+
+import optimizer.scenario_engine as scenario_engine
+from optimizer import optimize_chain_allocation_with_direction
+from optimizer.scenario_engine import ScenarioEngine, ShockModel
+
+
+def test_without_shocks_every_scenario_is_the_point_estimate(make_market, average_rate):
+    data = make_market(5, seed=1)
+    result = optimize_chain_allocation_with_direction(data)
+    engine = ScenarioEngine(n_scenarios=50, shocks=ShockModel(supply_volatility=0, borrow_volatility=0, rate_volatility=0), seed=0)
+    candidate = np.array([[result["allocations"][chain["chainId"]] for chain in data["chains"]]])
+
+    yields = engine.evaluate(data, candidate, engine.sample(data))
+
+    expected = average_rate(data, result["allocations"]) * data["totalAssetsUnderManagement"] / 100
+    assert yields.shape == (1, 50)
+    assert yields == pytest.approx(np.full((1, 50), expected), rel=1e-9)
+
+
+@pytest.mark.parametrize("objective", ["mean", "quantile"])
+def test_selection_is_at_least_as_good_as_the_point_optimum(objective, make_market):
+    data = make_market(5, seed=2)
+    result = optimize_chain_allocation_with_direction(data)
+
+    selection = ScenarioEngine(objective=objective, seed=0).select(data, result["allocations"])
+
+    assert sum(selection["allocations"].values()) == round(data["totalAssetsUnderManagement"])
+    if objective == "mean":
+        assert selection["expectedYield"] >= selection["pointOptimumExpectedYield"]
+    else:
+        assert selection["downsideYield"] >= selection["pointOptimumDownsideYield"]
+
+
+def test_process_pool_matches_a_single_process(monkeypatch, make_market):
+    data = make_market(3, seed=3)
+    engine = ScenarioEngine(n_scenarios=200, max_workers=2, seed=0)
+    scenarios = engine.sample(data)
+    candidates = np.array([[chain["currentAllocation"] for chain in data["chains"]]] * 4)
+
+    single = engine.evaluate(data, candidates, scenarios)
+    monkeypatch.setattr(scenario_engine, "PARALLEL_MIN_ELEMENTS", 0)
+    pooled = engine.evaluate(data, candidates, scenarios)
+
+    assert pooled == pytest.approx(single)
+
+
+def test_async_selection_matches_the_synchronous_one(make_market):
+    data = make_market(4, seed=4)
+    result = optimize_chain_allocation_with_direction(data)
+
+    selection = ScenarioEngine(n_scenarios=200, seed=0).select(data, result["allocations"])
+    async_selection = asyncio.run(ScenarioEngine(n_scenarios=200, seed=0).select_async(data, result["allocations"]))
+
+    assert async_selection["allocations"] == selection["allocations"]
+    assert async_selection["expectedYield"] == pytest.approx(selection["expectedYield"])
+
+
+def test_async_evaluation_awaits_the_process_pool(monkeypatch, make_market):
+    data = make_market(3, seed=3)
+    engine = ScenarioEngine(n_scenarios=200, max_workers=2, seed=0)
+    scenarios = engine.sample(data)
+    candidates = np.array([[chain["currentAllocation"] for chain in data["chains"]]] * 4)
+
+    single = engine.evaluate(data, candidates, scenarios)
+    monkeypatch.setattr(scenario_engine, "PARALLEL_MIN_ELEMENTS", 0)
+    pooled = asyncio.run(engine.evaluate_async(data, candidates, scenarios))
+
+    assert pooled == pytest.approx(single)
+
+
+def test_last_selection_is_kept_and_rescaled(make_market):
+    data = make_market(4, seed=5)
+    result = optimize_chain_allocation_with_direction(data)
+    engine = ScenarioEngine(n_scenarios=200, seed=0)
+
+    selection = engine.select(data, result["allocations"])
+    total_funds = int(data["totalAssetsUnderManagement"])
+    reused = engine.rescaled_last_selection(total_funds * 2)
+
+    assert engine.last_selection is selection
+    assert reused["reused"]
+    assert sum(reused["allocations"].values()) == total_funds * 2
+    assert reused["allocations"] == pytest.approx({chain_id: amount * 2 for chain_id, amount in selection["allocations"].items()}, abs=2)